@@ -2,13 +2,14 @@
 核心模块 - 算法学习平台的核心组件
 """
 
-from .algorithm_base import AlgorithmBase
+from .algorithm_base import AlgorithmBase, Step
 from .data_structures import DataStructureBase
 from .visualizer import Visualizer
 from .algorithm_manager import AlgorithmManager
 
 __all__ = [
     'AlgorithmBase',
+    'Step',
     'DataStructureBase', 
     'Visualizer',
     'AlgorithmManager'
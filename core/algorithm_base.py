@@ -2,14 +2,27 @@
 算法基类 - 定义所有算法的通用接口
 """
 
+import copy
 import time
 import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from enum import Enum
 
 from utils.logger import Logger
 
+try:
+    import psutil
+    # 进程句柄只创建一次，避免每次测量都重新打开 /proc
+    _PROCESS = psutil.Process()
+except ImportError:
+    _PROCESS = None
+
+# 模块级共享的日志记录器，避免每个实例重复初始化
+_logger = Logger()
+
 class AlgorithmType(Enum):
     """算法类型枚举"""
     SORTING = "sorting"
@@ -30,6 +43,50 @@ class AlgorithmComplexity(Enum):
     O_2_N = "O(2ⁿ)"
     O_N_FACTORIAL = "O(n!)"
 
+@dataclass(slots=True, frozen=True)
+class Step:
+    """执行步骤记录
+    
+    使用 __slots__ 的不可变记录代替每步一个字典；同时支持 step['description']
+    和 step.get('description') 形式的访问，兼容按字典读取步骤的代码。
+    """
+    step: int
+    description: Any
+    data_state: Any = None
+    comparisons: int = 0
+    swaps: int = 0
+    indices_changed: Optional[Sequence[int]] = None
+    new_values: Optional[Sequence[Any]] = None
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+class _NullLock:
+    """空锁：单线程场景下替代真实的锁，避免每次操作的加锁开销"""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args):
+        return False
+
+def _complexity_property(attr: str) -> property:
+    """复杂度字段的属性：赋值时使缓存的复杂度信息失效"""
+    def getter(self):
+        return getattr(self, attr)
+    
+    def setter(self, value):
+        setattr(self, attr, value)
+        self._complexity_info = None
+    
+    return property(getter, setter)
+
 class AlgorithmBase(ABC):
     """算法基类
     
@@ -42,11 +99,33 @@ class AlgorithmBase(ABC):
     在学习过程中，可以继承此类来实现具体的算法。
     """
     
-    def __init__(self, name: str, algorithm_type: AlgorithmType):
-        """初始化算法基类"""
+    # 固定实例属性，省去每个实例的 __dict__ 并加快属性访问
+    __slots__ = (
+        'name', 'algorithm_type', 'logger',
+        'execution_time', 'memory_usage', 'comparison_count', 'swap_count',
+        '_time_complexity', '_space_complexity', '_best_case', '_worst_case', '_average_case',
+        '_complexity_info',
+        'is_running', 'execution_steps', '_materialized_steps', 'current_step', 'lock'
+    )
+    
+    # 复杂度信息几乎只在初始化时设置，get_complexity_info 的结果据此缓存
+    time_complexity = _complexity_property('_time_complexity')
+    space_complexity = _complexity_property('_space_complexity')
+    best_case = _complexity_property('_best_case')
+    worst_case = _complexity_property('_worst_case')
+    average_case = _complexity_property('_average_case')
+    
+    def __init__(self, name: str, algorithm_type: AlgorithmType, thread_safe: bool = False):
+        """初始化算法基类
+        
+        Args:
+            name: 算法名称
+            algorithm_type: 算法类型
+            thread_safe: 是否在多线程环境中使用，为 False 时不加锁
+        """
         self.name = name
         self.algorithm_type = algorithm_type
-        self.logger = Logger()
+        self.logger = _logger
         
         # 性能统计
         self.execution_time = 0.0
@@ -55,6 +134,7 @@ class AlgorithmBase(ABC):
         self.swap_count = 0
         
         # 复杂度信息
+        self._complexity_info = None
         self.time_complexity = AlgorithmComplexity.O_N
         self.space_complexity = AlgorithmComplexity.O_1
         self.best_case = AlgorithmComplexity.O_N
@@ -63,11 +143,12 @@ class AlgorithmBase(ABC):
         
         # 执行状态
         self.is_running = False
-        self.execution_steps = []
+        self.execution_steps = deque()
+        self._materialized_steps = None
         self.current_step = 0
         
-        # 线程安全
-        self.lock = threading.RLock()
+        # 线程安全（仅在需要时使用真实的锁；各方法均不重入，使用普通锁即可）
+        self.lock = threading.Lock() if thread_safe else _NullLock()
         
         self.logger.info(f"算法 '{name}' 初始化完成")
     
@@ -87,16 +168,24 @@ class AlgorithmBase(ABC):
     def reset_stats(self):
         """重置性能统计"""
         with self.lock:
-            self.execution_time = 0.0
-            self.memory_usage = 0
-            self.comparison_count = 0
-            self.swap_count = 0
-            self.execution_steps = []
-            self.current_step = 0
+            self._reset_stats()
+    
+    def _reset_stats(self):
+        """重置性能统计（调用方需已持有锁）"""
+        self.execution_time = 0.0
+        self.memory_usage = 0
+        self.comparison_count = 0
+        self.swap_count = 0
+        self.execution_steps = deque()
+        self._materialized_steps = None
+        self.current_step = 0
     
     def measure_performance(self, data: Any, **kwargs) -> Dict[str, Any]:
         """测量算法性能
         
+        锁只在重置和汇总统计时持有；execute 期间不持锁，
+        因为其中的 add_step 会自行加锁，而锁不可重入。
+        
         Args:
             data: 输入数据
             **kwargs: 额外参数
@@ -105,79 +194,132 @@ class AlgorithmBase(ABC):
             性能统计信息
         """
         with self.lock:
-            self.reset_stats()
+            self._reset_stats()
             self.is_running = True
-            
+        
+        try:
             # 记录开始时间和内存使用
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             start_memory = self._get_memory_usage()
             
-            try:
-                # 执行算法
-                result = self.execute(data, **kwargs)
-                
-                # 记录结束时间和内存使用
-                end_time = time.time()
-                end_memory = self._get_memory_usage()
-                
-                self.execution_time = end_time - start_time
+            # 执行算法
+            result = self.execute(data, **kwargs)
+            
+            # 记录结束时间和内存使用
+            end_time = time.perf_counter_ns()
+            end_memory = self._get_memory_usage()
+            
+            with self.lock:
+                self.execution_time = (end_time - start_time) * 1e-9
                 self.memory_usage = end_memory - start_memory
                 
-                self.logger.info(f"算法 '{self.name}' 执行完成，耗时: {self.execution_time:.4f}秒")
-                
-                return {
+                performance = {
                     'result': result,
                     'execution_time': self.execution_time,
                     'memory_usage': self.memory_usage,
                     'comparison_count': self.comparison_count,
                     'swap_count': self.swap_count,
-                    'steps_count': len(self.execution_steps)
+                    'steps_count': self.step_count()
                 }
-                
-            finally:
-                self.is_running = False
+            
+            self.logger.info(f"算法 '{self.name}' 执行完成，耗时: {self.execution_time:.4f}秒")
+            return performance
+            
+        finally:
+            self.is_running = False
     
-    def add_step(self, step_description: str, data_state: Any = None):
+    def add_step(self, step_description: str, data_state: Any = None,
+                 indices_changed: Optional[Sequence[int]] = None,
+                 new_values: Optional[Sequence[Any]] = None,
+                 snapshot: bool = False):
         """添加执行步骤（用于可视化）
         
+        步骤只记录增量：完整的数据状态只需在开始时提供一次，之后的步骤
+        通过 indices_changed/new_values 描述变化，在 get_execution_steps
+        中按需回放还原每一步的完整状态。
+        
         Args:
             step_description: 步骤描述
-            data_state: 当前数据状态
+            data_state: 当前完整数据状态，作为后续增量步骤的基准
+            indices_changed: 本步骤中发生变化的位置，空序列表示状态未变
+            new_values: 与 indices_changed 一一对应的新值
+            snapshot: 为 True 时复制 data_state，避免之后被原地修改影响
         """
         with self.lock:
-            step = {
-                'step': self.current_step,
-                'description': step_description,
-                'data_state': data_state,
-                'comparisons': self.comparison_count,
-                'swaps': self.swap_count
-            }
-            self.execution_steps.append(step)
+            if snapshot and data_state is not None:
+                data_state = copy.copy(data_state)
+            self.execution_steps.append(Step(
+                self.current_step,
+                step_description,
+                data_state,
+                self.comparison_count,
+                self.swap_count,
+                indices_changed,
+                new_values
+            ))
             self.current_step += 1
+            self._materialized_steps = None
     
     def get_complexity_info(self) -> Dict[str, str]:
-        """获取算法复杂度信息"""
-        return {
-            'time_complexity': self.time_complexity.value,
-            'space_complexity': self.space_complexity.value,
-            'best_case': self.best_case.value,
-            'worst_case': self.worst_case.value,
-            'average_case': self.average_case.value
-        }
-    
-    def get_execution_steps(self) -> List[Dict[str, Any]]:
-        """获取执行步骤（用于可视化）"""
+        """获取算法复杂度信息
+        
+        结果会被缓存并在多次调用间共享，调用方不应修改返回的字典。
+        """
+        if self._complexity_info is None:
+            self._complexity_info = {
+                'time_complexity': self.time_complexity.value,
+                'space_complexity': self.space_complexity.value,
+                'best_case': self.best_case.value,
+                'worst_case': self.worst_case.value,
+                'average_case': self.average_case.value
+            }
+        return self._complexity_info
+    
+    def get_execution_steps(self) -> Tuple[Step, ...]:
+        """获取执行步骤（用于可视化）
+        
+        按记录顺序回放增量，为每个步骤还原完整的 data_state。回放结果会被
+        缓存为不可变元组，直到再次添加步骤，重复读取不会产生拷贝。
+        """
         with self.lock:
-            return self.execution_steps.copy()
+            return self._materialize_steps()
+    
+    def step_at(self, index: int) -> Step:
+        """获取指定位置的执行步骤，便于可视化逐步读取
+        
+        Args:
+            index: 步骤下标
+            
+        Returns:
+            该步骤的记录
+        """
+        with self.lock:
+            return self._materialize_steps()[index]
+    
+    def step_count(self) -> int:
+        """获取已记录的执行步骤数量"""
+        return len(self.execution_steps)
+    
+    def _materialize_steps(self) -> Tuple[Step, ...]:
+        """回放增量得到完整步骤（调用方需已持有锁）"""
+        if self._materialized_steps is None:
+            steps = []
+            state = None
+            for step in self.execution_steps:
+                if step.data_state is not None:
+                    # 完整状态：作为后续增量的回放基准
+                    state = copy.copy(step.data_state)
+                elif step.indices_changed is not None and state is not None:
+                    for index, value in zip(step.indices_changed, step.new_values or ()):
+                        state[index] = value
+                    step = replace(step, data_state=copy.copy(state))
+                steps.append(step)
+            self._materialized_steps = tuple(steps)
+        return self._materialized_steps
     
     def _get_memory_usage(self) -> int:
         """获取当前内存使用量（简化实现）"""
-        try:
-            import psutil
-            process = psutil.Process()
-            return process.memory_info().rss
-        except ImportError:
-            return 0
+        return _PROCESS.memory_info().rss if _PROCESS is not None else 0
     
     def __str__(self) -> str:
         return f"{self.name} ({self.algorithm_type.value})"
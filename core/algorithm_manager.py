@@ -3,13 +3,20 @@
 """
 
 import threading
-from typing import Dict, List, Optional, Any
-from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 
-from .algorithm_base import AlgorithmBase, AlgorithmType
+from .algorithm_base import AlgorithmBase, AlgorithmType, _NullLock
 from .data_structures import DataStructureBase, DataStructureType
 from utils.logger import Logger
 
+# 模块级共享的日志记录器，避免每个实例重复初始化
+_logger = Logger()
+
+# 按类型分桶时使用枚举的定义顺序作为数组下标。tuple.index 通过身份比较在 C 层
+# 完成定位，避免字典查找时调用 Python 层实现的 Enum.__hash__
+_ALGORITHM_TYPES = tuple(AlgorithmType)
+_DATA_STRUCTURE_TYPES = tuple(DataStructureType)
+
 class AlgorithmManager:
     """算法管理器
     
@@ -22,23 +29,44 @@ class AlgorithmManager:
     在学习过程中，可以通过此类来组织和访问各种算法。
     """
     
-    def __init__(self):
-        """初始化算法管理器"""
-        self.logger = Logger()
+    def __init__(self, thread_safe: bool = False):
+        """初始化算法管理器
+        
+        Args:
+            thread_safe: 是否在多线程环境中使用，为 False 时不加锁
+        """
+        self.logger = _logger
         
         # 算法存储
         self.algorithms: Dict[str, AlgorithmBase] = {}
-        self.algorithms_by_type: Dict[AlgorithmType, List[AlgorithmBase]] = defaultdict(list)
+        self._algorithms_by_type: List[List[AlgorithmBase]] = [[] for _ in _ALGORITHM_TYPES]
+        # 按类型查询结果的只读快照，注册时失效
+        self._algorithms_by_type_frozen: List[Optional[Tuple[AlgorithmBase, ...]]] = [None] * len(_ALGORITHM_TYPES)
         
         # 数据结构存储
         self.data_structures: Dict[str, DataStructureBase] = {}
-        self.data_structures_by_type: Dict[DataStructureType, List[DataStructureBase]] = defaultdict(list)
+        self._data_structures_by_type: List[List[DataStructureBase]] = [[] for _ in _DATA_STRUCTURE_TYPES]
+        # 按类型查询结果的只读快照，注册时失效
+        self._data_structures_by_type_frozen: List[Optional[Tuple[DataStructureBase, ...]]] = [None] * len(_DATA_STRUCTURE_TYPES)
         
-        # 线程安全
-        self.lock = threading.RLock()
+        # 统计信息缓存，注册新的算法或数据结构时失效
+        self._statistics: Optional[Dict[str, Any]] = None
+        
+        # 线程安全（仅在需要时使用真实的锁；各方法均不重入，使用普通锁即可）
+        self.lock = threading.Lock() if thread_safe else _NullLock()
         
         self.logger.info("算法管理器初始化完成")
     
+    @property
+    def algorithms_by_type(self) -> Dict[AlgorithmType, List[AlgorithmBase]]:
+        """按类型分组的算法，包含每一种类型，尚未注册算法的类型对应空列表"""
+        return dict(zip(_ALGORITHM_TYPES, self._algorithms_by_type))
+    
+    @property
+    def data_structures_by_type(self) -> Dict[DataStructureType, List[DataStructureBase]]:
+        """按类型分组的数据结构，包含每一种类型，尚未注册数据结构的类型对应空列表"""
+        return dict(zip(_DATA_STRUCTURE_TYPES, self._data_structures_by_type))
+    
     def initialize(self):
         """初始化所有算法和数据结构"""
         self.logger.info("正在初始化算法和数据结构...")
@@ -59,7 +87,10 @@ class AlgorithmManager:
         """
         with self.lock:
             self.algorithms[algorithm.name] = algorithm
-            self.algorithms_by_type[algorithm.algorithm_type].append(algorithm)
+            ordinal = _ALGORITHM_TYPES.index(algorithm.algorithm_type)
+            self._algorithms_by_type[ordinal].append(algorithm)
+            self._algorithms_by_type_frozen[ordinal] = None
+            self._statistics = None
             self.logger.info(f"注册算法: {algorithm.name}")
     
     def register_data_structure(self, data_structure: DataStructureBase):
@@ -70,9 +101,48 @@ class AlgorithmManager:
         """
         with self.lock:
             self.data_structures[data_structure.name] = data_structure
-            self.data_structures_by_type[data_structure.data_type].append(data_structure)
+            ordinal = _DATA_STRUCTURE_TYPES.index(data_structure.data_type)
+            self._data_structures_by_type[ordinal].append(data_structure)
+            self._data_structures_by_type_frozen[ordinal] = None
+            self._statistics = None
             self.logger.info(f"注册数据结构: {data_structure.name}")
     
+    def register_algorithms(self, algorithms: Iterable[AlgorithmBase]):
+        """批量注册算法
+        
+        只加锁一次并输出一条日志，适合初始化时注册大量算法。
+        
+        Args:
+            algorithms: 要注册的算法实例
+        """
+        algorithms = list(algorithms)
+        with self.lock:
+            for algorithm in algorithms:
+                self.algorithms[algorithm.name] = algorithm
+                ordinal = _ALGORITHM_TYPES.index(algorithm.algorithm_type)
+                self._algorithms_by_type[ordinal].append(algorithm)
+                self._algorithms_by_type_frozen[ordinal] = None
+            self._statistics = None
+        self.logger.info(f"批量注册 {len(algorithms)} 个算法")
+    
+    def register_data_structures(self, data_structures: Iterable[DataStructureBase]):
+        """批量注册数据结构
+        
+        只加锁一次并输出一条日志，适合初始化时注册大量数据结构。
+        
+        Args:
+            data_structures: 要注册的数据结构实例
+        """
+        data_structures = list(data_structures)
+        with self.lock:
+            for data_structure in data_structures:
+                self.data_structures[data_structure.name] = data_structure
+                ordinal = _DATA_STRUCTURE_TYPES.index(data_structure.data_type)
+                self._data_structures_by_type[ordinal].append(data_structure)
+                self._data_structures_by_type_frozen[ordinal] = None
+            self._statistics = None
+        self.logger.info(f"批量注册 {len(data_structures)} 个数据结构")
+    
     def get_algorithm(self, name: str) -> Optional[AlgorithmBase]:
         """根据名称获取算法
         
@@ -82,8 +152,8 @@ class AlgorithmManager:
         Returns:
             算法实例，如果未找到返回None
         """
-        with self.lock:
-            return self.algorithms.get(name)
+        # 字典读取在 CPython 中是原子操作，读多写少的查询无需加锁
+        return self.algorithms.get(name)
     
     def get_data_structure(self, name: str) -> Optional[DataStructureBase]:
         """根据名称获取数据结构
@@ -94,32 +164,46 @@ class AlgorithmManager:
         Returns:
             数据结构实例，如果未找到返回None
         """
-        with self.lock:
-            return self.data_structures.get(name)
+        # 字典读取在 CPython 中是原子操作，读多写少的查询无需加锁
+        return self.data_structures.get(name)
     
-    def get_algorithms_by_type(self, algorithm_type: AlgorithmType) -> List[AlgorithmBase]:
+    def get_algorithms_by_type(self, algorithm_type: AlgorithmType) -> Tuple[AlgorithmBase, ...]:
         """根据类型获取算法列表
         
+        返回只读元组快照，仅在注册新算法后重新构建。
+        
         Args:
             algorithm_type: 算法类型
             
         Returns:
-            该类型的所有算法列表
+            该类型的所有算法
         """
-        with self.lock:
-            return self.algorithms_by_type[algorithm_type].copy()
+        ordinal = _ALGORITHM_TYPES.index(algorithm_type)
+        frozen = self._algorithms_by_type_frozen[ordinal]
+        if frozen is None:
+            with self.lock:
+                frozen = tuple(self._algorithms_by_type[ordinal])
+                self._algorithms_by_type_frozen[ordinal] = frozen
+        return frozen
     
-    def get_data_structures_by_type(self, data_type: DataStructureType) -> List[DataStructureBase]:
+    def get_data_structures_by_type(self, data_type: DataStructureType) -> Tuple[DataStructureBase, ...]:
         """根据类型获取数据结构列表
         
+        返回只读元组快照，仅在注册新数据结构后重新构建。
+        
         Args:
             data_type: 数据结构类型
             
         Returns:
-            该类型的所有数据结构列表
+            该类型的所有数据结构
         """
-        with self.lock:
-            return self.data_structures_by_type[data_type].copy()
+        ordinal = _DATA_STRUCTURE_TYPES.index(data_type)
+        frozen = self._data_structures_by_type_frozen[ordinal]
+        if frozen is None:
+            with self.lock:
+                frozen = tuple(self._data_structures_by_type[ordinal])
+                self._data_structures_by_type_frozen[ordinal] = frozen
+        return frozen
     
     def get_all_algorithms(self) -> List[AlgorithmBase]:
         """获取所有算法列表"""
@@ -167,10 +251,7 @@ class AlgorithmManager:
             按类型分组的算法名称字典
         """
         with self.lock:
-            categories = {}
-            for algorithm_type, algorithms in self.algorithms_by_type.items():
-                categories[algorithm_type.value] = [alg.name for alg in algorithms]
-            return categories
+            return self._algorithm_categories()
     
     def get_data_structure_categories(self) -> Dict[str, List[str]]:
         """获取数据结构分类信息
@@ -179,35 +260,60 @@ class AlgorithmManager:
             按类型分组的数据结构名称字典
         """
         with self.lock:
-            categories = {}
-            for data_type, data_structures in self.data_structures_by_type.items():
+            return self._data_structure_categories()
+    
+    def _algorithm_categories(self) -> Dict[str, List[str]]:
+        """构建算法分类信息（调用方需已持有锁）"""
+        categories = {}
+        for algorithm_type, algorithms in zip(_ALGORITHM_TYPES, self._algorithms_by_type):
+            if algorithms:
+                categories[algorithm_type.value] = [alg.name for alg in algorithms]
+        return categories
+    
+    def _data_structure_categories(self) -> Dict[str, List[str]]:
+        """构建数据结构分类信息（调用方需已持有锁）"""
+        categories = {}
+        for data_type, data_structures in zip(_DATA_STRUCTURE_TYPES, self._data_structures_by_type):
+            if data_structures:
                 categories[data_type.value] = [ds.name for ds in data_structures]
-            return categories
+        return categories
     
     def _register_data_structures(self):
         """注册所有数据结构"""
         # TODO: 在这里注册所有数据结构
-        # 例如：
+        # 例如（先构建列表，再一次性批量注册）：
         # from data_structures.array import Array
-        # self.register_data_structure(Array("动态数组"))
+        # data_structures = [Array("动态数组")]
+        # self.register_data_structures(data_structures)
         pass
     
     def _register_algorithms(self):
         """注册所有算法"""
         # TODO: 在这里注册所有算法
-        # 例如：
+        # 例如（先构建列表，再一次性批量注册）：
         # from sorting.basic_sorting import BubbleSort
-        # self.register_algorithm(BubbleSort())
+        # algorithms = [BubbleSort()]
+        # self.register_algorithms(algorithms)
         pass
     
     def get_statistics(self) -> Dict[str, Any]:
-        """获取管理器统计信息"""
-        with self.lock:
-            return {
-                'total_algorithms': len(self.algorithms),
-                'total_data_structures': len(self.data_structures),
-                'algorithm_types': len(self.algorithms_by_type),
-                'data_structure_types': len(self.data_structures_by_type),
-                'algorithm_categories': self.get_algorithm_categories(),
-                'data_structure_categories': self.get_data_structure_categories()
-            } 
\ No newline at end of file
+        """获取管理器统计信息
+        
+        结果会被缓存到下一次注册为止，调用方不应修改返回的字典。
+        """
+        statistics = self._statistics
+        if statistics is None:
+            with self.lock:
+                algorithm_categories = self._algorithm_categories()
+                data_structure_categories = self._data_structure_categories()
+                statistics = {
+                    'total_algorithms': len(self.algorithms),
+                    'total_data_structures': len(self.data_structures),
+                    # 只统计已注册了条目的类型
+                    'algorithm_types': len(algorithm_categories),
+                    'data_structure_types': len(data_structure_categories),
+                    'algorithm_categories': algorithm_categories,
+                    'data_structure_categories': data_structure_categories
+                }
+                self._statistics = statistics
+        return statistics
\ No newline at end of file
@@ -2,11 +2,16 @@
 数据结构基类 - 定义基本数据结构的通用接口
 """
 
+import threading
 from abc import ABC, abstractmethod
 from typing import Any, List, Optional, Iterator
 from enum import Enum
 
 from utils.logger import Logger
+from .algorithm_base import _NullLock
+
+# 模块级共享的日志记录器，避免每个实例重复初始化
+_logger = Logger()
 
 class DataStructureType(Enum):
     """数据结构类型枚举"""
@@ -31,11 +36,24 @@ class DataStructureBase(ABC):
     在学习过程中，可以继承此类来实现具体的数据结构。
     """
     
-    def __init__(self, name: str, data_type: DataStructureType):
-        """初始化数据结构基类"""
+    # 固定实例属性，省去每个实例的 __dict__ 并加快属性访问
+    __slots__ = (
+        'name', 'data_type', 'logger',
+        'operation_count', 'access_count', 'modification_count',
+        'size', 'is_empty', 'lock'
+    )
+    
+    def __init__(self, name: str, data_type: DataStructureType, thread_safe: bool = False):
+        """初始化数据结构基类
+        
+        Args:
+            name: 数据结构名称
+            data_type: 数据结构类型
+            thread_safe: 是否在多线程环境中使用，为 False 时不加锁
+        """
         self.name = name
         self.data_type = data_type
-        self.logger = Logger()
+        self.logger = _logger
         
         # 操作统计
         self.operation_count = 0
@@ -46,6 +64,9 @@ class DataStructureBase(ABC):
         self.size = 0
         self.is_empty = True
         
+        # 线程安全（仅在需要时使用真实的锁；各方法均不重入，使用普通锁即可）
+        self.lock = threading.Lock() if thread_safe else _NullLock()
+        
         self.logger.info(f"数据结构 '{name}' 初始化完成")
     
     @abstractmethod
@@ -17,6 +17,9 @@ class Visualizer(ABC):
     在学习过程中，可以继承此类来实现具体的可视化功能。
     """
     
+    # 固定实例属性，省去每个实例的 __dict__ 并加快属性访问
+    __slots__ = ('is_playing', 'current_step', 'total_steps', 'animation_speed')
+    
     def __init__(self):
         """初始化可视化引擎"""
         self.is_playing = False
@@ -17,11 +17,11 @@
 
 from .array import Array
 from .linked_list import LinkedList, Node
-from .stack import Stack
+from .stack import Stack, FastStack, ThreadSafeStack
 from .queue import Queue
 from .tree import BinaryTree, TreeNode
 from .graph import Graph
-from .heap import MinHeap, MaxHeap
+from .heap import MinHeap, MaxHeap, NumericMinHeap
 from .hash_table import HashTable
 
 __all__ = [
@@ -29,11 +29,14 @@ __all__ = [
     'LinkedList', 
     'Node',
     'Stack',
+    'FastStack',
+    'ThreadSafeStack',
     'Queue', 
     'BinaryTree',
     'TreeNode',
     'Graph',
     'MinHeap',
     'MaxHeap',
+    'NumericMinHeap',
     'HashTable'
 ] 
\ No newline at end of file
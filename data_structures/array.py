@@ -5,10 +5,52 @@
 本实现支持动态扩容、插入、删除、搜索等基本操作。
 """
 
+import bisect
+import logging
 import sys
-from typing import Any, List, Optional, Iterator
+from numbers import Number
+from typing import Any, Iterable, List, Optional, Iterator
+
+import numpy as np
+
 from core.data_structures import DataStructureBase, DataStructureType
 
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    # numba 为可选依赖，未安装时使用 numpy 切片实现
+    _HAS_NUMBA = False
+
+# 可以交给编译内核处理的 dtype 类别：有符号整数、无符号整数、浮点数
+_NUMERIC_KINDS = 'iuf'
+
+
+def _search_kernel(data, size: int, item) -> int:
+    """线性扫描内核，返回第一个等于 item 的位置，未找到返回 -1"""
+    for i in range(size):
+        if data[i] == item:
+            return i
+    return -1
+
+
+def _shift_right(data, pos: int, size: int):
+    """将 [pos, size) 的元素整体右移一位"""
+    for i in range(size, pos, -1):
+        data[i] = data[i - 1]
+
+
+def _shift_left(data, pos: int, size: int):
+    """将 (pos, size) 的元素整体左移一位，覆盖 pos 处的元素"""
+    for i in range(pos, size - 1):
+        data[i] = data[i + 1]
+
+
+if _HAS_NUMBA:
+    _search_kernel = njit(cache=True, nogil=True)(_search_kernel)
+    _shift_right = njit(cache=True, nogil=True)(_shift_right)
+    _shift_left = njit(cache=True, nogil=True)(_shift_left)
+
 
 class Array(DataStructureBase):
     """数组数据结构实现
@@ -17,19 +59,25 @@ class Array(DataStructureBase):
     - 随机访问 O(1)
     - 动态扩容
     - 支持插入、删除、搜索
-    - 内存连续存储
+    - 内存连续存储（底层为 numpy.ndarray）
     """
     
-    def __init__(self, initial_capacity: int = 10):
+    __slots__ = ('capacity', 'data', 'is_sorted')
+    
+    def __init__(self, initial_capacity: int = 10, dtype: Any = object):
         """初始化数组
         
         Args:
             initial_capacity: 初始容量
+            dtype: 元素类型，默认 object 可存放任意元素；
+                   数值数据可使用 np.int64 / np.float64 获得更紧凑的存储
         """
         super().__init__("Array", DataStructureType.ARRAY)
         self.capacity = initial_capacity
-        self.data = [None] * initial_capacity
+        self.data = np.empty(initial_capacity, dtype=dtype)
         self.size = 0
+        # 由使用者在确认数据有序后设置；插入、更新等可能破坏顺序的操作会将其重置
+        self.is_sorted = False
         
     def insert(self, item: Any, position: Optional[int] = None) -> bool:
         """插入元素
@@ -48,27 +96,73 @@ class Array(DataStructureBase):
             if position < 0 or position > self.size:
                 self.logger.error(f"插入位置 {position} 超出范围")
                 return False
+            
+            # 先转换元素类型：转换失败时数组尚未移动，内容保持不变
+            value = self._to_element(item)
                 
             # 检查是否需要扩容
             if self.size >= self.capacity:
                 self._resize(self.capacity * 2)
                 
-            # 移动元素为插入腾出空间
-            for i in range(self.size, position, -1):
-                self.data[i] = self.data[i-1]
+            # 移动元素为插入腾出空间（一次切片赋值完成整体右移）
+            if self._use_kernels():
+                _shift_right(self.data, position, self.size)
+            else:
+                self.data[position + 1:self.size + 1] = self.data[position:self.size]
                 
-            self.data[position] = item
+            self.data[position] = value
             self.size += 1
+            self.is_sorted = False
             self.operation_count += 1
             self.modification_count += 1
             
-            self.logger.info(f"在位置 {position} 插入元素 {item}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"在位置 {position} 插入元素 {item}")
             return True
             
         except Exception as e:
             self.logger.error(f"插入元素失败: {e}")
             return False
     
+    def extend(self, items: Iterable[Any]) -> bool:
+        """批量追加元素到末尾
+        
+        最多扩容一次，并通过一次切片赋值写入全部元素，
+        避免逐个调用 insert 带来的重复检查和日志开销。
+        
+        Args:
+            items: 要追加的元素
+            
+        Returns:
+            追加是否成功
+        """
+        try:
+            # 生成器等一次性迭代器先物化，np.asarray 无法直接转换它们
+            if not isinstance(items, (list, tuple, np.ndarray)):
+                items = list(items)
+            
+            # 先整体转换并检查：有损时数组尚未扩容或写入，内容保持不变
+            values = self._to_elements(items)
+            
+            count = len(values)
+            needed = self.size + count
+            if needed > self.capacity:
+                self._resize(max(self.capacity * 2, needed))
+            
+            self.data[self.size:needed] = values
+            self.size = needed
+            self.is_sorted = False
+            self.operation_count += 1
+            self.modification_count += count
+            
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"批量追加 {count} 个元素")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"批量追加元素失败: {e}")
+            return False
+    
     def delete(self, item: Any, **kwargs) -> bool:
         """删除元素
         
@@ -82,31 +176,33 @@ class Array(DataStructureBase):
         try:
             position = kwargs.get('position', None)
             
-            if position is not None:
-                # 按位置删除
-                if position < 0 or position >= self.size:
-                    self.logger.error(f"删除位置 {position} 超出范围")
+            if position is None:
+                # 按值删除：定位后直接移位，不再递归调用 delete
+                position = self._find_index(item)
+                if position < 0:
+                    self.logger.warning(f"未找到要删除的元素 {item}")
                     return False
-                    
-                # 移动元素覆盖被删除的元素
-                for i in range(position, self.size - 1):
-                    self.data[i] = self.data[i + 1]
-                    
-                self.data[self.size - 1] = None
-                self.size -= 1
-                self.operation_count += 1
-                self.modification_count += 1
+            elif position < 0 or position >= self.size:
+                # 按位置删除
+                self.logger.error(f"删除位置 {position} 超出范围")
+                return False
                 
-                self.logger.info(f"删除位置 {position} 的元素")
-                return True
+            # 移动元素覆盖被删除的元素（一次切片赋值完成整体左移）
+            if self._use_kernels():
+                _shift_left(self.data, position, self.size)
             else:
-                # 按值删除
-                for i in range(self.size):
-                    if self.data[i] == item:
-                        return self.delete(item, position=i)
-                        
-                self.logger.warning(f"未找到要删除的元素 {item}")
-                return False
+                self.data[position:self.size - 1] = self.data[position + 1:self.size]
+                
+            if self.data.dtype == object:
+                # 释放对象引用，数值类型无需清理
+                self.data[self.size - 1] = None
+            self.size -= 1
+            self.operation_count += 1
+            self.modification_count += 1
+            
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"删除位置 {position} 的元素")
+            return True
                 
         except Exception as e:
             self.logger.error(f"删除元素失败: {e}")
@@ -122,20 +218,148 @@ class Array(DataStructureBase):
             元素的位置，如果未找到返回None
         """
         try:
-            for i in range(self.size):
-                self.access_count += 1
-                if self.data[i] == item:
-                    self.operation_count += 1
+            i = self._find_index(item)
+            if i >= 0:
+                self.access_count += i + 1
+                self.operation_count += 1
+                if self.logger.isEnabledFor(logging.INFO):
                     self.logger.info(f"找到元素 {item} 在位置 {i}")
-                    return i
+                return i
                     
-            self.logger.info(f"未找到元素 {item}")
+            self.access_count += self.size
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"未找到元素 {item}")
             return None
             
         except Exception as e:
             self.logger.error(f"搜索元素失败: {e}")
             return None
     
+    def search_sorted(self, item: Any) -> Optional[int]:
+        """在有序数组中二分搜索元素
+        
+        仅当 is_sorted 为 True 时使用二分搜索 O(log n)：数值类型交给
+        np.searchsorted，其他类型使用 bisect；否则退化为线性搜索。
+        
+        Args:
+            item: 要搜索的元素
+            
+        Returns:
+            元素第一次出现的位置，如果未找到返回None
+        """
+        if not self.is_sorted:
+            return self.search(item)
+        
+        try:
+            view = self.data[:self.size]
+            if self.data.dtype.kind in _NUMERIC_KINDS and isinstance(item, Number):
+                i = int(np.searchsorted(view, item))
+            else:
+                i = bisect.bisect_left(view, item)
+            
+            self.access_count += 1
+            if i < self.size and self.data[i] == item:
+                self.operation_count += 1
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(f"找到元素 {item} 在位置 {i}")
+                return i
+            
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"未找到元素 {item}")
+            return None
+            
+        except Exception as e:
+            self.logger.error(f"搜索元素失败: {e}")
+            return None
+    
+    def _to_element(self, item: Any) -> Any:
+        """把元素转换为底层数组的元素类型
+        
+        numpy 赋值会静默截断（2.7 存为 2）或在溢出时才报错，
+        这里先转换并确认转换前后相等，拒绝有损的转换。
+        
+        Args:
+            item: 要存放的元素
+            
+        Returns:
+            转换后的元素
+            
+        Raises:
+            ValueError: 元素无法无损转换为数组的元素类型
+        """
+        dtype = self.data.dtype
+        if dtype == object:
+            return item
+        try:
+            value = dtype.type(item)
+            # 序列会被转换成数组而不是单个元素；NaN 与自身不相等，单独放行
+            lossless = np.ndim(value) == 0 and (bool(value == item) or (value != value and item != item))
+        except (TypeError, ValueError, OverflowError):
+            lossless = False
+        if not lossless:
+            raise ValueError(f"元素 {item!r} 无法无损转换为 {dtype}")
+        return value
+    
+    def _to_elements(self, items: Any) -> np.ndarray:
+        """把一批元素整体转换为底层数组的元素类型，规则与 _to_element 相同
+        
+        转换和比较都是向量化的，不逐个调用 _to_element。
+        
+        Args:
+            items: 要存放的元素（列表、元组或 ndarray）
+            
+        Returns:
+            转换后的一维数组
+            
+        Raises:
+            ValueError: 有元素无法无损转换为数组的元素类型
+        """
+        dtype = self.data.dtype
+        if dtype == object:
+            # 逐个作为对象存放，避免嵌套序列被 numpy 展开成多维数组
+            return np.fromiter(items, dtype=object, count=len(items))
+        
+        source = np.asarray(items)
+        try:
+            # NaN 转为整数时 numpy 会给出警告，结果随后在比较中被拒绝
+            with np.errstate(invalid='ignore'):
+                values = source.astype(dtype)
+            lossless = values.ndim == 1 and (source.dtype == dtype or bool(np.all(
+                (values == source) | ((values != values) & (source != source)))))
+        except (TypeError, ValueError, OverflowError):
+            lossless = False
+        if not lossless:
+            raise ValueError(f"部分元素无法无损转换为 {dtype}")
+        return values
+    
+    def _use_kernels(self) -> bool:
+        """数值类型且安装了 numba 时使用编译内核"""
+        return _HAS_NUMBA and self.data.dtype.kind in _NUMERIC_KINDS
+    
+    def _find_index(self, item: Any) -> int:
+        """查找元素位置，未找到返回 -1
+        
+        数值类型优先使用编译内核，未安装 numba 时退化为 numpy 向量化比较；
+        object 类型逐个比较。
+        """
+        if self.data.dtype.kind in _NUMERIC_KINDS and isinstance(item, Number):
+            # 无法用元素类型表示的值（如溢出的整数、整数数组中的 2.5）不可能在数组中
+            try:
+                item = self._to_element(item)
+            except ValueError:
+                return -1
+            if _HAS_NUMBA:
+                return _search_kernel(self.data, self.size, item)
+            matches = np.flatnonzero(self.data[:self.size] == item)
+            return int(matches[0]) if matches.size else -1
+        
+        # 将属性绑定到局部变量，循环中只做 LOAD_FAST
+        data = self.data
+        for i in range(self.size):
+            if data[i] == item:
+                return i
+        return -1
+    
     def update(self, old_item: Any, new_item: Any) -> bool:
         """更新元素
         
@@ -147,12 +371,16 @@ class Array(DataStructureBase):
             更新是否成功
         """
         try:
+            # 先转换新元素：转换失败时不修改数组
+            value = self._to_element(new_item)
             position = self.search(old_item)
             if position is not None:
-                self.data[position] = new_item
+                self.data[position] = value
+                self.is_sorted = False
                 self.operation_count += 1
                 self.modification_count += 1
-                self.logger.info(f"更新位置 {position} 的元素: {old_item} -> {new_item}")
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(f"更新位置 {position} 的元素: {old_item} -> {new_item}")
                 return True
             else:
                 self.logger.warning(f"未找到要更新的元素 {old_item}")
@@ -189,9 +417,15 @@ class Array(DataStructureBase):
             设置是否成功
         """
         if 0 <= index < self.size:
-            self.data[index] = value
+            try:
+                self.data[index] = self._to_element(value)
+            except ValueError as e:
+                self.logger.error(f"设置元素失败: {e}")
+                return False
+            self.is_sorted = False
             self.modification_count += 1
-            self.logger.info(f"设置位置 {index} 的值为 {value}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"设置位置 {index} 的值为 {value}")
             return True
         else:
             self.logger.error(f"设置位置 {index} 超出范围")
@@ -199,7 +433,7 @@ class Array(DataStructureBase):
     
     def clear(self):
         """清空数组"""
-        self.data = [None] * self.capacity
+        self.data = np.empty(self.capacity, dtype=self.data.dtype)
         self.size = 0
         self.operation_count += 1
         self.logger.info("数组已清空")
@@ -210,14 +444,13 @@ class Array(DataStructureBase):
         Args:
             new_capacity: 新容量
         """
-        old_data = self.data
-        self.data = [None] * new_capacity
+        new_data = np.empty(new_capacity, dtype=self.data.dtype)
+        new_data[:self.size] = self.data[:self.size]
+        self.data = new_data
         self.capacity = new_capacity
         
-        for i in range(self.size):
-            self.data[i] = old_data[i]
-            
-        self.logger.info(f"数组容量调整为 {new_capacity}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"数组容量调整为 {new_capacity}")
     
     def __len__(self) -> int:
         """返回数组长度"""
@@ -231,14 +464,25 @@ class Array(DataStructureBase):
         """支持索引赋值"""
         self.set(index, value)
     
+    def __contains__(self, item: Any) -> bool:
+        """检查元素是否在数组中"""
+        return self._find_index(item) >= 0
+    
     def __iter__(self) -> Iterator[Any]:
-        """支持迭代"""
-        for i in range(self.size):
-            yield self.data[i]
+        """支持迭代（使用 numpy 的 C 层迭代器，不经过 Python 生成器）"""
+        return iter(self.data[:self.size])
+    
+    def as_view(self) -> np.ndarray:
+        """返回有效元素的零拷贝视图
+        
+        视图与数组共享底层存储，修改视图会直接修改数组内容；
+        扩容后旧视图不再反映数组的变化。
+        """
+        return self.data[:self.size]
     
     def __str__(self) -> str:
         """字符串表示"""
-        return f"Array(size={self.size}, capacity={self.capacity}, data={self.data[:self.size]})"
+        return f"Array(size={self.size}, capacity={self.capacity}, data={self.data[:self.size].tolist()})"
     
     def __repr__(self) -> str:
         """详细字符串表示"""
@@ -5,9 +5,49 @@
 本实现支持有向图和无向图，提供顶点和边的增删改查操作。
 """
 
-from typing import Any, Optional, List, Set, Dict, Tuple, Iterator
+import logging
+from collections import deque
+from typing import Any, Optional, List, Set, Dict, Tuple, Iterator, Iterable
+
+import numpy as np
+
 from core.data_structures import DataStructureBase, DataStructureType
 
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    # numba 为可选依赖，未安装时遍历直接走字典邻接表
+    _HAS_NUMBA = False
+
+# dict.pop 的默认值哨兵，用于一次查找同时完成判断和删除
+_MISSING = object()
+
+
+def _bfs_kernel(indptr, indices, start: int):
+    """CSR上的广度优先遍历内核，返回按访问顺序排列的顶点下标"""
+    n = indptr.shape[0] - 1
+    order = np.empty(n, dtype=np.int64)
+    visited = np.zeros(n, dtype=np.bool_)
+    visited[start] = True
+    order[0] = start
+    head = 0
+    tail = 1
+    while head < tail:
+        v = order[head]
+        head += 1
+        for k in range(indptr[v], indptr[v + 1]):
+            u = indices[k]
+            if not visited[u]:
+                visited[u] = True
+                order[tail] = u
+                tail += 1
+    return order[:tail]
+
+
+if _HAS_NUMBA:
+    _bfs_kernel = njit(cache=True, nogil=True)(_bfs_kernel)
+
 
 class Graph(DataStructureBase):
     """图数据结构实现
@@ -19,6 +59,8 @@ class Graph(DataStructureBase):
     - 支持权重边
     """
     
+    __slots__ = ('directed', 'vertices', 'edges', 'rev_edges', 'edge_count', '_csr')
+    
     def __init__(self, directed: bool = False):
         """初始化图
         
@@ -29,8 +71,19 @@ class Graph(DataStructureBase):
         self.directed = directed
         self.vertices = {}  # 顶点字典 {vertex_id: vertex_data}
         self.edges = {}     # 边字典 {vertex_id: {neighbor_id: weight}}
-        self.size = 0       # 顶点数量
+        self.rev_edges = {} # 反向邻接 {vertex_id: {predecessor_id, ...}}，仅有向图维护
         self.edge_count = 0 # 边数量
+        self._csr = None    # freeze() 生成的只读CSR快照，任何修改都会使其失效
+    
+    @property
+    def size(self) -> int:
+        """顶点数量，直接由顶点字典得出，不再单独维护计数"""
+        return len(self.vertices)
+    
+    @size.setter
+    def size(self, value: int):
+        # 基类初始化时会写入 size，顶点数只由 vertices 决定，忽略即可
+        pass
     
     def add_vertex(self, vertex_id: Any, data: Any = None) -> bool:
         """添加顶点
@@ -43,17 +96,23 @@ class Graph(DataStructureBase):
             添加是否成功
         """
         try:
-            if vertex_id in self.vertices:
+            # setdefault 一次完成查重和写入，长度不变说明顶点已存在
+            vertices = self.vertices
+            count = len(vertices)
+            vertices.setdefault(vertex_id, data)
+            if len(vertices) == count:
                 self.logger.warning(f"顶点 {vertex_id} 已存在")
                 return False
             
-            self.vertices[vertex_id] = data
             self.edges[vertex_id] = {}
-            self.size += 1
+            if self.directed:
+                self.rev_edges[vertex_id] = set()
             self.operation_count += 1
             self.modification_count += 1
+            self._csr = None
             
-            self.logger.info(f"添加顶点 {vertex_id}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"添加顶点 {vertex_id}")
             return True
             
         except Exception as e:
@@ -70,34 +129,41 @@ class Graph(DataStructureBase):
             删除是否成功
         """
         try:
-            if vertex_id not in self.vertices:
+            edges = self.edges
+            # 先摘下顶点自己的邻接表，后续扫描不会再碰到它（自环也只计一次）；
+            # pop 带默认值，一次完成存在性检查和删除
+            out_edges = edges.pop(vertex_id, None)
+            if out_edges is None:
                 self.logger.warning(f"顶点 {vertex_id} 不存在")
                 return False
+            del self.vertices[vertex_id]
+            removed = len(out_edges)
             
             # 删除所有相关的边
             if self.directed:
-                # 有向图：删除出边和入边
-                for neighbor in self.edges[vertex_id]:
-                    self.edge_count -= 1
+                # 有向图：删除出边和入边，前驱由反向邻接直接给出，代价为 O(入度)
+                rev_edges = self.rev_edges
+                for neighbor in out_edges:
+                    rev_edges[neighbor].discard(vertex_id)
                 
-                for v in self.edges:
-                    if vertex_id in self.edges[v]:
-                        self.edges[v].pop(vertex_id)
-                        self.edge_count -= 1
+                predecessors = rev_edges.pop(vertex_id)
+                for predecessor in predecessors:
+                    edges[predecessor].pop(vertex_id)
+                removed += len(predecessors)
             else:
-                # 无向图：删除所有相关边
-                for neighbor in self.edges[vertex_id]:
-                    self.edges[neighbor].pop(vertex_id)
-                    self.edge_count -= 1
-            
-            # 删除顶点
-            self.vertices.pop(vertex_id)
-            self.edges.pop(vertex_id)
-            self.size -= 1
+                # 无向图：删除所有相关边，每条非自环边按两个方向计数
+                for neighbor in out_edges:
+                    if neighbor != vertex_id:
+                        edges[neighbor].pop(vertex_id)
+                        removed += 1
+            
+            self.edge_count -= removed
             self.operation_count += 1
             self.modification_count += 1
+            self._csr = None
             
-            self.logger.info(f"删除顶点 {vertex_id}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"删除顶点 {vertex_id}")
             return True
             
         except Exception as e:
@@ -116,27 +182,34 @@ class Graph(DataStructureBase):
             添加是否成功
         """
         try:
-            if from_vertex not in self.vertices or to_vertex not in self.vertices:
+            # 邻接表与顶点字典的键一致，一次 get 同时完成存在性检查和取值
+            from_edges = self.edges.get(from_vertex)
+            to_edges = self.edges.get(to_vertex)
+            if from_edges is None or to_edges is None:
                 self.logger.error(f"顶点 {from_vertex} 或 {to_vertex} 不存在")
                 return False
             
-            if to_vertex in self.edges[from_vertex]:
+            # 添加边：setdefault 只探测一次，长度不变说明边已存在
+            count = len(from_edges)
+            from_edges.setdefault(to_vertex, weight)
+            if len(from_edges) == count:
                 self.logger.warning(f"边 {from_vertex} -> {to_vertex} 已存在")
                 return False
-            
-            # 添加边
-            self.edges[from_vertex][to_vertex] = weight
             self.edge_count += 1
             
+            if self.directed:
+                self.rev_edges[to_vertex].add(from_vertex)
             # 如果是无向图，添加反向边
-            if not self.directed and from_vertex != to_vertex:
-                self.edges[to_vertex][from_vertex] = weight
+            elif from_vertex != to_vertex:
+                to_edges[from_vertex] = weight
                 self.edge_count += 1
             
             self.operation_count += 1
             self.modification_count += 1
+            self._csr = None
             
-            self.logger.info(f"添加边 {from_vertex} -> {to_vertex} (权重: {weight})")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"添加边 {from_vertex} -> {to_vertex} (权重: {weight})")
             return True
             
         except Exception as e:
@@ -154,33 +227,119 @@ class Graph(DataStructureBase):
             删除是否成功
         """
         try:
-            if from_vertex not in self.vertices or to_vertex not in self.vertices:
+            from_edges = self.edges.get(from_vertex)
+            to_edges = self.edges.get(to_vertex)
+            if from_edges is None or to_edges is None:
                 self.logger.error(f"顶点 {from_vertex} 或 {to_vertex} 不存在")
                 return False
             
-            if to_vertex not in self.edges[from_vertex]:
+            # 删除边：pop 一次完成存在性检查和删除
+            if from_edges.pop(to_vertex, _MISSING) is _MISSING:
                 self.logger.warning(f"边 {from_vertex} -> {to_vertex} 不存在")
                 return False
-            
-            # 删除边
-            self.edges[from_vertex].pop(to_vertex)
             self.edge_count -= 1
             
+            if self.directed:
+                self.rev_edges[to_vertex].discard(from_vertex)
             # 如果是无向图，删除反向边
-            if not self.directed and from_vertex != to_vertex:
-                self.edges[to_vertex].pop(from_vertex)
+            elif from_vertex != to_vertex:
+                to_edges.pop(from_vertex)
                 self.edge_count -= 1
             
             self.operation_count += 1
             self.modification_count += 1
+            self._csr = None
             
-            self.logger.info(f"删除边 {from_vertex} -> {to_vertex}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"删除边 {from_vertex} -> {to_vertex}")
             return True
             
         except Exception as e:
             self.logger.error(f"删除边失败: {e}")
             return False
     
+    def add_vertices(self, vertex_ids: Iterable[Any], data: Any = None) -> int:
+        """批量添加顶点
+        
+        已存在的顶点会被跳过，其余顶点通过 dict.update 一次性写入，
+        避免逐个调用 add_vertex 带来的检查和日志开销。
+        
+        Args:
+            vertex_ids: 顶点标识
+            data: 所有新顶点共用的顶点数据
+            
+        Returns:
+            实际添加的顶点数
+        """
+        try:
+            vertices = self.vertices
+            new_ids = [v for v in dict.fromkeys(vertex_ids) if v not in vertices]
+            
+            vertices.update(dict.fromkeys(new_ids, data))
+            self.edges.update({v: {} for v in new_ids})
+            if self.directed:
+                self.rev_edges.update({v: set() for v in new_ids})
+            self.operation_count += 1
+            self.modification_count += len(new_ids)
+            self._csr = None
+            
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"批量添加 {len(new_ids)} 个顶点")
+            return len(new_ids)
+            
+        except Exception as e:
+            self.logger.error(f"批量添加顶点失败: {e}")
+            return 0
+    
+    def add_edges(self, edge_list: Iterable[Tuple[Any, Any, float]]) -> int:
+        """批量添加边
+        
+        有向/无向分支、日志检查和容器引用都只在循环外处理一次，
+        计数器在最后统一更新。顶点不存在或边已存在的条目会被跳过。
+        
+        Args:
+            edge_list: 边的可迭代对象 [(from_vertex, to_vertex, weight), ...]
+            
+        Returns:
+            实际添加的边数
+        """
+        edges = self.edges
+        rev_edges = self.rev_edges
+        directed = self.directed
+        added = 0
+        edge_delta = 0
+        
+        try:
+            for from_vertex, to_vertex, weight in edge_list:
+                from_edges = edges.get(from_vertex)
+                to_edges = edges.get(to_vertex)
+                if from_edges is None or to_edges is None or to_vertex in from_edges:
+                    continue
+                
+                from_edges[to_vertex] = weight
+                added += 1
+                if directed:
+                    rev_edges[to_vertex].add(from_vertex)
+                    edge_delta += 1
+                elif from_vertex != to_vertex:
+                    to_edges[from_vertex] = weight
+                    edge_delta += 2
+                else:
+                    edge_delta += 1
+                    
+        except Exception as e:
+            self.logger.error(f"批量添加边失败: {e}")
+        
+        # 出错时也要把已写入的边计入统计，保持计数与邻接表一致
+        self.edge_count += edge_delta
+        self.operation_count += 1
+        self.modification_count += added
+        self._csr = None
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"批量添加 {added} 条边")
+        return added
+    
     def insert(self, item: Any, **kwargs) -> bool:
         """插入元素（添加顶点）
         
@@ -216,12 +375,16 @@ class Graph(DataStructureBase):
             顶点数据，如果未找到返回None
         """
         self.access_count += 1
-        if item in self.vertices:
+        # 顶点数据本身可能为None，用哨兵区分"不存在"，一次 get 完成判断和取值
+        data = self.vertices.get(item, _MISSING)
+        if data is not _MISSING:
             self.operation_count += 1
-            self.logger.info(f"找到顶点 {item}")
-            return self.vertices[item]
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"找到顶点 {item}")
+            return data
         else:
-            self.logger.info(f"未找到顶点 {item}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"未找到顶点 {item}")
             return None
     
     def update(self, old_item: Any, new_item: Any) -> bool:
@@ -239,7 +402,8 @@ class Graph(DataStructureBase):
                 self.vertices[old_item] = new_item
                 self.operation_count += 1
                 self.modification_count += 1
-                self.logger.info(f"更新顶点 {old_item} 的数据")
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(f"更新顶点 {old_item} 的数据")
                 return True
             else:
                 self.logger.warning(f"未找到要更新的顶点 {old_item}")
@@ -258,15 +422,12 @@ class Graph(DataStructureBase):
         Returns:
             邻居列表 [(neighbor_id, weight), ...]
         """
-        if vertex_id not in self.vertices:
+        neighbors = self.edges.get(vertex_id)
+        if neighbors is None:
             return []
         
-        neighbors = []
-        for neighbor_id, weight in self.edges[vertex_id].items():
-            neighbors.append((neighbor_id, weight))
-        
         self.access_count += 1
-        return neighbors
+        return list(neighbors.items())
     
     def get_degree(self, vertex_id: Any) -> int:
         """获取顶点的度数
@@ -277,18 +438,14 @@ class Graph(DataStructureBase):
         Returns:
             顶点度数
         """
-        if vertex_id not in self.vertices:
+        neighbors = self.edges.get(vertex_id)
+        if neighbors is None:
             return 0
         
-        degree = len(self.edges[vertex_id])
-        
-        # 如果是无向图，需要检查入度
-        if not self.directed:
-            for v in self.edges:
-                if vertex_id in self.edges[v]:
-                    degree += 1
-        
-        return degree
+        # 无向图的邻接表是对称的，出边数即度数；有向图再加上反向邻接给出的入度
+        if self.directed:
+            return len(neighbors) + len(self.rev_edges[vertex_id])
+        return len(neighbors)
     
     def has_edge(self, from_vertex: Any, to_vertex: Any) -> bool:
         """检查是否存在边
@@ -300,10 +457,8 @@ class Graph(DataStructureBase):
         Returns:
             是否存在边
         """
-        if from_vertex not in self.vertices or to_vertex not in self.vertices:
-            return False
-        
-        return to_vertex in self.edges[from_vertex]
+        from_edges = self.edges.get(from_vertex)
+        return from_edges is not None and to_vertex in from_edges
     
     def get_edge_weight(self, from_vertex: Any, to_vertex: Any) -> Optional[float]:
         """获取边权重
@@ -315,19 +470,136 @@ class Graph(DataStructureBase):
         Returns:
             边权重，如果边不存在返回None
         """
-        if self.has_edge(from_vertex, to_vertex):
-            return self.edges[from_vertex][to_vertex]
-        return None
+        from_edges = self.edges.get(from_vertex)
+        return from_edges.get(to_vertex) if from_edges is not None else None
     
     def clear(self):
         """清空图"""
         self.vertices.clear()
         self.edges.clear()
-        self.size = 0
+        self.rev_edges.clear()
         self.edge_count = 0
+        self._csr = None
         self.operation_count += 1
         self.logger.info("图已清空")
     
+    def freeze(self) -> bool:
+        """把邻接表冻结为CSR（压缩稀疏行）快照
+        
+        适合构建完成后以读为主的场景：第 i 个顶点的邻居下标为
+        indices[indptr[i]:indptr[i + 1]]，对应权重在 weights 的同一区间，
+        遍历邻居变成对连续整型数组的顺序扫描。图被修改后快照自动失效。
+        
+        Returns:
+            冻结是否成功
+        """
+        try:
+            edges = self.edges
+            vertex_ids = list(edges)
+            id_to_index = {vertex_id: i for i, vertex_id in enumerate(vertex_ids)}
+            
+            indptr = np.zeros(len(vertex_ids) + 1, dtype=np.int64)
+            np.cumsum(np.fromiter(map(len, edges.values()), dtype=np.int64,
+                                  count=len(vertex_ids)), out=indptr[1:])
+            edge_total = int(indptr[-1])
+            indices = np.fromiter((id_to_index[v] for neighbors in edges.values() for v in neighbors),
+                                  dtype=np.int32, count=edge_total)
+            weights = np.fromiter((w for neighbors in edges.values() for w in neighbors.values()),
+                                  dtype=np.float64, count=edge_total)
+            
+            self._csr = (indptr, indices, weights, vertex_ids, id_to_index)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"图已冻结为CSR: {len(vertex_ids)} 个顶点, {edge_total} 条边")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"冻结图失败: {e}")
+            return False
+    
+    @property
+    def is_frozen(self) -> bool:
+        """CSR快照是否与当前邻接表一致"""
+        return self._csr is not None
+    
+    def get_csr(self) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, List[Any]]]:
+        """获取CSR快照，未冻结时先冻结
+        
+        Returns:
+            (indptr, indices, weights, vertex_ids)，vertex_ids[i] 为下标 i 对应的顶点；
+            冻结失败返回None
+        """
+        if self._csr is None and not self.freeze():
+            return None
+        return self._csr[:4]
+    
+    def vertex_index(self, vertex_id: Any) -> Optional[int]:
+        """获取顶点在CSR快照中的下标
+        
+        Args:
+            vertex_id: 顶点标识
+            
+        Returns:
+            顶点下标，如果顶点不存在或冻结失败返回None
+        """
+        if self._csr is None and not self.freeze():
+            return None
+        return self._csr[4].get(vertex_id)
+    
+    def bfs(self, start_vertex: Any) -> List[Any]:
+        """广度优先遍历
+        
+        图已冻结且安装了 numba 时在CSR快照上运行编译内核，
+        否则直接遍历字典邻接表。两种方式的访问顺序一致。
+        
+        Args:
+            start_vertex: 起始顶点
+            
+        Returns:
+            按访问顺序排列的顶点列表，起始顶点不存在时返回空列表
+        """
+        edges = self.edges
+        if start_vertex not in edges:
+            return []
+        self.access_count += 1
+        
+        if _HAS_NUMBA and self._csr is not None:
+            indptr, indices, _, vertex_ids, id_to_index = self._csr
+            order = _bfs_kernel(indptr, indices, id_to_index[start_vertex])
+            return [vertex_ids[i] for i in order.tolist()]
+        
+        visited = {start_vertex}
+        order = [start_vertex]
+        queue = deque(order)
+        while queue:
+            for neighbor in edges[queue.popleft()]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    order.append(neighbor)
+                    queue.append(neighbor)
+        return order
+    
+    def degree_histogram(self) -> np.ndarray:
+        """度数分布
+        
+        图已冻结时由CSR数组向量化计算，否则由邻接表长度计算。
+        度数的定义与 get_degree 一致（有向图为出度加入度）。
+        
+        Returns:
+            数组 hist，hist[d] 为度数等于 d 的顶点数
+        """
+        if self._csr is not None:
+            indptr, indices = self._csr[0], self._csr[1]
+            degrees = np.diff(indptr)
+            if self.directed:
+                degrees += np.bincount(indices, minlength=len(degrees))
+        else:
+            degrees = np.fromiter(map(len, self.edges.values()), dtype=np.int64,
+                                  count=len(self.edges))
+            if self.directed:
+                degrees += np.fromiter(map(len, self.rev_edges.values()), dtype=np.int64,
+                                       count=len(self.rev_edges))
+        return np.bincount(degrees)
+    
     def get_vertices(self) -> List[Any]:
         """获取所有顶点
         
@@ -342,15 +614,13 @@ class Graph(DataStructureBase):
         Returns:
             边列表 [(from_vertex, to_vertex, weight), ...]
         """
-        edges = []
-        for from_vertex in self.edges:
-            for to_vertex, weight in self.edges[from_vertex].items():
-                edges.append((from_vertex, to_vertex, weight))
-        return edges
+        return [(from_vertex, to_vertex, weight)
+                for from_vertex, neighbors in self.edges.items()
+                for to_vertex, weight in neighbors.items()]
     
     def __len__(self) -> int:
         """返回图的顶点数量"""
-        return self.size
+        return len(self.vertices)
     
     def __iter__(self) -> Iterator[Any]:
         """支持迭代（遍历顶点）"""
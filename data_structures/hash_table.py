@@ -5,10 +5,20 @@
 本实现支持动态扩容、冲突处理、键值对操作等。
 """
 
+import logging
 from typing import Any, Optional, List, Tuple, Iterator
 from core.data_structures import DataStructureBase, DataStructureType
 
 
+# 开放寻址用的槽位哨兵：空槽终止探测，墓碑表示已删除但探测需继续
+_EMPTY = object()
+_TOMBSTONE = object()
+
+# 64位黄金分割乘数（splitmix64 所用常数）及截断掩码
+_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+_HASH_BITS = 0xFFFFFFFFFFFFFFFF
+
+
 class HashTable(DataStructureBase):
     """哈希表实现
     
@@ -16,21 +26,28 @@ class HashTable(DataStructureBase):
     - 键值对存储
     - 平均 O(1) 的查找、插入、删除
     - 动态扩容
-    - 链地址法处理冲突
+    - 开放寻址（线性探测）处理冲突，容量为2的幂，用乘法散列和位运算代替取模
     """
     
+    __slots__ = ('capacity', 'load_factor', '_mask', '_shift', '_used', '_keys', '_vals')
+    
     def __init__(self, initial_capacity: int = 16, load_factor: float = 0.75):
         """初始化哈希表
         
         Args:
-            initial_capacity: 初始容量
-            load_factor: 负载因子
+            initial_capacity: 初始容量（向上取整为2的幂）
+            load_factor: 负载因子（线性探测下最大取0.75）
         """
         super().__init__("HashTable", DataStructureType.HASH_TABLE)
-        self.capacity = initial_capacity
-        self.load_factor = load_factor
+        self.capacity = 1 << max(initial_capacity - 1, 0).bit_length()
+        self.load_factor = min(load_factor, 0.75)
         self.size = 0
-        self.buckets = [[] for _ in range(initial_capacity)]
+        self._mask = self.capacity - 1
+        self._shift = 64 - self._mask.bit_length()  # 取乘积高位时的右移位数
+        self._used = 0  # 非空槽位数（有效键 + 墓碑）
+        # 键和值分别存放在两个扁平数组中：探测只读取键数组
+        self._keys = [_EMPTY] * self.capacity
+        self._vals = [None] * self.capacity
     
     def put(self, key: Any, value: Any) -> bool:
         """插入键值对
@@ -43,29 +60,49 @@ class HashTable(DataStructureBase):
             插入是否成功
         """
         try:
-            # 检查是否需要扩容
-            if self.size >= self.capacity * self.load_factor:
-                self._resize(self.capacity * 2)
+            # 检查是否需要扩容：保证插入后仍至少有一个空槽，探测必然终止
+            if self._used + 1 > self.capacity * self.load_factor:
+                new_capacity = self.capacity
+                # 有效键本身已超过阈值时翻倍；否则是墓碑占满了槽位，按原容量重建即可
+                if self.size + 1 > new_capacity * self.load_factor:
+                    new_capacity <<= 1
+                self._resize(new_capacity)
             
-            hash_code = self._hash(key)
-            bucket = self.buckets[hash_code]
+            keys = self._keys
+            mask = self._mask
+            index = self._hash(key)
+            tombstone = -1
             
-            # 检查是否已存在相同的键
-            for i, (k, v) in enumerate(bucket):
-                if k == key:
-                    bucket[i] = (key, value)
+            # 线性探测：遇到相同的键则更新，遇到空槽则停止
+            while True:
+                k = keys[index]
+                if k is _EMPTY:
+                    break
+                if k is _TOMBSTONE:
+                    if tombstone < 0:
+                        tombstone = index
+                elif k == key:
+                    self._vals[index] = value
                     self.operation_count += 1
                     self.modification_count += 1
-                    self.logger.info(f"更新键值对: {key} -> {value}")
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info(f"更新键值对: {key} -> {value}")
                     return True
+                index = (index + 1) & mask
             
-            # 插入新的键值对
-            bucket.append((key, value))
+            # 插入新的键值对，优先复用探测路径上的第一个墓碑
+            if tombstone >= 0:
+                index = tombstone
+            else:
+                self._used += 1
+            keys[index] = key
+            self._vals[index] = value
             self.size += 1
             self.operation_count += 1
             self.modification_count += 1
             
-            self.logger.info(f"插入键值对: {key} -> {value}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"插入键值对: {key} -> {value}")
             return True
             
         except Exception as e:
@@ -82,17 +119,17 @@ class HashTable(DataStructureBase):
             对应的值，如果未找到返回None
         """
         try:
-            hash_code = self._hash(key)
-            bucket = self.buckets[hash_code]
-            
-            for k, v in bucket:
-                self.access_count += 1
-                if k == key:
-                    self.operation_count += 1
+            self.access_count += 1
+            index = self._find_slot(key)
+            if index >= 0:
+                self.operation_count += 1
+                v = self._vals[index]
+                if self.logger.isEnabledFor(logging.INFO):
                     self.logger.info(f"找到键值对: {key} -> {v}")
-                    return v
+                return v
             
-            self.logger.info(f"未找到键 {key}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"未找到键 {key}")
             return None
             
         except Exception as e:
@@ -109,17 +146,17 @@ class HashTable(DataStructureBase):
             删除是否成功
         """
         try:
-            hash_code = self._hash(key)
-            bucket = self.buckets[hash_code]
-            
-            for i, (k, v) in enumerate(bucket):
-                if k == key:
-                    bucket.pop(i)
-                    self.size -= 1
-                    self.operation_count += 1
-                    self.modification_count += 1
+            index = self._find_slot(key)
+            if index >= 0:
+                # 置为墓碑而不是空槽，避免截断其他键的探测链
+                self._keys[index] = _TOMBSTONE
+                self._vals[index] = None
+                self.size -= 1
+                self.operation_count += 1
+                self.modification_count += 1
+                if self.logger.isEnabledFor(logging.INFO):
                     self.logger.info(f"删除键值对: {key}")
-                    return True
+                return True
             
             self.logger.warning(f"未找到要删除的键 {key}")
             return False
@@ -128,6 +165,27 @@ class HashTable(DataStructureBase):
             self.logger.error(f"删除键值对失败: {e}")
             return False
     
+    def _find_slot(self, key: Any) -> int:
+        """查找键所在的槽位
+        
+        Args:
+            key: 键
+            
+        Returns:
+            槽位下标，如果未找到返回-1
+        """
+        keys = self._keys
+        mask = self._mask
+        index = self._hash(key)
+        
+        while True:
+            k = keys[index]
+            if k is _EMPTY:
+                return -1
+            if k is not _TOMBSTONE and k == key:
+                return index
+            index = (index + 1) & mask
+    
     def insert(self, item: Any, **kwargs) -> bool:
         """插入元素（键值对）
         
@@ -193,7 +251,9 @@ class HashTable(DataStructureBase):
     
     def clear(self):
         """清空哈希表"""
-        self.buckets = [[] for _ in range(self.capacity)]
+        self._keys = [_EMPTY] * self.capacity
+        self._vals = [None] * self.capacity
+        self._used = 0
         self.size = 0
         self.operation_count += 1
         self.logger.info("哈希表已清空")
@@ -205,37 +265,59 @@ class HashTable(DataStructureBase):
             key: 键
             
         Returns:
-            哈希值
+            槽位下标
         """
-        return hash(key) % self.capacity
+        # 斐波那契散列：乘以黄金分割常数后取64位乘积的高位。
+        # 内置 hash 对小整数是恒等映射，直接取低位会让等步长的整数键挤在同一条探测链上
+        return (hash(key) * _HASH_MULTIPLIER & _HASH_BITS) >> self._shift
     
     def _resize(self, new_capacity: int):
         """调整哈希表容量
         
         Args:
-            new_capacity: 新容量
+            new_capacity: 新容量（2的幂）
         """
-        old_buckets = self.buckets
+        old_keys = self._keys
+        old_vals = self._vals
         self.capacity = new_capacity
-        self.buckets = [[] for _ in range(new_capacity)]
-        self.size = 0
+        self._mask = mask = new_capacity - 1
+        self._shift = shift = 64 - mask.bit_length()
+        self._keys = keys = [_EMPTY] * new_capacity
+        self._vals = vals = [None] * new_capacity
+        self._used = self.size
         
-        # 重新插入所有键值对
-        for bucket in old_buckets:
-            for key, value in bucket:
-                self.put(key, value)
+        # 重新分布所有键值对并丢弃墓碑（键在旧表中已唯一，无需再经 put 查重）
+        for key, value in zip(old_keys, old_vals):
+            if key is _EMPTY or key is _TOMBSTONE:
+                continue
+            index = (hash(key) * _HASH_MULTIPLIER & _HASH_BITS) >> shift
+            while keys[index] is not _EMPTY:
+                index = (index + 1) & mask
+            keys[index] = key
+            vals[index] = value
         
-        self.logger.info(f"哈希表容量调整为 {new_capacity}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"哈希表容量调整为 {new_capacity}")
     
     def __len__(self) -> int:
         """返回哈希表的大小"""
         return self.size
     
+    def __contains__(self, key: Any) -> bool:
+        """检查键是否存在"""
+        return self._find_slot(key) >= 0
+    
+    def __iter__(self) -> Iterator[Any]:
+        """按槽位顺序迭代所有键"""
+        for key in self._keys:
+            if key is not _EMPTY and key is not _TOMBSTONE:
+                yield key
+    
     def __str__(self) -> str:
         """字符串表示"""
         items = []
-        for bucket in self.buckets:
-            for key, value in bucket:
+        for key, value in zip(self._keys, self._vals):
+            if key is not _EMPTY and key is not _TOMBSTONE:
                 items.append(f"{key}:{value}")
         return f"HashTable(size={self.size}, items=[{', '.join(items)}])"
     
@@ -5,9 +5,101 @@
 本实现包括最小堆和最大堆，支持插入、删除、堆化等操作。
 """
 
-from typing import Any, Optional, List, Iterator
+import heapq
+import logging
+from collections import defaultdict
+from typing import Any, Optional, List, Iterable, Iterator
+
+import numpy as np
+
 from core.data_structures import DataStructureBase, DataStructureType
 
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    # numba 为可选依赖，未安装时 NumericMinHeap 的内核以纯 Python 运行
+    _HAS_NUMBA = False
+
+# heapq 的最大堆版本在 Python 3.14 才公开，更早的版本使用同样由C实现的私有函数
+_heapify_max = getattr(heapq, 'heapify_max', None) or heapq._heapify_max
+
+
+def _check_items(items: List[Any], reference: Any):
+    """检查批量插入的元素都可哈希、且能与 reference 比较，不满足时抛出 TypeError
+    
+    在修改堆之前调用，保证批量插入失败时堆和索引保持原样。
+    """
+    for item in items:
+        hash(item)
+        item < reference
+
+
+# NumericMinHeap 使用4叉堆：层数减半，且同一父节点的4个子节点在内存中相邻
+_ARITY = 4
+
+
+def _sift_up_kernel(data, pos: int):
+    """4叉最小堆"空位"上浮内核：把 pos 处的元素上移到合适位置"""
+    item = data[pos]
+    while pos > 0:
+        parent = (pos - 1) // _ARITY
+        if not item < data[parent]:
+            break
+        data[pos] = data[parent]
+        pos = parent
+    data[pos] = item
+
+
+def _sift_down_kernel(data, pos: int, size: int):
+    """4叉最小堆"空位"下沉内核：在前 size 个元素中把 pos 处的元素下移到合适位置"""
+    item = data[pos]
+    child = _ARITY * pos + 1
+    while child < size:
+        # 在至多 _ARITY 个相邻子节点中找出最小者
+        smallest = child
+        last_child = min(child + _ARITY, size)
+        for c in range(child + 1, last_child):
+            if data[c] < data[smallest]:
+                smallest = c
+        if not data[smallest] < item:
+            break
+        data[pos] = data[smallest]
+        pos = smallest
+        child = _ARITY * pos + 1
+    data[pos] = item
+
+
+def _sift_to_bottom_kernel(data, pos: int, size: int):
+    """4叉最小堆"先沉到底再上浮"内核：空位沿最小子节点下沉到叶子，再把元素上浮"""
+    item = data[pos]
+    child = _ARITY * pos + 1
+    while child < size:
+        smallest = child
+        last_child = min(child + _ARITY, size)
+        for c in range(child + 1, last_child):
+            if data[c] < data[smallest]:
+                smallest = c
+        data[pos] = data[smallest]
+        pos = smallest
+        child = _ARITY * pos + 1
+    data[pos] = item
+    _sift_up_kernel(data, pos)
+
+
+def _heapify_kernel(data, size: int):
+    """自底向上把前 size 个元素整理成最小堆"""
+    for i in range((size - 2) // _ARITY, -1, -1):
+        _sift_down_kernel(data, i, size)
+
+
+if _HAS_NUMBA:
+    # 内核之间按全局名互相调用，编译发生在首次调用时，届时全局名已指向编译版本
+    _sift_up_kernel = njit(cache=True, nogil=True)(_sift_up_kernel)
+    _sift_down_kernel = njit(cache=True, nogil=True)(_sift_down_kernel)
+    _sift_to_bottom_kernel = njit(cache=True, nogil=True)(_sift_to_bottom_kernel)
+    _heapify_kernel = njit(cache=True, nogil=True)(_heapify_kernel)
+
 
 class MinHeap(DataStructureBase):
     """最小堆实现
@@ -17,13 +109,28 @@ class MinHeap(DataStructureBase):
     - 父节点值小于等于子节点值
     - 根节点是最小值
     - 插入和删除都是 O(log n)
+    - 维护 值 -> 下标集合 的索引，按值搜索为 O(1)，按值删除、更新为 O(log n)
+      （元素需可哈希）
     """
     
+    __slots__ = ('data', '_index')
+    
     def __init__(self):
         """初始化最小堆"""
         super().__init__("MinHeap", DataStructureType.HEAP)
         self.data = []
-        self.size = 0
+        # 值 -> 该值所在下标的集合；堆中每次移动元素都同步更新
+        self._index = defaultdict(set)
+    
+    @property
+    def size(self) -> int:
+        """元素个数，直接由底层列表得出，不再单独维护计数"""
+        return len(self.data)
+    
+    @size.setter
+    def size(self, value: int):
+        # 基类初始化时会写入 size，元素个数只由 data 决定，忽略即可
+        pass
     
     def insert(self, item: Any, **kwargs) -> bool:
         """插入元素
@@ -35,20 +142,62 @@ class MinHeap(DataStructureBase):
         Returns:
             插入是否成功
         """
+        # 元素必须可哈希才能登记到索引中，在修改堆之前检查
         try:
-            self.data.append(item)
-            self.size += 1
-            self._heapify_up(self.size - 1)
+            self._index[item].add(len(self.data))
+        except TypeError as e:
+            self.logger.error(f"插入元素失败: {e}")
+            return False
+        
+        self.data.append(item)
+        self._heapify_up(len(self.data) - 1)
+        
+        self.operation_count += 1
+        self.modification_count += 1
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"插入元素 {item}")
+        return True
+    
+    def push_many(self, items: Iterable[Any]) -> int:
+        """批量插入元素
+        
+        新元素先全部追加到末尾：数量超过原有元素的一半时整体重新堆化（O(n)），
+        否则逐个上浮（每个 O(log n)），取两者中代价较小的一种。
+        
+        Args:
+            items: 要插入的元素（任意可迭代对象）
+            
+        Returns:
+            插入的元素个数
+        """
+        try:
+            items = list(items)
+            count = len(items)
+            old_size = len(self.data)
+            if count:
+                _check_items(items, self.data[0] if self.data else items[0])
+            self.data.extend(items)
+            
+            if count > old_size // 2:
+                heapq.heapify(self.data)
+                self._rebuild_index()
+            else:
+                index_map = self._index
+                for i in range(old_size, len(self.data)):
+                    index_map[self.data[i]].add(i)
+                    self._heapify_up(i)
             
             self.operation_count += 1
-            self.modification_count += 1
+            self.modification_count += count
             
-            self.logger.info(f"插入元素 {item}")
-            return True
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"批量插入 {count} 个元素")
+            return count
             
         except Exception as e:
-            self.logger.error(f"插入元素失败: {e}")
-            return False
+            self.logger.error(f"批量插入元素失败: {e}")
+            return 0
     
     def delete(self, item: Any, **kwargs) -> bool:
         """删除元素
@@ -60,36 +209,25 @@ class MinHeap(DataStructureBase):
         Returns:
             删除是否成功
         """
+        # 通过索引直接取得要删除的元素位置
         try:
-            # 找到要删除的元素位置
-            index = -1
-            for i, val in enumerate(self.data):
-                if val == item:
-                    index = i
-                    break
-            
-            if index == -1:
-                self.logger.warning(f"未找到要删除的元素 {item}")
-                return False
-            
-            # 将最后一个元素移到删除位置
-            self.data[index] = self.data[-1]
-            self.data.pop()
-            self.size -= 1
-            
-            # 如果还有元素，进行堆化
-            if self.size > 0:
-                self._heapify_down(index)
-            
-            self.operation_count += 1
-            self.modification_count += 1
-            
-            self.logger.info(f"删除元素 {item}")
-            return True
-            
-        except Exception as e:
+            positions = self._index.get(item)
+        except TypeError as e:
             self.logger.error(f"删除元素失败: {e}")
             return False
+        
+        if not positions:
+            self.logger.warning(f"未找到要删除的元素 {item}")
+            return False
+        
+        self._remove_at(next(iter(positions)))
+        
+        self.operation_count += 1
+        self.modification_count += 1
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"删除元素 {item}")
+        return True
     
     def extract_min(self) -> Optional[Any]:
         """提取最小值
@@ -101,8 +239,9 @@ class MinHeap(DataStructureBase):
             self.logger.warning("堆为空，无法提取最小值")
             return None
         
-        min_value = self.data[0]
-        self.delete(min_value)
+        min_value = self._remove_at(0)
+        self.operation_count += 1
+        self.modification_count += 1
         return min_value
     
     def peek_min(self) -> Optional[Any]:
@@ -125,22 +264,26 @@ class MinHeap(DataStructureBase):
             item: 要搜索的元素
             
         Returns:
-            元素的位置，如果未找到返回None
+            元素的位置（有重复值时为其中任意一个），如果未找到返回None
         """
+        # 查索引而不是扫描数组，只访问一次
+        self.access_count += 1
         try:
-            for i, val in enumerate(self.data):
-                self.access_count += 1
-                if val == item:
-                    self.operation_count += 1
-                    self.logger.info(f"找到元素 {item} 在位置 {i}")
-                    return i
-            
-            self.logger.info(f"未找到元素 {item}")
-            return None
-            
-        except Exception as e:
+            positions = self._index.get(item)
+        except TypeError as e:
             self.logger.error(f"搜索元素失败: {e}")
             return None
+        
+        if positions:
+            i = next(iter(positions))
+            self.operation_count += 1
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"找到元素 {item} 在位置 {i}")
+            return i
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"未找到元素 {item}")
+        return None
     
     def update(self, old_item: Any, new_item: Any) -> bool:
         """更新元素
@@ -153,95 +296,212 @@ class MinHeap(DataStructureBase):
             更新是否成功
         """
         try:
-            index = self.search(old_item)
-            if index is not None:
-                self.data[index] = new_item
-                
-                # 根据新值的大小决定向上或向下堆化
-                if new_item < old_item:
-                    self._heapify_up(index)
-                else:
-                    self._heapify_down(index)
-                
-                self.operation_count += 1
-                self.modification_count += 1
-                self.logger.info(f"更新元素: {old_item} -> {new_item}")
-                return True
-            else:
-                self.logger.warning(f"未找到要更新的元素 {old_item}")
-                return False
-                
-        except Exception as e:
+            hash(new_item)
+        except TypeError as e:
             self.logger.error(f"更新元素失败: {e}")
             return False
+        
+        index = self.search(old_item)
+        if index is not None:
+            self._discard_position(old_item, index)
+            self._index[new_item].add(index)
+            self.data[index] = new_item
+            
+            # 根据新值的大小决定向上或向下堆化
+            if new_item < old_item:
+                self._heapify_up(index)
+            else:
+                self._heapify_down(index)
+            
+            self.operation_count += 1
+            self.modification_count += 1
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"更新元素: {old_item} -> {new_item}")
+            return True
+        else:
+            self.logger.warning(f"未找到要更新的元素 {old_item}")
+            return False
     
     def clear(self):
         """清空堆"""
         self.data.clear()
-        self.size = 0
+        self._index.clear()
         self.operation_count += 1
         self.logger.info("最小堆已清空")
     
+    def _discard_position(self, item: Any, index: int):
+        """从索引中移除 item 位于 index 的记录，集合为空时删除该键"""
+        positions = self._index[item]
+        positions.discard(index)
+        if not positions:
+            del self._index[item]
+    
+    def _rebuild_index(self):
+        """按当前数组一次遍历重建 值 -> 下标集合 的索引，O(n)"""
+        index_map = defaultdict(set)
+        for i, item in enumerate(self.data):
+            index_map[item].add(i)
+        self._index = index_map
+    
+    def _remove_at(self, index: int) -> Any:
+        """移除并返回 index 处的元素，同时维护堆性质和索引
+        
+        Args:
+            index: 要移除的位置
+            
+        Returns:
+            被移除的元素
+        """
+        data = self.data
+        item = data[index]
+        self._discard_position(item, index)
+        
+        # 弹出末尾元素填入删除位置；删除的恰好是末尾时无需堆化
+        last = data.pop()
+        size = len(data)
+        if index < size:
+            positions = self._index[last]
+            positions.discard(size)
+            positions.add(index)
+            data[index] = last
+            # 末尾元素通常要沉到接近底部，先沉到底再上浮（也覆盖需要上浮的情况）
+            self._heapify_to_bottom(index)
+        return item
+    
     def _heapify_up(self, index: int):
         """向上堆化
         
+        采用"空位"上移：先取出待上移的元素，父节点逐层下移填入空位，
+        最后一次性写回该元素，避免每层交换两个位置。
+        每次移动元素都同步更新索引。
+        
         Args:
             index: 要堆化的位置
         """
-        parent = (index - 1) // 2
-        while index > 0 and self.data[index] < self.data[parent]:
-            self.data[index], self.data[parent] = self.data[parent], self.data[index]
+        data = self.data
+        index_map = self._index
+        item = data[index]
+        # 先摘掉被移动元素的原位置，移动过程中相等的值也可能占用该位置
+        item_positions = index_map[item]
+        item_positions.discard(index)
+        while index > 0:
+            parent = (index - 1) >> 1
+            parent_item = data[parent]
+            if not item < parent_item:
+                break
+            data[index] = parent_item
+            positions = index_map[parent_item]
+            positions.discard(parent)
+            positions.add(index)
             index = parent
-            parent = (index - 1) // 2
+        data[index] = item
+        item_positions.add(index)
     
     def _heapify_down(self, index: int):
         """向下堆化
         
+        采用"空位"下移：与更小的子节点比较的始终是被下移的元素，
+        子节点逐层上移填入空位，最后一次性写回该元素。
+        每次移动元素都同步更新索引。
+        
         Args:
             index: 要堆化的位置
         """
-        while True:
-            smallest = index
-            left_child = 2 * index + 1
-            right_child = 2 * index + 2
-            
-            if left_child < self.size and self.data[left_child] < self.data[smallest]:
-                smallest = left_child
-            
-            if right_child < self.size and self.data[right_child] < self.data[smallest]:
-                smallest = right_child
-            
-            if smallest == index:
+        data = self.data
+        index_map = self._index
+        size = len(data)
+        item = data[index]
+        # 先摘掉被移动元素的原位置，移动过程中相等的值也可能占用该位置
+        item_positions = index_map[item]
+        item_positions.discard(index)
+        child = (index << 1) | 1
+        while child < size:
+            right_child = child + 1
+            if right_child < size and data[right_child] < data[child]:
+                child = right_child
+            child_item = data[child]
+            if not child_item < item:
                 break
-            
-            self.data[index], self.data[smallest] = self.data[smallest], self.data[index]
-            index = smallest
+            data[index] = child_item
+            positions = index_map[child_item]
+            positions.discard(child)
+            positions.add(index)
+            index = child
+            child = (index << 1) | 1
+        data[index] = item
+        item_positions.add(index)
+    
+    def _heapify_to_bottom(self, index: int):
+        """先沉到底再上浮
+        
+        用于从末尾换来的元素：这类元素通常会沉到接近底部，逐层与它比较大多是白费。
+        这里让空位沿更小的子节点一路下沉到叶子（每层只比较两个子节点），
+        再把元素从叶子处上浮，总比较次数更少。
+        
+        Args:
+            index: 要堆化的位置
+        """
+        data = self.data
+        index_map = self._index
+        size = len(data)
+        item = data[index]
+        # 先摘掉被移动元素的原位置，移动过程中相等的值也可能占用该位置
+        item_positions = index_map[item]
+        item_positions.discard(index)
+        child = (index << 1) | 1
+        while child < size:
+            right_child = child + 1
+            if right_child < size and data[right_child] < data[child]:
+                child = right_child
+            child_item = data[child]
+            data[index] = child_item
+            positions = index_map[child_item]
+            positions.discard(child)
+            positions.add(index)
+            index = child
+            child = (index << 1) | 1
+        data[index] = item
+        item_positions.add(index)
+        self._heapify_up(index)
     
-    def build_heap(self, items: List[Any]):
+    def build_heap(self, items: Iterable[Any], take_ownership: bool = False):
         """从列表构建堆
         
         Args:
-            items: 要构建堆的元素列表
+            items: 要构建堆的元素（列表或任意可迭代对象）
+            take_ownership: 为True且items是列表时直接接管该列表并原地堆化，
+                省去一次复制；调用方此后不应再使用该列表
         """
-        self.data = items.copy()
-        self.size = len(items)
+        self.data = items if take_ownership and type(items) is list else list(items)
         
-        # 从最后一个非叶子节点开始向下堆化
-        for i in range(self.size // 2 - 1, -1, -1):
-            self._heapify_down(i)
+        # heapq.heapify 同样自底向上堆化，O(n)，但循环在C中完成
+        heapq.heapify(self.data)
+        
+        # 堆化完成后一次遍历重建索引，O(n)
+        self._rebuild_index()
         
         self.operation_count += 1
         self.modification_count += 1
-        self.logger.info(f"从列表构建堆，共 {self.size} 个元素")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"从列表构建堆，共 {self.size} 个元素")
     
     @property
     def is_empty(self) -> bool:
         """检查堆是否为空"""
-        return self.size == 0
+        return not self.data
+    
+    @is_empty.setter
+    def is_empty(self, value: bool):
+        # 基类初始化时会写入 is_empty，空与否只由 data 决定，忽略即可
+        pass
     
     def __len__(self) -> int:
         """返回堆的大小"""
-        return self.size
+        return len(self.data)
+    
+    def __contains__(self, item: Any) -> bool:
+        """检查元素是否在堆中（查索引，O(1)）"""
+        return item in self._index
     
     def __iter__(self) -> Iterator[Any]:
         """支持迭代"""
@@ -277,13 +537,28 @@ class MaxHeap(DataStructureBase):
     - 父节点值大于等于子节点值
     - 根节点是最大值
     - 插入和删除都是 O(log n)
+    - 维护 值 -> 下标集合 的索引，按值搜索为 O(1)，按值删除、更新为 O(log n)
+      （元素需可哈希）
     """
     
+    __slots__ = ('data', '_index')
+    
     def __init__(self):
         """初始化最大堆"""
         super().__init__("MaxHeap", DataStructureType.HEAP)
         self.data = []
-        self.size = 0
+        # 值 -> 该值所在下标的集合；堆中每次移动元素都同步更新
+        self._index = defaultdict(set)
+    
+    @property
+    def size(self) -> int:
+        """元素个数，直接由底层列表得出，不再单独维护计数"""
+        return len(self.data)
+    
+    @size.setter
+    def size(self, value: int):
+        # 基类初始化时会写入 size，元素个数只由 data 决定，忽略即可
+        pass
     
     def insert(self, item: Any, **kwargs) -> bool:
         """插入元素
@@ -295,20 +570,62 @@ class MaxHeap(DataStructureBase):
         Returns:
             插入是否成功
         """
+        # 元素必须可哈希才能登记到索引中，在修改堆之前检查
         try:
-            self.data.append(item)
-            self.size += 1
-            self._heapify_up(self.size - 1)
+            self._index[item].add(len(self.data))
+        except TypeError as e:
+            self.logger.error(f"插入元素失败: {e}")
+            return False
+        
+        self.data.append(item)
+        self._heapify_up(len(self.data) - 1)
+        
+        self.operation_count += 1
+        self.modification_count += 1
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"插入元素 {item}")
+        return True
+    
+    def push_many(self, items: Iterable[Any]) -> int:
+        """批量插入元素
+        
+        新元素先全部追加到末尾：数量超过原有元素的一半时整体重新堆化（O(n)），
+        否则逐个上浮（每个 O(log n)），取两者中代价较小的一种。
+        
+        Args:
+            items: 要插入的元素（任意可迭代对象）
+            
+        Returns:
+            插入的元素个数
+        """
+        try:
+            items = list(items)
+            count = len(items)
+            old_size = len(self.data)
+            if count:
+                _check_items(items, self.data[0] if self.data else items[0])
+            self.data.extend(items)
+            
+            if count > old_size // 2:
+                _heapify_max(self.data)
+                self._rebuild_index()
+            else:
+                index_map = self._index
+                for i in range(old_size, len(self.data)):
+                    index_map[self.data[i]].add(i)
+                    self._heapify_up(i)
             
             self.operation_count += 1
-            self.modification_count += 1
+            self.modification_count += count
             
-            self.logger.info(f"插入元素 {item}")
-            return True
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"批量插入 {count} 个元素")
+            return count
             
         except Exception as e:
-            self.logger.error(f"插入元素失败: {e}")
-            return False
+            self.logger.error(f"批量插入元素失败: {e}")
+            return 0
     
     def delete(self, item: Any, **kwargs) -> bool:
         """删除元素
@@ -320,36 +637,25 @@ class MaxHeap(DataStructureBase):
         Returns:
             删除是否成功
         """
+        # 通过索引直接取得要删除的元素位置
         try:
-            # 找到要删除的元素位置
-            index = -1
-            for i, val in enumerate(self.data):
-                if val == item:
-                    index = i
-                    break
-            
-            if index == -1:
-                self.logger.warning(f"未找到要删除的元素 {item}")
-                return False
-            
-            # 将最后一个元素移到删除位置
-            self.data[index] = self.data[-1]
-            self.data.pop()
-            self.size -= 1
-            
-            # 如果还有元素，进行堆化
-            if self.size > 0:
-                self._heapify_down(index)
-            
-            self.operation_count += 1
-            self.modification_count += 1
-            
-            self.logger.info(f"删除元素 {item}")
-            return True
-            
-        except Exception as e:
+            positions = self._index.get(item)
+        except TypeError as e:
             self.logger.error(f"删除元素失败: {e}")
             return False
+        
+        if not positions:
+            self.logger.warning(f"未找到要删除的元素 {item}")
+            return False
+        
+        self._remove_at(next(iter(positions)))
+        
+        self.operation_count += 1
+        self.modification_count += 1
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"删除元素 {item}")
+        return True
     
     def extract_max(self) -> Optional[Any]:
         """提取最大值
@@ -361,8 +667,9 @@ class MaxHeap(DataStructureBase):
             self.logger.warning("堆为空，无法提取最大值")
             return None
         
-        max_value = self.data[0]
-        self.delete(max_value)
+        max_value = self._remove_at(0)
+        self.operation_count += 1
+        self.modification_count += 1
         return max_value
     
     def peek_max(self) -> Optional[Any]:
@@ -385,22 +692,26 @@ class MaxHeap(DataStructureBase):
             item: 要搜索的元素
             
         Returns:
-            元素的位置，如果未找到返回None
+            元素的位置（有重复值时为其中任意一个），如果未找到返回None
         """
+        # 查索引而不是扫描数组，只访问一次
+        self.access_count += 1
         try:
-            for i, val in enumerate(self.data):
-                self.access_count += 1
-                if val == item:
-                    self.operation_count += 1
-                    self.logger.info(f"找到元素 {item} 在位置 {i}")
-                    return i
-            
-            self.logger.info(f"未找到元素 {item}")
-            return None
-            
-        except Exception as e:
+            positions = self._index.get(item)
+        except TypeError as e:
             self.logger.error(f"搜索元素失败: {e}")
             return None
+        
+        if positions:
+            i = next(iter(positions))
+            self.operation_count += 1
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"找到元素 {item} 在位置 {i}")
+            return i
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"未找到元素 {item}")
+        return None
     
     def update(self, old_item: Any, new_item: Any) -> bool:
         """更新元素
@@ -413,95 +724,212 @@ class MaxHeap(DataStructureBase):
             更新是否成功
         """
         try:
-            index = self.search(old_item)
-            if index is not None:
-                self.data[index] = new_item
-                
-                # 根据新值的大小决定向上或向下堆化
-                if new_item > old_item:
-                    self._heapify_up(index)
-                else:
-                    self._heapify_down(index)
-                
-                self.operation_count += 1
-                self.modification_count += 1
-                self.logger.info(f"更新元素: {old_item} -> {new_item}")
-                return True
-            else:
-                self.logger.warning(f"未找到要更新的元素 {old_item}")
-                return False
-                
-        except Exception as e:
+            hash(new_item)
+        except TypeError as e:
             self.logger.error(f"更新元素失败: {e}")
             return False
+        
+        index = self.search(old_item)
+        if index is not None:
+            self._discard_position(old_item, index)
+            self._index[new_item].add(index)
+            self.data[index] = new_item
+            
+            # 根据新值的大小决定向上或向下堆化
+            if new_item > old_item:
+                self._heapify_up(index)
+            else:
+                self._heapify_down(index)
+            
+            self.operation_count += 1
+            self.modification_count += 1
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"更新元素: {old_item} -> {new_item}")
+            return True
+        else:
+            self.logger.warning(f"未找到要更新的元素 {old_item}")
+            return False
     
     def clear(self):
         """清空堆"""
         self.data.clear()
-        self.size = 0
+        self._index.clear()
         self.operation_count += 1
         self.logger.info("最大堆已清空")
     
+    def _discard_position(self, item: Any, index: int):
+        """从索引中移除 item 位于 index 的记录，集合为空时删除该键"""
+        positions = self._index[item]
+        positions.discard(index)
+        if not positions:
+            del self._index[item]
+    
+    def _rebuild_index(self):
+        """按当前数组一次遍历重建 值 -> 下标集合 的索引，O(n)"""
+        index_map = defaultdict(set)
+        for i, item in enumerate(self.data):
+            index_map[item].add(i)
+        self._index = index_map
+    
+    def _remove_at(self, index: int) -> Any:
+        """移除并返回 index 处的元素，同时维护堆性质和索引
+        
+        Args:
+            index: 要移除的位置
+            
+        Returns:
+            被移除的元素
+        """
+        data = self.data
+        item = data[index]
+        self._discard_position(item, index)
+        
+        # 弹出末尾元素填入删除位置；删除的恰好是末尾时无需堆化
+        last = data.pop()
+        size = len(data)
+        if index < size:
+            positions = self._index[last]
+            positions.discard(size)
+            positions.add(index)
+            data[index] = last
+            # 末尾元素通常要沉到接近底部，先沉到底再上浮（也覆盖需要上浮的情况）
+            self._heapify_to_bottom(index)
+        return item
+    
     def _heapify_up(self, index: int):
         """向上堆化
         
+        采用"空位"上移：先取出待上移的元素，父节点逐层下移填入空位，
+        最后一次性写回该元素，避免每层交换两个位置。
+        每次移动元素都同步更新索引。
+        
         Args:
             index: 要堆化的位置
         """
-        parent = (index - 1) // 2
-        while index > 0 and self.data[index] > self.data[parent]:
-            self.data[index], self.data[parent] = self.data[parent], self.data[index]
+        data = self.data
+        index_map = self._index
+        item = data[index]
+        # 先摘掉被移动元素的原位置，移动过程中相等的值也可能占用该位置
+        item_positions = index_map[item]
+        item_positions.discard(index)
+        while index > 0:
+            parent = (index - 1) >> 1
+            parent_item = data[parent]
+            if not item > parent_item:
+                break
+            data[index] = parent_item
+            positions = index_map[parent_item]
+            positions.discard(parent)
+            positions.add(index)
             index = parent
-            parent = (index - 1) // 2
+        data[index] = item
+        item_positions.add(index)
     
     def _heapify_down(self, index: int):
         """向下堆化
         
+        采用"空位"下移：与更大的子节点比较的始终是被下移的元素，
+        子节点逐层上移填入空位，最后一次性写回该元素。
+        每次移动元素都同步更新索引。
+        
         Args:
             index: 要堆化的位置
         """
-        while True:
-            largest = index
-            left_child = 2 * index + 1
-            right_child = 2 * index + 2
-            
-            if left_child < self.size and self.data[left_child] > self.data[largest]:
-                largest = left_child
-            
-            if right_child < self.size and self.data[right_child] > self.data[largest]:
-                largest = right_child
-            
-            if largest == index:
+        data = self.data
+        index_map = self._index
+        size = len(data)
+        item = data[index]
+        # 先摘掉被移动元素的原位置，移动过程中相等的值也可能占用该位置
+        item_positions = index_map[item]
+        item_positions.discard(index)
+        child = (index << 1) | 1
+        while child < size:
+            right_child = child + 1
+            if right_child < size and data[right_child] > data[child]:
+                child = right_child
+            child_item = data[child]
+            if not child_item > item:
                 break
-            
-            self.data[index], self.data[largest] = self.data[largest], self.data[index]
-            index = largest
+            data[index] = child_item
+            positions = index_map[child_item]
+            positions.discard(child)
+            positions.add(index)
+            index = child
+            child = (index << 1) | 1
+        data[index] = item
+        item_positions.add(index)
+    
+    def _heapify_to_bottom(self, index: int):
+        """先沉到底再上浮
+        
+        用于从末尾换来的元素：这类元素通常会沉到接近底部，逐层与它比较大多是白费。
+        这里让空位沿更大的子节点一路下沉到叶子（每层只比较两个子节点），
+        再把元素从叶子处上浮，总比较次数更少。
+        
+        Args:
+            index: 要堆化的位置
+        """
+        data = self.data
+        index_map = self._index
+        size = len(data)
+        item = data[index]
+        # 先摘掉被移动元素的原位置，移动过程中相等的值也可能占用该位置
+        item_positions = index_map[item]
+        item_positions.discard(index)
+        child = (index << 1) | 1
+        while child < size:
+            right_child = child + 1
+            if right_child < size and data[right_child] > data[child]:
+                child = right_child
+            child_item = data[child]
+            data[index] = child_item
+            positions = index_map[child_item]
+            positions.discard(child)
+            positions.add(index)
+            index = child
+            child = (index << 1) | 1
+        data[index] = item
+        item_positions.add(index)
+        self._heapify_up(index)
     
-    def build_heap(self, items: List[Any]):
+    def build_heap(self, items: Iterable[Any], take_ownership: bool = False):
         """从列表构建堆
         
         Args:
-            items: 要构建堆的元素列表
+            items: 要构建堆的元素（列表或任意可迭代对象）
+            take_ownership: 为True且items是列表时直接接管该列表并原地堆化，
+                省去一次复制；调用方此后不应再使用该列表
         """
-        self.data = items.copy()
-        self.size = len(items)
+        self.data = items if take_ownership and type(items) is list else list(items)
         
-        # 从最后一个非叶子节点开始向下堆化
-        for i in range(self.size // 2 - 1, -1, -1):
-            self._heapify_down(i)
+        # 自底向上堆化，O(n)，循环在C中完成
+        _heapify_max(self.data)
+        
+        # 堆化完成后一次遍历重建索引，O(n)
+        self._rebuild_index()
         
         self.operation_count += 1
         self.modification_count += 1
-        self.logger.info(f"从列表构建堆，共 {self.size} 个元素")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"从列表构建堆，共 {self.size} 个元素")
     
     @property
     def is_empty(self) -> bool:
         """检查堆是否为空"""
-        return self.size == 0
+        return not self.data
+    
+    @is_empty.setter
+    def is_empty(self, value: bool):
+        # 基类初始化时会写入 is_empty，空与否只由 data 决定，忽略即可
+        pass
     
     def __len__(self) -> int:
         """返回堆的大小"""
-        return self.size
+        return len(self.data)
+    
+    def __contains__(self, item: Any) -> bool:
+        """检查元素是否在堆中（查索引，O(1)）"""
+        return item in self._index
     
     def __iter__(self) -> Iterator[Any]:
         """支持迭代"""
@@ -526,4 +954,314 @@ class MaxHeap(DataStructureBase):
             'operation_count': self.operation_count,
             'access_count': self.access_count,
             'modification_count': self.modification_count
-        } 
\ No newline at end of file
+        } 
+
+
+class NumericMinHeap(DataStructureBase):
+    """数值最小堆实现
+    
+    特性：
+    - 4叉堆：下标 i 的子节点为 4i+1 ~ 4i+4，父节点为 (i-1)//4
+    - 元素为同一数值类型（默认 float64），存放在预分配的 numpy 数组中
+    - 元素连续存储、不装箱，下沉时顺序读取相邻的8字节数值
+    - 容量不足时按倍数扩容，压入元素不产生逐个的对象分配
+    - 插入和删除都是 O(log n)
+    """
+    
+    __slots__ = ('data', 'capacity')
+    
+    def __init__(self, initial_capacity: int = 16, dtype: Any = np.float64):
+        """初始化数值最小堆
+        
+        Args:
+            initial_capacity: 初始容量
+            dtype: 元素的 numpy 数值类型，如 np.float64、np.int64
+        """
+        super().__init__("NumericMinHeap", DataStructureType.HEAP)
+        self.capacity = max(initial_capacity, 1)
+        self.data = np.empty(self.capacity, dtype=dtype)
+    
+    @classmethod
+    def from_numpy(cls, buffer: np.ndarray, size: Optional[int] = None) -> 'NumericMinHeap':
+        """以已有的 numpy 数组作为底层存储创建堆（不复制）
+        
+        Args:
+            buffer: 一维数值数组，其长度即为初始容量
+            size: 数组前 size 个元素为堆中的元素，默认为整个数组
+            
+        Returns:
+            原地堆化后的数值最小堆
+        """
+        heap = cls(1, dtype=buffer.dtype)
+        heap.data = buffer
+        heap.capacity = len(buffer)
+        heap.size = len(buffer) if size is None else size
+        _heapify_kernel(buffer, heap.size)
+        return heap
+    
+    def insert(self, item: Any, **kwargs) -> bool:
+        """插入元素
+        
+        Args:
+            item: 要插入的数值
+            **kwargs: 额外参数
+            
+        Returns:
+            插入是否成功
+        """
+        try:
+            # 先转换元素类型：转换失败时堆保持不变
+            value = self._to_element(item)
+            if self.size >= self.capacity:
+                self._resize(self.capacity * 2)
+            
+            self.data[self.size] = value
+            _sift_up_kernel(self.data, self.size)
+            self.size += 1
+            
+            self.operation_count += 1
+            self.modification_count += 1
+            
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"插入元素 {item}")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"插入元素失败: {e}")
+            return False
+    
+    def delete(self, item: Any, **kwargs) -> bool:
+        """删除元素
+        
+        Args:
+            item: 要删除的数值
+            **kwargs: 额外参数
+            
+        Returns:
+            删除是否成功
+        """
+        try:
+            index = self._find_index(item)
+            if index < 0:
+                self.logger.warning(f"未找到要删除的元素 {item}")
+                return False
+            
+            self._remove_at(index)
+            self.operation_count += 1
+            self.modification_count += 1
+            
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"删除元素 {item}")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"删除元素失败: {e}")
+            return False
+    
+    def extract_min(self) -> Optional[Any]:
+        """提取最小值
+        
+        Returns:
+            最小值，如果堆为空返回None
+        """
+        if self.size == 0:
+            self.logger.warning("堆为空，无法提取最小值")
+            return None
+        
+        min_value = self.data[0].item()
+        self._remove_at(0)
+        self.operation_count += 1
+        self.modification_count += 1
+        return min_value
+    
+    def peek_min(self) -> Optional[Any]:
+        """查看最小值
+        
+        Returns:
+            最小值，如果堆为空返回None
+        """
+        if self.size == 0:
+            self.logger.warning("堆为空，无法查看最小值")
+            return None
+        
+        self.access_count += 1
+        return self.data[0].item()
+    
+    def search(self, item: Any) -> Optional[int]:
+        """搜索元素
+        
+        Args:
+            item: 要搜索的数值
+            
+        Returns:
+            元素的位置，如果未找到返回None
+        """
+        try:
+            index = self._find_index(item)
+            self.access_count += 1
+            if index >= 0:
+                self.operation_count += 1
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(f"找到元素 {item} 在位置 {index}")
+                return index
+            
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"未找到元素 {item}")
+            return None
+            
+        except Exception as e:
+            self.logger.error(f"搜索元素失败: {e}")
+            return None
+    
+    def update(self, old_item: Any, new_item: Any) -> bool:
+        """更新元素
+        
+        Args:
+            old_item: 旧数值
+            new_item: 新数值
+            
+        Returns:
+            更新是否成功
+        """
+        try:
+            value = self._to_element(new_item)
+            index = self._find_index(old_item)
+            if index < 0:
+                self.logger.warning(f"未找到要更新的元素 {old_item}")
+                return False
+            
+            old_value = self.data[index]
+            self.data[index] = value
+            # 根据新值的大小决定向上或向下堆化
+            if value < old_value:
+                _sift_up_kernel(self.data, index)
+            else:
+                _sift_down_kernel(self.data, index, self.size)
+            
+            self.operation_count += 1
+            self.modification_count += 1
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"更新元素: {old_item} -> {new_item}")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"更新元素失败: {e}")
+            return False
+    
+    def build_heap(self, items: Iterable[Any]):
+        """从数值序列构建堆（复制到自有存储后自底向上堆化）
+        
+        Args:
+            items: 要构建堆的数值
+        """
+        values = np.asarray(items, dtype=self.data.dtype).ravel()
+        self.capacity = max(len(values), 1)
+        self.data = np.empty(self.capacity, dtype=values.dtype)
+        self.data[:len(values)] = values
+        self.size = len(values)
+        _heapify_kernel(self.data, self.size)
+        
+        self.operation_count += 1
+        self.modification_count += 1
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"从序列构建堆，共 {self.size} 个元素")
+    
+    def clear(self):
+        """清空堆（保留已分配的存储）"""
+        self.size = 0
+        self.operation_count += 1
+        self.logger.info("数值最小堆已清空")
+    
+    def _to_element(self, item: Any) -> Any:
+        """把元素转换为底层数组的数值类型，拒绝有损的转换（如整数堆中的 2.7）
+        
+        Args:
+            item: 要存放的数值
+            
+        Returns:
+            转换后的数值
+            
+        Raises:
+            ValueError: 元素无法无损转换为数组的数值类型
+        """
+        dtype = self.data.dtype
+        try:
+            value = dtype.type(item)
+            # NaN 与自身不相等，单独放行
+            lossless = np.ndim(value) == 0 and (bool(value == item) or (value != value and item != item))
+        except (TypeError, ValueError, OverflowError):
+            lossless = False
+        if not lossless:
+            raise ValueError(f"元素 {item!r} 无法无损转换为 {dtype}")
+        return value
+    
+    def _find_index(self, item: Any) -> int:
+        """查找元素位置，未找到返回 -1"""
+        matches = np.flatnonzero(self.data[:self.size] == item)
+        return int(matches[0]) if len(matches) else -1
+    
+    def _remove_at(self, index: int):
+        """删除指定位置的元素：末尾元素填入空位后先沉到底再上浮"""
+        self.size -= 1
+        if index < self.size:
+            data = self.data
+            data[index] = data[self.size]
+            _sift_to_bottom_kernel(data, index, self.size)
+    
+    def _resize(self, new_capacity: int):
+        """调整底层数组容量
+        
+        Args:
+            new_capacity: 新容量
+        """
+        new_data = np.empty(new_capacity, dtype=self.data.dtype)
+        new_data[:self.size] = self.data[:self.size]
+        self.data = new_data
+        self.capacity = new_capacity
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"堆容量调整为 {new_capacity}")
+    
+    @property
+    def is_empty(self) -> bool:
+        """检查堆是否为空"""
+        return self.size == 0
+    
+    @is_empty.setter
+    def is_empty(self, value: bool):
+        # 基类初始化时会写入 is_empty，空与否只由 size 决定，忽略即可
+        pass
+    
+    def __len__(self) -> int:
+        """返回堆的大小"""
+        return self.size
+    
+    def __iter__(self) -> Iterator[Any]:
+        """支持迭代（按存储顺序）"""
+        return iter(self.data[:self.size].tolist())
+    
+    def __contains__(self, item: Any) -> bool:
+        """检查数值是否在堆中"""
+        return self._find_index(item) >= 0
+    
+    def __str__(self) -> str:
+        """字符串表示"""
+        return f"NumericMinHeap(size={self.size}, data={self.data[:self.size].tolist()})"
+    
+    def __repr__(self) -> str:
+        """详细字符串表示"""
+        return self.__str__()
+    
+    def get_stats(self) -> dict:
+        """获取统计信息"""
+        return {
+            'name': self.name,
+            'type': self.data_type.value,
+            'size': self.size,
+            'capacity': self.capacity,
+            'dtype': str(self.data.dtype),
+            'is_empty': self.is_empty,
+            'operation_count': self.operation_count,
+            'access_count': self.access_count,
+            'modification_count': self.modification_count
+        }
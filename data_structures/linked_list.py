@@ -5,6 +5,7 @@
 本实现包括单向链表和双向链表的基本操作。
 """
 
+import logging
 from typing import Any, Optional, Iterator
 from core.data_structures import DataStructureBase, DataStructureType
 
@@ -12,6 +13,8 @@ from core.data_structures import DataStructureBase, DataStructureType
 class Node:
     """链表节点类"""
     
+    __slots__ = ('data', 'next')
+    
     def __init__(self, data: Any, next_node: Optional['Node'] = None):
         """初始化节点
         
@@ -39,6 +42,8 @@ class LinkedList(DataStructureBase):
     - 内存不连续
     """
     
+    __slots__ = ('head', 'tail')
+    
     def __init__(self):
         """初始化链表"""
         super().__init__("LinkedList", DataStructureType.LINKED_LIST)
@@ -56,44 +61,79 @@ class LinkedList(DataStructureBase):
         Returns:
             插入是否成功
         """
-        try:
-            if position is None:
-                position = 0
-                
-            if position < 0 or position > self.size:
-                self.logger.error(f"插入位置 {position} 超出范围")
-                return False
-            
-            new_node = Node(item)
+        if position is None:
+            position = 0
             
-            if position == 0:
-                # 插入到头部
-                new_node.next = self.head
-                self.head = new_node
-                if self.tail is None:
-                    self.tail = new_node
-            else:
-                # 插入到指定位置
-                current = self.head
-                for _ in range(position - 1):
-                    current = current.next
-                
-                new_node.next = current.next
-                current.next = new_node
-                
-                if new_node.next is None:
-                    self.tail = new_node
+        if position < 0 or position > self.size:
+            self.logger.error(f"插入位置 {position} 超出范围")
+            return False
+        
+        new_node = Node(item)
+        
+        if position == 0:
+            # 插入到头部
+            new_node.next = self.head
+            self.head = new_node
+            if self.tail is None:
+                self.tail = new_node
+        elif position == self.size:
+            # 追加到尾部：直接使用尾指针，无需从头遍历
+            self.tail.next = new_node
+            self.tail = new_node
+        else:
+            # 插入到指定位置
+            current = self.head
+            for _ in range(position - 1):
+                current = current.next
             
-            self.size += 1
-            self.operation_count += 1
-            self.modification_count += 1
+            new_node.next = current.next
+            current.next = new_node
             
+            if new_node.next is None:
+                self.tail = new_node
+        
+        self.size += 1
+        self.operation_count += 1
+        self.modification_count += 1
+        
+        if self.logger.isEnabledFor(logging.INFO):
             self.logger.info(f"在位置 {position} 插入元素 {item}")
-            return True
+        return True
+    
+    def append(self, item: Any) -> bool:
+        """追加元素到尾部，O(1)
+        
+        Args:
+            item: 要追加的元素
             
-        except Exception as e:
-            self.logger.error(f"插入元素失败: {e}")
-            return False
+        Returns:
+            追加是否成功
+        """
+        return self.insert(item, position=self.size)
+    
+    def pop_front(self) -> Optional[Any]:
+        """弹出头部元素，O(1)
+        
+        直接摘下头节点，不必先按位置读取再按位置删除。
+        
+        Returns:
+            头部元素，如果链表为空返回None
+        """
+        head = self.head
+        if head is None:
+            self.logger.warning("链表为空，无法弹出头部元素")
+            return None
+        
+        self.head = head.next
+        if self.head is None:
+            self.tail = None
+        self.size -= 1
+        self.operation_count += 1
+        self.modification_count += 1
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"弹出头部元素 {head.data}")
+        return head.data
     
     def delete(self, item: Any, **kwargs) -> bool:
         """删除元素
@@ -105,70 +145,71 @@ class LinkedList(DataStructureBase):
         Returns:
             删除是否成功
         """
-        try:
-            position = kwargs.get('position', None)
+        position = kwargs.get('position', None)
+        
+        if position is not None:
+            # 按位置删除
+            if position < 0 or position >= self.size:
+                self.logger.error(f"删除位置 {position} 超出范围")
+                return False
             
-            if position is not None:
-                # 按位置删除
-                if position < 0 or position >= self.size:
-                    self.logger.error(f"删除位置 {position} 超出范围")
-                    return False
-                
-                if position == 0:
-                    # 删除头部
-                    self.head = self.head.next
-                    if self.head is None:
-                        self.tail = None
-                else:
-                    # 删除指定位置
-                    current = self.head
-                    for _ in range(position - 1):
-                        current = current.next
-                    
-                    current.next = current.next.next
-                    if current.next is None:
-                        self.tail = current
+            if position == 0:
+                # 删除头部
+                self.head = self.head.next
+                if self.head is None:
+                    self.tail = None
+            else:
+                # 删除指定位置
+                current = self.head
+                for _ in range(position - 1):
+                    current = current.next
                 
+                current.next = current.next.next
+                if current.next is None:
+                    self.tail = current
+            
+            self.size -= 1
+            self.operation_count += 1
+            self.modification_count += 1
+            
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"删除位置 {position} 的元素")
+            return True
+        else:
+            # 按值删除
+            if self.head is None:
+                return False
+            
+            if self.head.data == item:
+                # 删除头部
+                self.head = self.head.next
+                if self.head is None:
+                    self.tail = None
                 self.size -= 1
                 self.operation_count += 1
                 self.modification_count += 1
-                
-                self.logger.info(f"删除位置 {position} 的元素")
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(f"删除头部元素 {item}")
                 return True
-            else:
-                # 按值删除
-                if self.head is None:
-                    return False
-                
-                if self.head.data == item:
-                    # 删除头部
-                    self.head = self.head.next
-                    if self.head is None:
-                        self.tail = None
+            
+            # 前驱和当前节点都放在局部变量里，每轮只读取一次 next
+            prev = self.head
+            current = prev.next
+            while current is not None:
+                if current.data == item:
+                    prev.next = current.next
+                    if prev.next is None:
+                        self.tail = prev
                     self.size -= 1
                     self.operation_count += 1
                     self.modification_count += 1
-                    self.logger.info(f"删除头部元素 {item}")
-                    return True
-                
-                current = self.head
-                while current.next is not None:
-                    if current.next.data == item:
-                        current.next = current.next.next
-                        if current.next is None:
-                            self.tail = current
-                        self.size -= 1
-                        self.operation_count += 1
-                        self.modification_count += 1
+                    if self.logger.isEnabledFor(logging.INFO):
                         self.logger.info(f"删除元素 {item}")
-                        return True
-                    current = current.next
-                
-                self.logger.warning(f"未找到要删除的元素 {item}")
-                return False
-                
-        except Exception as e:
-            self.logger.error(f"删除元素失败: {e}")
+                    return True
+                prev = current
+                current = current.next
+            
+            self.logger.warning(f"未找到要删除的元素 {item}")
             return False
     
     def search(self, item: Any) -> Optional[int]:
@@ -180,25 +221,24 @@ class LinkedList(DataStructureBase):
         Returns:
             元素的位置，如果未找到返回None
         """
-        try:
-            current = self.head
-            position = 0
-            
-            while current is not None:
-                self.access_count += 1
-                if current.data == item:
-                    self.operation_count += 1
+        current = self.head
+        position = 0
+        
+        while current is not None:
+            if current.data == item:
+                # 访问次数在扫描结束后一次性累加
+                self.access_count += position + 1
+                self.operation_count += 1
+                if self.logger.isEnabledFor(logging.INFO):
                     self.logger.info(f"找到元素 {item} 在位置 {position}")
-                    return position
-                current = current.next
-                position += 1
-            
+                return position
+            current = current.next
+            position += 1
+        
+        self.access_count += position
+        if self.logger.isEnabledFor(logging.INFO):
             self.logger.info(f"未找到元素 {item}")
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"搜索元素失败: {e}")
-            return None
+        return None
     
     def update(self, old_item: Any, new_item: Any) -> bool:
         """更新元素
@@ -210,24 +250,20 @@ class LinkedList(DataStructureBase):
         Returns:
             更新是否成功
         """
-        try:
-            current = self.head
-            
-            while current is not None:
-                if current.data == old_item:
-                    current.data = new_item
-                    self.operation_count += 1
-                    self.modification_count += 1
+        current = self.head
+        
+        while current is not None:
+            if current.data == old_item:
+                current.data = new_item
+                self.operation_count += 1
+                self.modification_count += 1
+                if self.logger.isEnabledFor(logging.INFO):
                     self.logger.info(f"更新元素: {old_item} -> {new_item}")
-                    return True
-                current = current.next
-            
-            self.logger.warning(f"未找到要更新的元素 {old_item}")
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"更新元素失败: {e}")
-            return False
+                return True
+            current = current.next
+        
+        self.logger.warning(f"未找到要更新的元素 {old_item}")
+        return False
     
     def get(self, index: int) -> Optional[Any]:
         """获取指定位置的元素
@@ -269,7 +305,8 @@ class LinkedList(DataStructureBase):
         
         current.data = value
         self.modification_count += 1
-        self.logger.info(f"设置位置 {index} 的值为 {value}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"设置位置 {index} 的值为 {value}")
         return True
     
     def clear(self):
@@ -300,6 +337,16 @@ class LinkedList(DataStructureBase):
         self.modification_count += 1
         self.logger.info("链表已反转")
     
+    @property
+    def is_empty(self) -> bool:
+        """检查链表是否为空"""
+        return self.size == 0
+    
+    @is_empty.setter
+    def is_empty(self, value: bool):
+        # 基类初始化时会写入 is_empty，空与否只由 size 决定，忽略即可
+        pass
+    
     def __len__(self) -> int:
         """返回链表长度"""
         return self.size
@@ -319,14 +366,18 @@ class LinkedList(DataStructureBase):
             yield current.data
             current = current.next
     
-    def __str__(self) -> str:
-        """字符串表示"""
-        elements = []
+    def __contains__(self, item: Any) -> bool:
+        """检查元素是否在链表中"""
         current = self.head
         while current is not None:
-            elements.append(str(current.data))
+            if current.data == item:
+                return True
             current = current.next
-        return f"LinkedList(size={self.size}, data=[{', '.join(elements)}])"
+        return False
+    
+    def __str__(self) -> str:
+        """字符串表示"""
+        return f"LinkedList(size={self.size}, data=[{', '.join(map(str, self))}])"
     
     def __repr__(self) -> str:
         """详细字符串表示"""
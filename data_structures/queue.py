@@ -2,12 +2,13 @@
 队列数据结构实现
 
 队列是一种先进先出(FIFO)的数据结构，类似于现实生活中的排队。
-本实现基于链表，提供入队、出队、查看队首等基本操作。
+本实现基于 collections.deque（两端操作均为 O(1)），提供入队、出队、查看队首等基本操作。
 """
 
-from typing import Any, Optional
+import logging
+from collections import deque
+from typing import Any, Optional, List, Iterable, Iterator
 from core.data_structures import DataStructureBase, DataStructureType
-from .linked_list import LinkedList
 
 
 class Queue(DataStructureBase):
@@ -20,10 +21,12 @@ class Queue(DataStructureBase):
     - 查看队首 O(1)
     """
     
+    __slots__ = ('data',)
+    
     def __init__(self):
         """初始化队列"""
         super().__init__("Queue", DataStructureType.QUEUE)
-        self.data = LinkedList()
+        self.data = deque()
     
     def enqueue(self, item: Any) -> bool:
         """入队操作
@@ -36,6 +39,51 @@ class Queue(DataStructureBase):
         """
         return self.insert(item)
     
+    def enqueue_many(self, items: Iterable[Any]) -> int:
+        """批量入队
+        
+        通过 deque.extend 在C中一次性追加全部元素，计数器只更新一次。
+        
+        Args:
+            items: 要入队的元素（任意可迭代对象）
+            
+        Returns:
+            入队的元素个数
+        """
+        before = len(self.data)
+        self.data.extend(items)
+        count = len(self.data) - before
+        
+        self.operation_count += 1
+        self.modification_count += count
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"批量入队 {count} 个元素")
+        return count
+    
+    def dequeue_many(self, n: int) -> List[Any]:
+        """批量出队
+        
+        Args:
+            n: 要出队的元素个数，超过队列长度时取出全部元素
+            
+        Returns:
+            按出队顺序排列的元素列表
+        """
+        count = min(max(n, 0), len(self.data))
+        if count == len(self.data):
+            # 全部出队时直接整体转换并清空，省去逐个 popleft
+            items = list(self.data)
+            self.data.clear()
+        else:
+            popleft = self.data.popleft
+            items = [popleft() for _ in range(count)]
+        
+        self.operation_count += 1
+        self.modification_count += count
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"批量出队 {count} 个元素")
+        return items
+    
     def dequeue(self) -> Optional[Any]:
         """出队操作
         
@@ -46,11 +94,11 @@ class Queue(DataStructureBase):
             self.logger.warning("队列为空，无法出队")
             return None
         
-        front_item = self.data.get(0)
-        self.data.delete(front_item, position=0)
+        front_item = self.data.popleft()
         self.operation_count += 1
         self.modification_count += 1
-        self.logger.info(f"出队元素: {front_item}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"出队元素: {front_item}")
         return front_item
     
     def front(self) -> Optional[Any]:
@@ -63,9 +111,10 @@ class Queue(DataStructureBase):
             self.logger.warning("队列为空，无法查看队首")
             return None
         
-        front_item = self.data.get(0)
+        front_item = self.data[0]
         self.access_count += 1
-        self.logger.info(f"查看队首元素: {front_item}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"查看队首元素: {front_item}")
         return front_item
     
     def back(self) -> Optional[Any]:
@@ -78,9 +127,10 @@ class Queue(DataStructureBase):
             self.logger.warning("队列为空，无法查看队尾")
             return None
         
-        back_item = self.data.get(len(self.data) - 1)
+        back_item = self.data[-1]
         self.access_count += 1
-        self.logger.info(f"查看队尾元素: {back_item}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"查看队尾元素: {back_item}")
         return back_item
     
     def insert(self, item: Any, **kwargs) -> bool:
@@ -93,12 +143,12 @@ class Queue(DataStructureBase):
         Returns:
             插入是否成功
         """
-        success = self.data.insert(item, position=len(self.data))
-        if success:
-            self.operation_count += 1
-            self.modification_count += 1
+        self.data.append(item)
+        self.operation_count += 1
+        self.modification_count += 1
+        if self.logger.isEnabledFor(logging.INFO):
             self.logger.info(f"入队元素: {item}")
-        return success
+        return True
     
     def delete(self, item: Any, **kwargs) -> bool:
         """删除元素（出队）
@@ -114,7 +164,7 @@ class Queue(DataStructureBase):
             return False
         
         # 队列只能删除队首元素
-        front_item = self.data.get(0)
+        front_item = self.data[0]
         if front_item == item:
             return self.dequeue() is not None
         else:
@@ -130,7 +180,19 @@ class Queue(DataStructureBase):
         Returns:
             元素在队列中的位置（从队首开始计数），如果未找到返回None
         """
-        return self.data.search(item)
+        try:
+            position = self.data.index(item)
+        except ValueError:
+            self.access_count += len(self.data)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"未找到元素 {item}")
+            return None
+        
+        self.access_count += position + 1
+        self.operation_count += 1
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"找到元素 {item} 在位置 {position}")
+        return position
     
     def update(self, old_item: Any, new_item: Any) -> bool:
         """更新元素
@@ -142,7 +204,18 @@ class Queue(DataStructureBase):
         Returns:
             更新是否成功
         """
-        return self.data.update(old_item, new_item)
+        try:
+            position = self.data.index(old_item)
+        except ValueError:
+            self.logger.warning(f"未找到要更新的元素 {old_item}")
+            return False
+        
+        self.data[position] = new_item
+        self.operation_count += 1
+        self.modification_count += 1
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"更新元素: {old_item} -> {new_item}")
+        return True
     
     def clear(self):
         """清空队列"""
@@ -155,14 +228,26 @@ class Queue(DataStructureBase):
         """检查队列是否为空"""
         return len(self.data) == 0
     
+    @is_empty.setter
+    def is_empty(self, value: bool):
+        # 基类初始化时会写入 is_empty，空与否只由 data 决定，忽略即可
+        pass
+    
     def __len__(self) -> int:
         """返回队列的大小"""
         return len(self.data)
     
+    def __iter__(self) -> Iterator[Any]:
+        """支持迭代（从队首到队尾）"""
+        return iter(self.data)
+    
+    def __contains__(self, item: Any) -> bool:
+        """检查元素是否在队列中"""
+        return item in self.data
+    
     def __str__(self) -> str:
         """字符串表示"""
-        elements = list(self.data)
-        return f"Queue(size={len(self)}, data=[{', '.join(map(str, elements))}])"
+        return f"Queue(size={len(self)}, data=[{', '.join(map(str, self.data))}])"
     
     def __repr__(self) -> str:
         """详细字符串表示"""
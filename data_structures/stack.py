@@ -2,12 +2,31 @@
 栈数据结构实现
 
 栈是一种后进先出(LIFO)的数据结构，类似于现实生活中的盘子堆叠。
-本实现基于链表，提供压栈、弹栈、查看栈顶等基本操作。
+本实现基于 Python 列表（栈顶位于列表末尾，压栈、弹栈均为C实现的 O(1) 操作），
+提供压栈、弹栈、查看栈顶等基本操作。
+
+线程安全：Stack 与 FastStack 面向单线程使用，不加锁。多个线程共享同一个栈时
+使用 ThreadSafeStack，它的压栈、弹栈各是一次 deque 操作，在 GIL 下是原子的，
+无需外部加锁，也比用互斥锁加条件变量实现的 queue.LifoQueue 快得多。
 """
 
-from typing import Any, Optional
+import logging
+from collections import deque
+from itertools import islice
+from typing import Any, Iterator, List, Optional
 from core.data_structures import DataStructureBase, DataStructureType
-from .linked_list import LinkedList
+
+
+# 字符串表示中最多展示的栈顶元素个数，避免大栈在打印、记录日志时逐个转换所有元素
+_STR_PREVIEW = 8
+
+
+def _preview(items, size: int) -> str:
+    """从栈顶（items 末尾）起展示最多 _STR_PREVIEW 个元素，其余以剩余个数表示"""
+    text = ', '.join(map(str, islice(reversed(items), _STR_PREVIEW)))
+    if size > _STR_PREVIEW:
+        text += f", ... +{size - _STR_PREVIEW} more"
+    return text
 
 
 class Stack(DataStructureBase):
@@ -20,10 +39,13 @@ class Stack(DataStructureBase):
     - 查看栈顶 O(1)
     """
     
+    __slots__ = ('data',)
+    
     def __init__(self):
         """初始化栈"""
         super().__init__("Stack", DataStructureType.STACK)
-        self.data = LinkedList()
+        # 栈顶为 data[-1]
+        self.data = []
     
     def push(self, item: Any) -> bool:
         """压栈操作
@@ -46,11 +68,11 @@ class Stack(DataStructureBase):
             self.logger.warning("栈为空，无法弹栈")
             return None
         
-        top_item = self.data.get(0)
-        self.data.delete(top_item, position=0)
+        top_item = self.data.pop()
         self.operation_count += 1
         self.modification_count += 1
-        self.logger.info(f"弹栈元素: {top_item}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"弹栈元素: {top_item}")
         return top_item
     
     def peek(self) -> Optional[Any]:
@@ -63,9 +85,10 @@ class Stack(DataStructureBase):
             self.logger.warning("栈为空，无法查看栈顶")
             return None
         
-        top_item = self.data.get(0)
+        top_item = self.data[-1]
         self.access_count += 1
-        self.logger.info(f"查看栈顶元素: {top_item}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"查看栈顶元素: {top_item}")
         return top_item
     
     def insert(self, item: Any, **kwargs) -> bool:
@@ -78,12 +101,12 @@ class Stack(DataStructureBase):
         Returns:
             插入是否成功
         """
-        success = self.data.insert(item, position=0)
-        if success:
-            self.operation_count += 1
-            self.modification_count += 1
+        self.data.append(item)
+        self.operation_count += 1
+        self.modification_count += 1
+        if self.logger.isEnabledFor(logging.INFO):
             self.logger.info(f"压栈元素: {item}")
-        return success
+        return True
     
     def delete(self, item: Any, **kwargs) -> bool:
         """删除元素（弹栈）
@@ -99,7 +122,7 @@ class Stack(DataStructureBase):
             return False
         
         # 栈只能删除栈顶元素
-        top_item = self.data.get(0)
+        top_item = self.data[-1]
         if top_item == item:
             return self.pop() is not None
         else:
@@ -115,7 +138,20 @@ class Stack(DataStructureBase):
         Returns:
             元素在栈中的位置（从栈顶开始计数），如果未找到返回None
         """
-        return self.data.search(item)
+        # 在反转副本上用 list.index 从栈顶开始查找，扫描在C中完成
+        try:
+            position = self._top_down().index(item)
+        except ValueError:
+            self.access_count += len(self.data)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"未找到元素 {item}")
+            return None
+        
+        self.access_count += position + 1
+        self.operation_count += 1
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"找到元素 {item} 在位置 {position}")
+        return position
     
     def update(self, old_item: Any, new_item: Any) -> bool:
         """更新元素
@@ -127,7 +163,23 @@ class Stack(DataStructureBase):
         Returns:
             更新是否成功
         """
-        return self.data.update(old_item, new_item)
+        try:
+            position = self._top_down().index(old_item)
+        except ValueError:
+            self.logger.warning(f"未找到要更新的元素 {old_item}")
+            return False
+        
+        # 从栈顶计数的位置换算为列表下标
+        self.data[len(self.data) - 1 - position] = new_item
+        self.operation_count += 1
+        self.modification_count += 1
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"更新元素: {old_item} -> {new_item}")
+        return True
+    
+    def _top_down(self) -> List[Any]:
+        """返回从栈顶到栈底排列的元素副本"""
+        return self.data[::-1]
     
     def clear(self):
         """清空栈"""
@@ -138,16 +190,29 @@ class Stack(DataStructureBase):
     @property
     def is_empty(self) -> bool:
         """检查栈是否为空"""
-        return len(self.data) == 0
+        return not self.data
+    
+    @is_empty.setter
+    def is_empty(self, value: bool):
+        # 基类初始化时会写入 is_empty，空与否只由 data 决定，忽略即可
+        pass
     
     def __len__(self) -> int:
         """返回栈的大小"""
         return len(self.data)
     
+    def __iter__(self) -> Iterator[Any]:
+        """支持迭代（从栈顶到栈底）"""
+        return reversed(self.data)
+    
+    def __contains__(self, item: Any) -> bool:
+        """检查元素是否在栈中"""
+        return item in self.data
+    
     def __str__(self) -> str:
         """字符串表示"""
-        elements = list(self.data)
-        return f"Stack(size={len(self)}, data=[{', '.join(map(str, elements))}])"
+        size = len(self)
+        return f"Stack(size={size}, data=[{_preview(self.data, size)}])"
     
     def __repr__(self) -> str:
         """详细字符串表示"""
@@ -163,4 +228,120 @@ class Stack(DataStructureBase):
             'operation_count': self.operation_count,
             'access_count': self.access_count,
             'modification_count': self.modification_count
-        } 
\ No newline at end of file
+        } 
+
+class FastStack:
+    """精简栈实现
+    
+    只包含压栈、弹栈、查看栈顶等核心操作，直接操作底层列表：
+    不继承 DataStructureBase，不记录日志，也不维护操作计数等统计信息。
+    适合对延迟敏感、不需要演示和统计的场景；需要这些功能时使用 Stack。
+    """
+    
+    __slots__ = ('_data',)
+    
+    def __init__(self):
+        """初始化栈"""
+        self._data = []
+    
+    def push(self, item: Any):
+        """压栈操作
+        
+        Args:
+            item: 要压入栈的元素
+        """
+        self._data.append(item)
+    
+    def pop(self) -> Optional[Any]:
+        """弹栈操作
+        
+        Returns:
+            栈顶元素，如果栈为空返回None
+        """
+        return self._data.pop() if self._data else None
+    
+    def peek(self) -> Optional[Any]:
+        """查看栈顶元素
+        
+        Returns:
+            栈顶元素，如果栈为空返回None
+        """
+        return self._data[-1] if self._data else None
+    
+    @property
+    def is_empty(self) -> bool:
+        """检查栈是否为空"""
+        return not self._data
+    
+    def __len__(self) -> int:
+        """返回栈的大小"""
+        return len(self._data)
+    
+    def __str__(self) -> str:
+        """字符串表示"""
+        size = len(self._data)
+        return f"FastStack(size={size}, data=[{_preview(self._data, size)}])"
+    
+    def __repr__(self) -> str:
+        """详细字符串表示"""
+        return self.__str__()
+
+
+class ThreadSafeStack(Stack):
+    """可在多线程间共享的栈
+    
+    底层使用 collections.deque：append 和 pop 在 GIL 下各是一次原子操作，
+    压栈、弹栈、查看栈顶无需外部加锁（queue.LifoQueue 每次操作都要获取互斥锁，
+    并在条件变量上通知，开销高出一个数量级以上）。弹栈和查看栈顶直接尝试取值，
+    不先判断是否为空，避免判断与取值之间被其他线程清空。
+    
+    注意：只有单个的压栈、弹栈、查看栈顶是原子的；delete、search、update 由多步组成，
+    与其他线程的修改并发时不保证原子性；操作计数等统计信息在并发下也只是近似值。
+    """
+    
+    __slots__ = ()
+    
+    def __init__(self):
+        """初始化线程安全栈"""
+        super().__init__()
+        self.name = "ThreadSafeStack"
+        self.data = deque()
+    
+    def pop(self) -> Optional[Any]:
+        """弹栈操作
+        
+        Returns:
+            栈顶元素，如果栈为空返回None
+        """
+        try:
+            top_item = self.data.pop()
+        except IndexError:
+            self.logger.warning("栈为空，无法弹栈")
+            return None
+        
+        self.operation_count += 1
+        self.modification_count += 1
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"弹栈元素: {top_item}")
+        return top_item
+    
+    def peek(self) -> Optional[Any]:
+        """查看栈顶元素
+        
+        Returns:
+            栈顶元素，如果栈为空返回None
+        """
+        try:
+            top_item = self.data[-1]
+        except IndexError:
+            self.logger.warning("栈为空，无法查看栈顶")
+            return None
+        
+        self.access_count += 1
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"查看栈顶元素: {top_item}")
+        return top_item
+    
+    def _top_down(self) -> List[Any]:
+        """返回从栈顶到栈底排列的元素副本（deque 不支持切片）"""
+        return list(reversed(self.data))
@@ -0,0 +1,502 @@
+"""
+数据结构测试套件
+
+包含数据结构的单元测试。
+"""
+
+import random
+import threading
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from data_structures.array import Array
+from data_structures.hash_table import HashTable
+from data_structures.heap import MinHeap, MaxHeap, NumericMinHeap
+from data_structures.linked_list import LinkedList
+from data_structures.queue import Queue
+from data_structures.stack import Stack, ThreadSafeStack
+from data_structures.tree import BinaryTree
+
+
+class TestArray(unittest.TestCase):
+    """数组测试类"""
+    
+    def test_insert(self):
+        """测试插入"""
+        for dtype in (object, np.int64, np.float64):
+            array = Array(2, dtype=dtype)
+            for i in range(5):
+                self.assertTrue(array.insert(i))
+            self.assertTrue(array.insert(100, 0))
+            self.assertTrue(array.insert(200, 3))
+            self.assertEqual(list(array), [100, 0, 1, 200, 2, 3, 4])
+            self.assertIn(200, array)
+            self.assertNotIn(999, array)
+    
+    def test_extend(self):
+        """测试批量追加列表、元组和生成器"""
+        for dtype in (object, np.int64, np.float64):
+            array = Array(2, dtype=dtype)
+            self.assertTrue(array.extend([0, 1]))
+            self.assertTrue(array.extend((2, 3)))
+            self.assertTrue(array.extend(i for i in range(4, 7)))
+            self.assertTrue(array.extend(iter([])))
+            self.assertEqual(list(array), list(range(7)))
+            self.assertEqual(len(array), 7)
+    
+    def test_failed_extend_keeps_contents(self):
+        """测试批量追加有损元素时整体拒绝，数组内容不变"""
+        array = Array(dtype=np.int64)
+        array.extend([1, 2, 3])
+        for items in ([2.7, 3.9], [4, 2 ** 70], ['5'], [[1]], [float('nan')], np.array([1.5])):
+            self.assertFalse(array.extend(items))
+            self.assertEqual(list(array), [1, 2, 3])
+        self.assertTrue(array.extend([4.0, np.int32(5)]))
+        self.assertEqual(list(array), [1, 2, 3, 4, 5])
+        
+        small = Array(dtype=np.uint8)
+        self.assertFalse(small.extend([1, 300]))
+        self.assertFalse(small.extend([-1]))
+        self.assertEqual(len(small), 0)
+    
+    def test_failed_insert_keeps_contents(self):
+        """测试插入失败时数组内容不变"""
+        array = Array(dtype=np.int64)
+        array.extend([1, 2, 3])
+        
+        # 无法转换、溢出、有损转换、序列都应被拒绝
+        for item in ('x', 2 ** 70, 2.7, '5', [1]):
+            self.assertFalse(array.insert(item, 0))
+            self.assertEqual(list(array), [1, 2, 3])
+            self.assertEqual(len(array), 3)
+        
+        # 可以无损转换的元素照常插入
+        self.assertTrue(array.insert(4.0, 0))
+        self.assertTrue(array.insert(np.int32(5)))
+        self.assertEqual(list(array), [4, 1, 2, 3, 5])
+        
+        # set、update 同样拒绝有损转换；无法表示的值视为不在数组中
+        self.assertFalse(array.set(0, 5.5))
+        self.assertFalse(array.update(1, 2 ** 70))
+        self.assertTrue(array.set(0, 6.0))
+        self.assertTrue(array.update(1, np.int8(7)))
+        self.assertEqual(list(array), [6, 7, 2, 3, 5])
+        for item in (2 ** 70, -2 ** 70, 2.5, float('nan'), 1j):
+            self.assertNotIn(item, array)
+            self.assertIsNone(array.search(item))
+        self.assertIn(7.0, array)
+        
+        floats = Array(dtype=np.float64)
+        self.assertTrue(floats.insert(float('nan')))
+        self.assertTrue(np.isnan(floats[0]))
+
+
+
+class TestHashTable(unittest.TestCase):
+    """哈希表测试类"""
+    
+    def test_put_get_remove(self):
+        """测试插入、查找、删除"""
+        table = HashTable()
+        for i in range(100):
+            self.assertTrue(table.put(i, i * i))
+        self.assertTrue(table.put(5, -5))
+        self.assertEqual(len(table), 100)
+        self.assertEqual(table.get(5), -5)
+        self.assertEqual(table.get(99), 99 * 99)
+        self.assertIsNone(table.get(100))
+        self.assertTrue(table.remove(5))
+        self.assertFalse(table.remove(5))
+        self.assertNotIn(5, table)
+        self.assertIn(6, table)
+        self.assertEqual(sorted(table), [i for i in range(100) if i != 5])
+    
+    def test_growth_doubles_capacity(self):
+        """测试扩容每次只翻倍一次，负载不低于阈值的一半"""
+        table = HashTable()
+        capacities = [table.capacity]
+        for i in range(1000):
+            table.put(i, i)
+            if table.capacity != capacities[-1]:
+                capacities.append(table.capacity)
+        self.assertEqual(capacities, [16 << k for k in range(len(capacities))])
+        self.assertGreater(len(table), table.capacity * table.load_factor / 2)
+    
+    def test_tombstones_rebuild_same_capacity(self):
+        """测试墓碑占满槽位时按原容量重建"""
+        table = HashTable()
+        capacity = table.capacity
+        # 反复插入、删除不同的键，有效键始终只有一个
+        for i in range(1000):
+            table.put(i, i)
+            table.remove(i)
+        table.put(-1, -1)
+        self.assertEqual(table.capacity, capacity)
+        self.assertEqual(len(table), 1)
+        self.assertEqual(table.get(-1), -1)
+
+
+
+class TestLinkedList(unittest.TestCase):
+    """链表测试类"""
+    
+    def test_basic_operations(self):
+        """测试插入、删除、搜索、更新和反转"""
+        linked_list = LinkedList()
+        self.assertTrue(linked_list.is_empty)
+        self.assertIsNone(linked_list.pop_front())
+        for i in range(3):
+            self.assertTrue(linked_list.append(i))
+        self.assertTrue(linked_list.insert(9))
+        self.assertTrue(linked_list.insert(7, 2))
+        self.assertFalse(linked_list.insert(8, 10))
+        self.assertEqual(list(linked_list), [9, 0, 7, 1, 2])
+        self.assertFalse(linked_list.is_empty)
+        self.assertIn(7, linked_list)
+        self.assertNotIn(5, linked_list)
+        
+        self.assertEqual(linked_list.search(1), 3)
+        self.assertIsNone(linked_list.search(5))
+        self.assertTrue(linked_list.update(1, 5))
+        self.assertTrue(linked_list.set(0, 6))
+        self.assertEqual(linked_list[4], 2)
+        self.assertTrue(linked_list.delete(7))
+        self.assertTrue(linked_list.delete(None, position=3))
+        self.assertFalse(linked_list.delete(42))
+        self.assertEqual(list(linked_list), [6, 0, 5])
+        
+        linked_list.reverse()
+        self.assertEqual(list(linked_list), [5, 0, 6])
+        self.assertEqual(linked_list.pop_front(), 5)
+        self.assertTrue(linked_list.append(1))
+        self.assertEqual(list(linked_list), [0, 6, 1])
+        self.assertEqual(len(linked_list), 3)
+        
+        linked_list.clear()
+        self.assertTrue(linked_list.is_empty)
+        self.assertTrue(linked_list.append(3))
+        self.assertEqual(list(linked_list), [3])
+    
+    def test_random_operations(self):
+        """随机操作与参照列表对比"""
+        rng = random.Random(11)
+        linked_list = LinkedList()
+        reference = []
+        for _ in range(2000):
+            operation = rng.random()
+            item = rng.randrange(30)
+            if operation < 0.3:
+                position = rng.randrange(len(reference) + 1)
+                self.assertTrue(linked_list.insert(item, position))
+                reference.insert(position, item)
+            elif operation < 0.5:
+                self.assertTrue(linked_list.append(item))
+                reference.append(item)
+            elif operation < 0.65:
+                self.assertEqual(linked_list.delete(item), item in reference)
+                if item in reference:
+                    reference.remove(item)
+            elif operation < 0.75 and reference:
+                position = rng.randrange(len(reference))
+                self.assertTrue(linked_list.delete(None, position=position))
+                del reference[position]
+            elif operation < 0.85:
+                expected = reference.pop(0) if reference else None
+                self.assertEqual(linked_list.pop_front(), expected)
+            else:
+                expected = reference.index(item) if item in reference else None
+                self.assertEqual(linked_list.search(item), expected)
+            self.assertEqual(list(linked_list), reference)
+            self.assertEqual(len(linked_list), len(reference))
+            self.assertEqual(linked_list.is_empty, not reference)
+        
+        # 尾指针始终正确：追加后元素出现在末尾
+        self.assertTrue(linked_list.append(99))
+        self.assertEqual(list(linked_list)[-1], 99)
+
+
+
+class TestQueue(unittest.TestCase):
+    """队列测试类"""
+    
+    def test_enqueue_dequeue(self):
+        """测试入队、出队"""
+        queue = Queue()
+        self.assertTrue(queue.is_empty)
+        self.assertIsNone(queue.dequeue())
+        self.assertIsNone(queue.front())
+        for i in range(3):
+            self.assertTrue(queue.enqueue(i))
+        self.assertEqual(queue.enqueue_many(range(3, 6)), 3)
+        self.assertEqual(list(queue), [0, 1, 2, 3, 4, 5])
+        self.assertFalse(queue.is_empty)
+        self.assertIn(4, queue)
+        self.assertNotIn(9, queue)
+        self.assertEqual(queue.front(), 0)
+        self.assertEqual(queue.back(), 5)
+        
+        self.assertEqual(queue.dequeue(), 0)
+        self.assertEqual(queue.dequeue_many(2), [1, 2])
+        self.assertEqual(queue.search(4), 1)
+        self.assertIsNone(queue.search(0))
+        self.assertTrue(queue.update(4, 40))
+        self.assertFalse(queue.delete(40))
+        self.assertTrue(queue.delete(3))
+        self.assertEqual(list(queue), [40, 5])
+        
+        self.assertEqual(queue.dequeue_many(10), [40, 5])
+        self.assertEqual(queue.dequeue_many(1), [])
+        self.assertTrue(queue.is_empty)
+        self.assertEqual(len(queue), 0)
+
+
+
+class TestBinaryTree(unittest.TestCase):
+    """二叉树测试类"""
+    
+    def check_tree(self, tree, reference):
+        """检查父指针、元素、大小和高度与参照一致"""
+        def height(node):
+            return -1 if node is None else 1 + max(height(node.left), height(node.right))
+        
+        nodes = [tree.root] if tree.root is not None else []
+        for node in nodes:
+            for child in (node.left, node.right):
+                if child is not None:
+                    self.assertIs(child.parent, node)
+                    nodes.append(child)
+        if tree.root is not None:
+            self.assertIsNone(tree.root.parent)
+        
+        self.assertEqual(Counter(node.data for node in nodes), reference)
+        self.assertEqual(Counter(tree), reference)
+        self.assertEqual(Counter(tree.levelorder_traversal()), reference)
+        self.assertEqual(list(tree), tree.inorder_traversal())
+        self.assertEqual(len(tree), sum(reference.values()))
+        self.assertEqual(tree.is_empty, not reference)
+        self.assertEqual(tree.get_height(), height(tree.root))
+    
+    def test_level_order_insert(self):
+        """测试插入按层序填充，树保持完全二叉树的形状"""
+        tree = BinaryTree()
+        self.assertTrue(tree.is_empty)
+        for i in range(10):
+            self.assertTrue(tree.insert(i))
+        self.assertEqual(tree.levelorder_traversal(), list(range(10)))
+        self.assertEqual(tree.preorder_traversal(), [0, 1, 3, 7, 8, 4, 9, 2, 5, 6])
+        self.assertEqual(tree.inorder_traversal(), [7, 3, 8, 1, 9, 4, 0, 5, 2, 6])
+        self.assertEqual(tree.postorder_traversal(), [7, 8, 3, 9, 4, 1, 5, 6, 2, 0])
+        self.assertEqual(tree.get_height(), 3)
+        self.assertIn(9, tree)
+        self.assertNotIn(10, tree)
+        self.check_tree(tree, Counter(range(10)))
+        
+        tree.clear()
+        self.check_tree(tree, Counter())
+    
+    def test_search_result_survives_delete(self):
+        """测试 search 返回的节点在删除、再插入后不会被改写"""
+        tree = BinaryTree()
+        for i in range(10):
+            tree.insert(i)
+        node = tree.search(9)
+        self.assertEqual(node.data, 9)
+        self.assertTrue(tree.delete(9))
+        self.assertTrue(tree.insert(99))
+        self.assertEqual(node.data, 9)
+        self.assertIsNone(tree.search(9))
+        self.assertIsNotNone(tree.search(99))
+    
+    def test_random_operations(self):
+        """随机操作与参照的多重集合对比"""
+        rng = random.Random(3)
+        tree = BinaryTree()
+        reference = Counter()
+        for _ in range(1500):
+            operation = rng.random()
+            item = rng.randrange(40)
+            if operation < 0.45:
+                self.assertTrue(tree.insert(item))
+                reference[item] += 1
+            elif operation < 0.75:
+                self.assertEqual(tree.delete(item), reference[item] > 0)
+                reference[item] -= 1
+            elif operation < 0.9:
+                new_item = rng.randrange(40)
+                self.assertEqual(tree.update(item, new_item), reference[item] > 0)
+                if reference[item] > 0:
+                    reference[item] -= 1
+                    reference[new_item] += 1
+            else:
+                node = tree.search(item)
+                if reference[item] > 0:
+                    self.assertEqual(node.data, item)
+                else:
+                    self.assertIsNone(node)
+            reference = +reference
+            self.check_tree(tree, reference)
+
+
+
+class TestHeap(unittest.TestCase):
+    """堆测试类"""
+    
+    def check_heap(self, heap, reference, is_max):
+        """检查堆性质、元素和值索引与参照的多重集合一致"""
+        data = heap.data
+        for i in range(1, len(data)):
+            parent = data[(i - 1) >> 1]
+            if is_max:
+                self.assertGreaterEqual(parent, data[i])
+            else:
+                self.assertLessEqual(parent, data[i])
+        self.assertEqual(Counter(data), reference)
+        self.assertEqual(len(heap), sum(reference.values()))
+        self.assertEqual(heap.is_empty, not reference)
+        for value, positions in heap._index.items():
+            for i in positions:
+                self.assertEqual(data[i], value)
+        self.assertEqual(sum(len(p) for p in heap._index.values()), len(data))
+    
+    def test_construct(self):
+        """测试堆可以直接构造"""
+        for heap_class in (MinHeap, MaxHeap):
+            heap = heap_class()
+            self.assertTrue(heap.is_empty)
+            self.assertEqual(len(heap), 0)
+            self.assertTrue(heap.insert(5))
+            self.assertFalse(heap.is_empty)
+            self.assertIn(5, heap)
+    
+    def test_failed_push_many_keeps_heap(self):
+        """测试批量插入失败时堆和索引保持不变"""
+        for heap_class, is_max in ((MinHeap, False), (MaxHeap, True)):
+            heap = heap_class()
+            self.assertEqual(heap.push_many([3, 'a']), 0)
+            self.check_heap(heap, Counter(), is_max)
+            
+            self.assertEqual(heap.push_many([5, 1, 4]), 3)
+            for items in ([2, 'a'], [[1]], [7, None]):
+                self.assertEqual(heap.push_many(items), 0)
+                self.check_heap(heap, Counter([5, 1, 4]), is_max)
+            self.assertTrue(heap.delete(4))
+            self.check_heap(heap, Counter([5, 1]), is_max)
+    
+    def test_numeric_heap_rejects_lossy_values(self):
+        """测试整数数值堆拒绝有损转换，堆内容不变"""
+        heap = NumericMinHeap(2, dtype=np.int64)
+        for item in (5, 3, 8):
+            self.assertTrue(heap.insert(item))
+        for item in (2.7, 2 ** 70, 'x', float('nan')):
+            self.assertFalse(heap.insert(item))
+        self.assertFalse(heap.update(8, 1.5))
+        self.assertEqual(sorted(heap), [3, 5, 8])
+        
+        self.assertTrue(heap.insert(1.0))
+        self.assertTrue(heap.update(8, np.int32(0)))
+        self.assertEqual([heap.extract_min() for _ in range(4)], [0, 1, 3, 5])
+        self.assertTrue(heap.is_empty)
+    
+    def test_random_operations(self):
+        """随机操作与参照的多重集合对比"""
+        rng = random.Random(7)
+        for heap_class, is_max in ((MinHeap, False), (MaxHeap, True)):
+            heap = heap_class()
+            extract = heap.extract_max if is_max else heap.extract_min
+            peek = heap.peek_max if is_max else heap.peek_min
+            reference = Counter()
+            for _ in range(2000):
+                operation = rng.random()
+                if operation < 0.4:
+                    item = rng.randrange(50)
+                    self.assertTrue(heap.insert(item))
+                    reference[item] += 1
+                elif operation < 0.55:
+                    expected = (max if is_max else min)(reference.elements(), default=None)
+                    self.assertEqual(peek(), expected)
+                    self.assertEqual(extract(), expected)
+                    if expected is not None:
+                        reference[expected] -= 1
+                elif operation < 0.7:
+                    item = rng.randrange(50)
+                    self.assertEqual(heap.delete(item), reference[item] > 0)
+                    if reference[item] > 0:
+                        reference[item] -= 1
+                elif operation < 0.85:
+                    old_item, new_item = rng.randrange(50), rng.randrange(50)
+                    self.assertEqual(heap.update(old_item, new_item), reference[old_item] > 0)
+                    if reference[old_item] > 0:
+                        reference[old_item] -= 1
+                        reference[new_item] += 1
+                elif operation < 0.95:
+                    item = rng.randrange(50)
+                    position = heap.search(item)
+                    if reference[item] > 0:
+                        self.assertEqual(heap.data[position], item)
+                    else:
+                        self.assertIsNone(position)
+                else:
+                    items = [rng.randrange(50) for _ in range(rng.randrange(5))]
+                    self.assertEqual(heap.push_many(items), len(items))
+                    reference.update(items)
+                reference = +reference
+                self.check_heap(heap, reference, is_max)
+            
+            items = [rng.randrange(50) for _ in range(100)]
+            heap.build_heap(items)
+            self.check_heap(heap, Counter(items), is_max)
+            heap.clear()
+            self.check_heap(heap, Counter(), is_max)
+
+
+
+class TestStack(unittest.TestCase):
+    """栈测试类"""
+    
+    def test_push_pop(self):
+        """测试压栈、弹栈"""
+        for stack_class in (Stack, ThreadSafeStack):
+            stack = stack_class()
+            self.assertTrue(stack.is_empty)
+            self.assertIsNone(stack.pop())
+            self.assertIsNone(stack.peek())
+            for i in range(5):
+                self.assertTrue(stack.push(i))
+            self.assertFalse(stack.is_empty)
+            self.assertEqual(len(stack), 5)
+            self.assertEqual(list(stack), [4, 3, 2, 1, 0])
+            self.assertIn(3, stack)
+            self.assertNotIn(9, stack)
+            self.assertEqual(stack.peek(), 4)
+            self.assertEqual(stack.pop(), 4)
+            self.assertEqual(stack.search(1), 2)
+            self.assertTrue(stack.update(1, 10))
+            self.assertEqual(list(stack), [3, 2, 10, 0])
+    
+    def test_thread_safe_stack_concurrent(self):
+        """测试多个线程同时压栈、弹栈不丢失元素"""
+        stack = ThreadSafeStack()
+        popped = []
+        
+        def worker(start):
+            for i in range(start, start + 1000):
+                stack.push(i)
+            for _ in range(500):
+                item = stack.pop()
+                if item is not None:
+                    popped.append(item)
+        
+        threads = [threading.Thread(target=worker, args=(n * 1000,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len(popped), 2000)
+        self.assertEqual(sorted(popped + list(stack)), list(range(4000)))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
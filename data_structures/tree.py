@@ -5,13 +5,21 @@
 本实现包括二叉树的基本操作：插入、删除、搜索、遍历等。
 """
 
+import logging
+from collections import deque
 from typing import Any, Optional, List, Iterator
 from core.data_structures import DataStructureBase, DataStructureType
 
 
+# 字符串表示中最多展示的元素个数（层序），避免大树在打印、记录日志时遍历全部节点
+_STR_PREVIEW = 32
+
+
 class TreeNode:
     """树节点类"""
     
+    __slots__ = ('data', 'left', 'right', 'parent')
+    
     def __init__(self, data: Any):
         """初始化树节点
         
@@ -40,11 +48,19 @@ class BinaryTree(DataStructureBase):
     - 动态大小
     """
     
+    __slots__ = ('root', '_insert_frontier', '_frontier_dirty', '_height')
+    
     def __init__(self):
         """初始化二叉树"""
         super().__init__("BinaryTree", DataStructureType.TREE)
         self.root = None
         self.size = 0
+        # 还有空子节点位置的节点，按层序排列；队首即下一个插入位置的父节点
+        self._insert_frontier = deque()
+        # 删除会破坏完全二叉树的形状，此时插入前需要重新计算插入边界
+        self._frontier_dirty = False
+        # 形状不再是完全二叉树时缓存的高度，None 表示需要重新计算
+        self._height = None
     
     def insert(self, item: Any, **kwargs) -> bool:
         """插入元素
@@ -61,28 +77,31 @@ class BinaryTree(DataStructureBase):
             
             if self.root is None:
                 self.root = new_node
+                self._insert_frontier.clear()
+                self._insert_frontier.append(new_node)
+                self._frontier_dirty = False
             else:
-                # 使用层序遍历找到第一个空位置
-                queue = [self.root]
-                while queue:
-                    current = queue.pop(0)
-                    if current.left is None:
-                        current.left = new_node
-                        new_node.parent = current
-                        break
-                    elif current.right is None:
-                        current.right = new_node
-                        new_node.parent = current
-                        break
-                    else:
-                        queue.append(current.left)
-                        queue.append(current.right)
+                if self._frontier_dirty:
+                    self._rebuild_frontier()
+                
+                # 层序中第一个有空位置的节点即为父节点
+                frontier = self._insert_frontier
+                parent = frontier[0]
+                new_node.parent = parent
+                if parent.left is None:
+                    parent.left = new_node
+                else:
+                    parent.right = new_node
+                    frontier.popleft()
+                frontier.append(new_node)
             
+            self._height = None
             self.size += 1
             self.operation_count += 1
             self.modification_count += 1
             
-            self.logger.info(f"插入元素 {item}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"插入元素 {item}")
             return True
             
         except Exception as e:
@@ -105,48 +124,33 @@ class BinaryTree(DataStructureBase):
                 self.logger.warning(f"未找到要删除的元素 {item}")
                 return False
             
-            # 如果是叶子节点，直接删除
-            if node.left is None and node.right is None:
-                if node.parent is None:
-                    self.root = None
-                elif node.parent.left == node:
-                    node.parent.left = None
-                else:
-                    node.parent.right = None
-            
-            # 如果只有一个子节点
-            elif node.left is None:
-                if node.parent is None:
-                    self.root = node.right
-                elif node.parent.left == node:
-                    node.parent.left = node.right
-                else:
-                    node.parent.right = node.right
-                if node.right:
-                    node.right.parent = node.parent
-            
-            elif node.right is None:
-                if node.parent is None:
-                    self.root = node.left
-                elif node.parent.left == node:
-                    node.parent.left = node.left
-                else:
-                    node.parent.right = node.left
-                if node.left:
-                    node.left.parent = node.parent
-            
-            # 如果有两个子节点，找到右子树的最小值替换
-            else:
+            # 如果有两个子节点，用右子树最左节点的值替换，再摘除该节点。
+            # 该节点没有左子节点，直接按下面的单子节点情况处理；
+            # 不能再按值删除，否则层序查找会先找到刚被替换值的 node 本身
+            if node.left is not None and node.right is not None:
                 successor = self._find_min(node.right)
                 node.data = successor.data
-                self.delete(successor.data)
-                return True
+                node = successor
+            
+            # 叶子节点或只有一个子节点：用子节点（可能为空）顶替它
+            child = node.left if node.left is not None else node.right
+            if node.parent is None:
+                self.root = child
+            elif node.parent.left is node:
+                node.parent.left = child
+            else:
+                node.parent.right = child
+            if child is not None:
+                child.parent = node.parent
             
+            self._frontier_dirty = True
+            self._height = None
             self.size -= 1
             self.operation_count += 1
             self.modification_count += 1
             
-            self.logger.info(f"删除元素 {item}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"删除元素 {item}")
             return True
             
         except Exception as e:
@@ -180,7 +184,8 @@ class BinaryTree(DataStructureBase):
                 node.data = new_item
                 self.operation_count += 1
                 self.modification_count += 1
-                self.logger.info(f"更新元素: {old_item} -> {new_item}")
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(f"更新元素: {old_item} -> {new_item}")
                 return True
             else:
                 self.logger.warning(f"未找到要更新的元素 {old_item}")
@@ -194,6 +199,9 @@ class BinaryTree(DataStructureBase):
         """清空树"""
         self.root = None
         self.size = 0
+        self._insert_frontier.clear()
+        self._frontier_dirty = False
+        self._height = None
         self.operation_count += 1
         self.logger.info("二叉树已清空")
     
@@ -209,22 +217,54 @@ class BinaryTree(DataStructureBase):
         if self.root is None:
             return None
         
-        queue = [self.root]
-        while queue:
-            current = queue.pop(0)
-            self.access_count += 1
+        # 以列表作层序队列：for 循环会继续遍历循环中追加的子节点，
+        # 出队只是迭代器前进一步，比 deque.popleft 快得多。
+        # 访问次数先在局部变量中累计，退出前一次性写回，避免每个节点都读写属性
+        visited = 0
+        nodes = [self.root]
+        append = nodes.append
+        for current in nodes:
+            visited += 1
             
             if current.data == item:
+                self.access_count += visited
                 self.operation_count += 1
                 return current
             
             if current.left:
-                queue.append(current.left)
+                append(current.left)
             if current.right:
-                queue.append(current.right)
+                append(current.right)
         
+        self.access_count += visited
         return None
     
+    def _rebuild_frontier(self):
+        """按层序重新收集有空子节点位置的节点
+        
+        树仍是完全二叉树时，之后的插入可以继续直接使用该边界；
+        否则新节点的层序位置可能排在已有边界节点之前，边界保持失效，
+        下次插入时重新计算。
+        """
+        frontier = deque()
+        complete = True
+        seen_gap = False
+        # 与 _find_node 相同，以列表作层序队列
+        nodes = [self.root]
+        for current in nodes:
+            if current.left is None or current.right is None:
+                frontier.append(current)
+            for child in (current.left, current.right):
+                if child is None:
+                    seen_gap = True
+                else:
+                    if seen_gap:
+                        complete = False
+                    nodes.append(child)
+        
+        self._insert_frontier = frontier
+        self._frontier_dirty = not complete
+    
     def _find_min(self, node: TreeNode) -> TreeNode:
         """找到以指定节点为根的子树中的最小值节点
         
@@ -241,107 +281,178 @@ class BinaryTree(DataStructureBase):
     def preorder_traversal(self) -> List[Any]:
         """前序遍历
         
+        使用显式栈代替递归，不受递归深度限制；结果列表按节点数预先分配。
+        
         Returns:
             前序遍历结果
         """
-        result = []
-        self._preorder_recursive(self.root, result)
+        result = [None] * self.size
+        if self.root is None:
+            return result
+        
+        i = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            result[i] = node.data
+            i += 1
+            # 右子节点先入栈，保证左子树先被访问
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
         return result
     
     def inorder_traversal(self) -> List[Any]:
         """中序遍历
         
+        使用显式栈代替递归：沿左链一路入栈，出栈访问后转向右子树。
+        
         Returns:
             中序遍历结果
         """
-        result = []
-        self._inorder_recursive(self.root, result)
+        result = [None] * self.size
+        i = 0
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            result[i] = node.data
+            i += 1
+            node = node.right
         return result
     
     def postorder_traversal(self) -> List[Any]:
         """后序遍历
         
+        按 根-右-左 的顺序遍历并从结果列表末尾向前填写，
+        得到的正是 左-右-根 的后序序列。
+        
         Returns:
             后序遍历结果
         """
-        result = []
-        self._postorder_recursive(self.root, result)
+        result = [None] * self.size
+        if self.root is None:
+            return result
+        
+        i = self.size - 1
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            result[i] = node.data
+            i -= 1
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
         return result
     
     def levelorder_traversal(self) -> List[Any]:
         """层序遍历
         
+        以节点列表作队列：for 循环会继续遍历循环中追加的子节点，
+        每个节点只入队一次，遍历结束时列表恰好是层序序列。
+        
         Returns:
             层序遍历结果
         """
-        result = []
         if self.root is None:
-            return result
+            return []
         
-        queue = [self.root]
-        while queue:
-            current = queue.pop(0)
-            result.append(current.data)
-            
+        nodes = [self.root]
+        append = nodes.append
+        for current in nodes:
             if current.left:
-                queue.append(current.left)
+                append(current.left)
             if current.right:
-                queue.append(current.right)
+                append(current.right)
         
-        return result
-    
-    def _preorder_recursive(self, node: Optional[TreeNode], result: List[Any]):
-        """前序遍历递归实现"""
-        if node is not None:
-            result.append(node.data)
-            self._preorder_recursive(node.left, result)
-            self._preorder_recursive(node.right, result)
-    
-    def _inorder_recursive(self, node: Optional[TreeNode], result: List[Any]):
-        """中序遍历递归实现"""
-        if node is not None:
-            self._inorder_recursive(node.left, result)
-            result.append(node.data)
-            self._inorder_recursive(node.right, result)
-    
-    def _postorder_recursive(self, node: Optional[TreeNode], result: List[Any]):
-        """后序遍历递归实现"""
-        if node is not None:
-            self._postorder_recursive(node.left, result)
-            self._postorder_recursive(node.right, result)
-            result.append(node.data)
+        return [node.data for node in nodes]
     
     def get_height(self) -> int:
         """获取树的高度
         
+        插入边界有效时树是完全二叉树，高度直接由节点数得出，O(1)；
+        删除之后形状不规则，逐层遍历计数层数并缓存，直到下一次修改。
+        
         Returns:
-            树的高度
+            树的高度（空树为 -1）
         """
-        return self._get_height_recursive(self.root)
+        if not self._frontier_dirty:
+            return self.size.bit_length() - 1
+        if self._height is not None:
+            return self._height
+        
+        height = -1
+        level = [self.root] if self.root is not None else []
+        while level:
+            height += 1
+            next_level = []
+            for node in level:
+                if node.left is not None:
+                    next_level.append(node.left)
+                if node.right is not None:
+                    next_level.append(node.right)
+            level = next_level
+        self._height = height
+        return height
     
-    def _get_height_recursive(self, node: Optional[TreeNode]) -> int:
-        """递归计算树的高度"""
-        if node is None:
-            return -1
-        return max(self._get_height_recursive(node.left), 
-                  self._get_height_recursive(node.right)) + 1
+    @property
+    def is_empty(self) -> bool:
+        """检查树是否为空"""
+        return self.root is None
+    
+    @is_empty.setter
+    def is_empty(self, value: bool):
+        # 基类初始化时会写入 is_empty，空与否只由 root 决定，忽略即可
+        pass
     
     def __len__(self) -> int:
         """返回树的大小"""
         return self.size
     
     def __iter__(self) -> Iterator[Any]:
-        """支持迭代（中序遍历）"""
-        for item in self.inorder_traversal():
-            yield item
+        """支持迭代（中序遍历）
+        
+        以显式栈逐个产出，不先生成完整的结果列表。
+        """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.data
+            node = node.right
+    
+    def __contains__(self, item: Any) -> bool:
+        """检查元素是否在树中"""
+        return self._find_node(item) is not None
     
     def __str__(self) -> str:
         """字符串表示"""
         if self.root is None:
             return "BinaryTree(empty)"
         
-        elements = self.levelorder_traversal()
-        return f"BinaryTree(size={self.size}, height={self.get_height()}, data={elements})"
+        # 只按层序取前 _STR_PREVIEW 个元素，不做完整遍历
+        elements = []
+        queue = deque([self.root])
+        while queue and len(elements) < _STR_PREVIEW:
+            current = queue.popleft()
+            elements.append(current.data)
+            if current.left:
+                queue.append(current.left)
+            if current.right:
+                queue.append(current.right)
+        
+        text = ', '.join(map(str, elements))
+        if self.size > _STR_PREVIEW:
+            text += f", ... +{self.size - _STR_PREVIEW} more"
+        return f"BinaryTree(size={self.size}, height={self.get_height()}, data=[{text}])"
     
     def __repr__(self) -> str:
         """详细字符串表示"""
@@ -5,8 +5,120 @@
 时间复杂度：O(log n)，空间复杂度：O(1)
 """
 
+import bisect
+import logging
+from numbers import Number
 from typing import Any, List, Optional, Tuple
-from core.algorithm_base import AlgorithmBase, AlgorithmType
+
+import numpy as np
+
+from core.algorithm_base import AlgorithmBase, AlgorithmType, Step
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    # numba 为可选依赖，未安装时所有输入都走逐步记录的 Python 实现
+    _HAS_NUMBA = False
+
+# 可以交给编译内核处理的 dtype 类别：有符号整数、无符号整数、浮点数
+_NUMERIC_KINDS = 'iuf'
+
+# 编译内核中窗口缩小到这么多个元素后改为线性统计（8 个 int64 恰好一条缓存行）
+_LINEAR_TAIL = 8
+
+# search_cached 结果缓存的容量上限，超过后整体清空
+_MEMO_SIZE = 4096
+
+# 缓存中查不到时的哨兵（None 本身是合法的缓存结果）
+_MISSING = object()
+
+# 搜索步骤先记录为紧凑元组 (类型编号, 比较次数, 各字段值...)，读取步骤时才展开为字典；
+# 下表按类型编号给出步骤类型名及其字段名
+_STEP_COMPARE = 0
+_STEP_FOUND = 1
+_STEP_MOVE_RIGHT = 2
+_STEP_MOVE_LEFT = 3
+_STEP_NOT_FOUND = 4
+_STEP_FOUND_CONTINUE_LEFT = 5
+_STEP_FOUND_CONTINUE_RIGHT = 6
+_STEP_LAYOUTS = (
+    ('compare', ('left', 'right', 'mid', 'current_element', 'target')),
+    ('found', ('position', 'element')),
+    ('move_right', ('new_left', 'new_right')),
+    ('move_left', ('new_left', 'new_right')),
+    ('not_found', ('target',)),
+    ('found_continue_left', ('position', 'new_left', 'new_right')),
+    ('found_continue_right', ('position', 'new_left', 'new_right')),
+)
+
+
+def _search_kernel(data, target) -> int:
+    """无分支二分搜索内核，返回第一个等于 target 的位置，未找到返回 -1
+    
+    每轮只根据一次比较移动下界，条件赋值可被编译为条件传送指令，
+    不产生难以预测的分支。窗口缩小到 _LINEAR_TAIL 个元素以内后，
+    不再继续折半，而是顺序统计窗口中小于 target 的元素个数：
+    这几个元素位于同一缓存行，顺序比较互不依赖，可以并行执行。
+    """
+    n = data.shape[0]
+    if n == 0:
+        return -1
+    base = 0
+    while n > _LINEAR_TAIL:
+        half = n >> 1
+        base = base + half if data[base + half] < target else base
+        n -= half
+    # base 之前的元素都小于 target，左边界落在 [base, base + n] 中，窗口内计数即为偏移
+    offset = 0
+    for i in range(base, base + n):
+        offset += 1 if data[i] < target else 0
+    base += offset
+    return base if base < data.shape[0] and data[base] == target else -1
+
+
+def _eytzinger_order(n: int) -> np.ndarray:
+    """返回 1..n 的隐式完全二叉树（k 的子节点为 2k、2k+1）按中序遍历的下标序列"""
+    order = np.empty(n, dtype=np.int64)
+    stack = np.empty(64, dtype=np.int64)
+    top = 0
+    k = 1
+    i = 0
+    while top > 0 or k <= n:
+        while k <= n:
+            stack[top] = k
+            top += 1
+            k = 2 * k
+        top -= 1
+        k = stack[top]
+        order[i] = k
+        i += 1
+        k = 2 * k + 1
+    return order
+
+
+def _eytzinger_lower_bound(eyt, target) -> int:
+    """在 Eytzinger 布局上查找第一个不小于 target 的位置，返回其下标（从1开始），不存在返回 0
+    
+    每轮只做一次比较并直接计算下一个下标，访问顺序沿树逐层向下，
+    前几层集中在数组开头的少数缓存行中。
+    """
+    n = eyt.shape[0] - 1
+    k = 1
+    while k <= n:
+        k = 2 * k + (1 if eyt[k] < target else 0)
+    # 去掉末尾连续的 1（最后几次向右走）以及再上一层，回到最后一次向左走的节点
+    while k & 1:
+        k >>= 1
+    return k >> 1
+
+
+if _HAS_NUMBA:
+    _search_kernel = njit(cache=True, nogil=True, boundscheck=False)(_search_kernel)
+    _eytzinger_order = njit(cache=True, nogil=True)(_eytzinger_order)
+    _eytzinger_kernel = njit(cache=True, nogil=True, boundscheck=False)(_eytzinger_lower_bound)
+else:
+    _eytzinger_kernel = _eytzinger_lower_bound
 
 
 class BinarySearch(AlgorithmBase):
@@ -19,76 +131,267 @@ class BinarySearch(AlgorithmBase):
     - 非常高效
     """
     
-    def __init__(self):
-        """初始化二分搜索算法"""
+    def __init__(self, record_steps: bool = True):
+        """初始化二分搜索算法
+        
+        Args:
+            record_steps: 是否逐步记录搜索过程（供可视化、演示使用）；
+                为 False 时 search、search_first_occurrence、search_last_occurrence
+                直接交给C实现的 bisect 模块，不写日志、不记录步骤
+        """
         super().__init__("BinarySearch", AlgorithmType.SEARCHING)
+        self.record_steps = record_steps
+        # 尚未展开的搜索步骤记录，见 _flush_step_records
+        self._step_records = []
+        # search_cached 的结果缓存：只对应最近一次查询的列表，目标 -> 结果
+        self._memo_data = None
+        self._memo_len = 0
+        self._memo = {}
+        # monotonic_hint 使用的上一次找到的列表与位置
+        self._hint_data = None
+        self._hint_index = 0
     
-    def search(self, data: List[Any], target: Any) -> Optional[int]:
+    def search(self, data: List[Any], target: Any, monotonic_hint: bool = False) -> Optional[int]:
         """执行二分搜索
         
         Args:
             data: 要搜索的有序数据列表
             target: 要搜索的目标元素
+            monotonic_hint: 按升序依次查询同一个列表时设为True，从上一次找到的位置
+                之后开始搜索；目标不大于上一次找到的元素时仍从头搜索，结果总是正确的
             
         Returns:
             目标元素的位置，如果未找到返回None
         """
         try:
-            self.logger.info(f"开始二分搜索，目标元素: {target}")
+            if (_HAS_NUMBA and isinstance(data, np.ndarray) and data.ndim == 1
+                    and data.dtype.kind in _NUMERIC_KINDS and isinstance(target, Number)):
+                return self._search_compiled(data, target)
+            
+            left = self._hint_start(data, target) if monotonic_hint else 0
+            if not self.record_steps:
+                result = self._search_bisect(data, target, lo=left)
+                if monotonic_hint and result is not None:
+                    self._hint_data = data
+                    self._hint_index = result
+                return result
+            
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"开始二分搜索，目标元素: {target}")
             self.operation_count = 0
             self.comparison_count = 0
             
-            left, right = 0, len(data) - 1
+            # 比较次数先在局部变量中累计，结束时一次性写回
+            comparisons = 0
+            record = self._step_records.append
+            right = len(data) - 1
             
             while left <= right:
-                mid = (left + right) // 2
-                self.comparison_count += 1
-                self.operation_count += 1
+                mid = (left + right) >> 1
+                value = data[mid]
+                comparisons += 1
                 
                 # 记录搜索步骤
-                self.add_step({
-                    'type': 'compare',
-                    'left': left,
-                    'right': right,
-                    'mid': mid,
-                    'current_element': data[mid],
-                    'target': target
-                })
+                record((_STEP_COMPARE, comparisons, left, right, mid, value, target))
                 
-                if data[mid] == target:
-                    self.logger.info(f"找到目标元素 {target} 在位置 {mid}")
-                    self.add_step({
-                        'type': 'found',
-                        'position': mid,
-                        'element': target
-                    })
+                if value == target:
+                    # 与 bisect 路径保持一致，返回第一次出现的位置：
+                    # left 之前的元素都小于目标，只需在 [left, mid) 中再找左边界
+                    if mid > left and data[mid - 1] == target:
+                        comparisons += 1 + (mid - 1 - left).bit_length()
+                        mid = bisect.bisect_left(data, target, left, mid - 1)
+                    self.operation_count = self.comparison_count = comparisons
+                    if monotonic_hint:
+                        self._hint_data = data
+                        self._hint_index = mid
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info(f"找到目标元素 {target} 在位置 {mid}")
+                    record((_STEP_FOUND, comparisons, mid, target))
                     return mid
-                elif data[mid] < target:
+                elif value < target:
                     left = mid + 1
-                    self.add_step({
-                        'type': 'move_right',
-                        'new_left': left,
-                        'new_right': right
-                    })
+                    record((_STEP_MOVE_RIGHT, comparisons, left, right))
                 else:
                     right = mid - 1
-                    self.add_step({
-                        'type': 'move_left',
-                        'new_left': left,
-                        'new_right': right
-                    })
+                    record((_STEP_MOVE_LEFT, comparisons, left, right))
             
-            self.logger.info(f"未找到目标元素 {target}")
-            self.add_step({
-                'type': 'not_found',
-                'target': target
-            })
+            self.operation_count = self.comparison_count = comparisons
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"未找到目标元素 {target}")
+            record((_STEP_NOT_FOUND, comparisons, target))
             return None
             
         except Exception as e:
             self.logger.error(f"二分搜索失败: {e}")
             return None
     
+    def search_fast(self, data: List[Any], target: Any) -> Optional[int]:
+        """快速二分搜索
+        
+        不写日志、不记录步骤，查找由C实现的 bisect.bisect_left 完成，
+        适合只需要结果、被频繁调用的场景；需要逐步演示时使用 search。
+        
+        Args:
+            data: 要搜索的有序数据列表
+            target: 要搜索的目标元素
+            
+        Returns:
+            目标元素第一次出现的位置，如果未找到返回None
+        """
+        n = len(data)
+        # 比较次数不超过 ⌊log2 n⌋ + 1，按上界计入
+        self.comparison_count = n.bit_length()
+        i = bisect.bisect_left(data, target)
+        return i if i < n and data[i] == target else None
+    
+    def search_cached(self, data: List[Any], target: Any) -> Optional[int]:
+        """带结果缓存的快速二分搜索
+        
+        与 search_fast 相同，但对同一个列表重复查询同一目标时直接返回缓存的结果。
+        缓存只能发现换了列表或列表长度变化，察觉不到原地修改元素，
+        因此调用方需保证两次调用之间不原地修改该列表，否则先调用 clear_cache。
+        
+        Args:
+            data: 要搜索的有序数据列表
+            target: 要搜索的目标元素
+            
+        Returns:
+            目标元素第一次出现的位置，如果未找到返回None
+        """
+        n = len(data)
+        cache = self._memo
+        if data is not self._memo_data or n != self._memo_len:
+            cache.clear()
+            self._memo_data = data
+            self._memo_len = n
+        
+        try:
+            result = cache.get(target, _MISSING)
+        except TypeError:
+            # 不可哈希的目标不缓存
+            return self.search_fast(data, target)
+        if result is not _MISSING:
+            # 比较次数按同样的查找计入，统计结果与是否命中缓存无关
+            self.comparison_count = n.bit_length()
+            return result
+        
+        result = self.search_fast(data, target)
+        if len(cache) >= _MEMO_SIZE:
+            cache.clear()
+        cache[target] = result
+        return result
+    
+    def _search_bisect(self, data: List[Any], target: Any, last: bool = False, lo: int = 0) -> Optional[int]:
+        """不记录步骤的二分搜索，循环由C实现的 bisect 模块完成
+        
+        Args:
+            data: 要搜索的有序数据列表
+            target: 要搜索的目标元素
+            last: 为True时返回最后一次出现的位置，否则返回第一次出现的位置
+            lo: 搜索的起始下界，调用方需保证 lo 之前的元素都小于 target
+            
+        Returns:
+            目标元素的位置，如果未找到返回None
+        """
+        n = len(data)
+        # 比较次数不超过 ⌊log2 (n - lo)⌋ + 1，按上界计入
+        self.operation_count = self.comparison_count = (n - lo).bit_length()
+        if last:
+            i = bisect.bisect_right(data, target, lo) - 1
+            return i if i >= lo and data[i] == target else None
+        i = bisect.bisect_left(data, target, lo)
+        return i if i < n and data[i] == target else None
+    
+    def _hint_start(self, data: List[Any], target: Any) -> int:
+        """monotonic_hint 的起始下界
+        
+        上一次在同一个列表中找到的元素严格小于 target 时，它及之前的元素都小于 target，
+        可以从它之后开始搜索；否则（换了列表、列表变短或目标变小）从头搜索。
+        
+        Args:
+            data: 要搜索的有序数据列表
+            target: 要搜索的目标元素
+            
+        Returns:
+            搜索的起始下界
+        """
+        index = self._hint_index
+        if data is self._hint_data and index < len(data) and data[index] < target:
+            return index + 1
+        return 0
+    
+    def clear_cache(self):
+        """清空 search_cached 缓存的数据与结果，以及 monotonic_hint 记住的位置"""
+        self._memo.clear()
+        self._memo_data = None
+        self._memo_len = 0
+        self._hint_data = None
+        self._hint_index = 0
+    
+    def _search_compiled(self, data: np.ndarray, target: Any) -> Optional[int]:
+        """数值 ndarray 上的二分搜索，由编译内核完成，不逐步记录比较过程
+        
+        Args:
+            data: 有序的一维数值数组
+            target: 要搜索的目标数值
+            
+        Returns:
+            目标元素第一次出现的位置，如果未找到返回None
+        """
+        position = _search_kernel(data, target)
+        # 内核先折半到不超过 _LINEAR_TAIL 个元素，再顺序比较窗口内全部元素，最后做一次相等比较
+        n = len(data)
+        comparisons = 0
+        while n > _LINEAR_TAIL:
+            n -= n >> 1
+            comparisons += 1
+        self.operation_count = self.comparison_count = comparisons + n + 1 if n else 0
+        
+        if position < 0:
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"未找到目标元素 {target}")
+            if self.record_steps:
+                self._step_records.append((_STEP_NOT_FOUND, self.comparison_count, target))
+            return None
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"找到目标元素 {target} 在位置 {position}")
+        if self.record_steps:
+            self._step_records.append((_STEP_FOUND, self.comparison_count, position, target))
+        return position
+    
+    def _flush_step_records(self):
+        """把紧凑的步骤记录展开为字典步骤，追加到执行步骤中（调用方需已持有锁）"""
+        records = self._step_records
+        if not records:
+            return
+        steps = self.execution_steps
+        step_index = self.current_step
+        swaps = self.swap_count
+        for code, comparisons, *values in records:
+            step_type, fields = _STEP_LAYOUTS[code]
+            description = {'type': step_type}
+            description.update(zip(fields, values))
+            steps.append(Step(step_index, description, None, comparisons, swaps))
+            step_index += 1
+        self.current_step = step_index
+        self._materialized_steps = None
+        records.clear()
+    
+    def _materialize_steps(self) -> Tuple[Step, ...]:
+        """先展开尚未展开的步骤记录，再按基类回放（调用方需已持有锁）"""
+        self._flush_step_records()
+        return super()._materialize_steps()
+    
+    def step_count(self) -> int:
+        """获取已记录的执行步骤数量（包括尚未展开的记录）"""
+        return len(self.execution_steps) + len(self._step_records)
+    
+    def _reset_stats(self):
+        """重置性能统计（调用方需已持有锁）"""
+        super()._reset_stats()
+        self._step_records.clear()
+    
     def search_first_occurrence(self, data: List[Any], target: Any) -> Optional[int]:
         """搜索目标元素的第一次出现位置
         
@@ -100,56 +403,45 @@ class BinarySearch(AlgorithmBase):
             目标元素第一次出现的位置，如果未找到返回None
         """
         try:
-            self.logger.info(f"开始二分搜索第一次出现位置，目标元素: {target}")
+            if not self.record_steps:
+                return self._search_bisect(data, target)
+            
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"开始二分搜索第一次出现位置，目标元素: {target}")
             self.operation_count = 0
             self.comparison_count = 0
             
+            # 比较次数先在局部变量中累计，结束时一次性写回
+            comparisons = 0
+            record = self._step_records.append
             left, right = 0, len(data) - 1
             result = None
             
             while left <= right:
-                mid = (left + right) // 2
-                self.comparison_count += 1
-                self.operation_count += 1
+                mid = (left + right) >> 1
+                value = data[mid]
+                comparisons += 1
                 
                 # 记录搜索步骤
-                self.add_step({
-                    'type': 'compare',
-                    'left': left,
-                    'right': right,
-                    'mid': mid,
-                    'current_element': data[mid],
-                    'target': target
-                })
+                record((_STEP_COMPARE, comparisons, left, right, mid, value, target))
                 
-                if data[mid] == target:
+                if value == target:
                     result = mid
                     right = mid - 1  # 继续向左搜索
-                    self.add_step({
-                        'type': 'found_continue_left',
-                        'position': mid,
-                        'new_left': left,
-                        'new_right': right
-                    })
-                elif data[mid] < target:
+                    record((_STEP_FOUND_CONTINUE_LEFT, comparisons, mid, left, right))
+                elif value < target:
                     left = mid + 1
-                    self.add_step({
-                        'type': 'move_right',
-                        'new_left': left,
-                        'new_right': right
-                    })
+                    record((_STEP_MOVE_RIGHT, comparisons, left, right))
                 else:
                     right = mid - 1
-                    self.add_step({
-                        'type': 'move_left',
-                        'new_left': left,
-                        'new_right': right
-                    })
+                    record((_STEP_MOVE_LEFT, comparisons, left, right))
             
-            if result is not None:
-                self.logger.info(f"找到目标元素 {target} 第一次出现在位置 {result}")
-            else:
-                self.logger.info(f"未找到目标元素 {target}")
+            self.operation_count = self.comparison_count = comparisons
+            if self.logger.isEnabledFor(logging.INFO):
+                if result is not None:
+                    self.logger.info(f"找到目标元素 {target} 第一次出现在位置 {result}")
+                else:
+                    self.logger.info(f"未找到目标元素 {target}")
             
             return result
             
@@ -168,56 +460,45 @@ class BinarySearch(AlgorithmBase):
             目标元素最后一次出现的位置，如果未找到返回None
         """
         try:
-            self.logger.info(f"开始二分搜索最后一次出现位置，目标元素: {target}")
+            if not self.record_steps:
+                return self._search_bisect(data, target, last=True)
+            
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"开始二分搜索最后一次出现位置，目标元素: {target}")
             self.operation_count = 0
             self.comparison_count = 0
             
+            # 比较次数先在局部变量中累计，结束时一次性写回
+            comparisons = 0
+            record = self._step_records.append
             left, right = 0, len(data) - 1
             result = None
             
             while left <= right:
-                mid = (left + right) // 2
-                self.comparison_count += 1
-                self.operation_count += 1
+                mid = (left + right) >> 1
+                value = data[mid]
+                comparisons += 1
                 
                 # 记录搜索步骤
-                self.add_step({
-                    'type': 'compare',
-                    'left': left,
-                    'right': right,
-                    'mid': mid,
-                    'current_element': data[mid],
-                    'target': target
-                })
+                record((_STEP_COMPARE, comparisons, left, right, mid, value, target))
                 
-                if data[mid] == target:
+                if value == target:
                     result = mid
                     left = mid + 1  # 继续向右搜索
-                    self.add_step({
-                        'type': 'found_continue_right',
-                        'position': mid,
-                        'new_left': left,
-                        'new_right': right
-                    })
-                elif data[mid] < target:
+                    record((_STEP_FOUND_CONTINUE_RIGHT, comparisons, mid, left, right))
+                elif value < target:
                     left = mid + 1
-                    self.add_step({
-                        'type': 'move_right',
-                        'new_left': left,
-                        'new_right': right
-                    })
+                    record((_STEP_MOVE_RIGHT, comparisons, left, right))
                 else:
                     right = mid - 1
-                    self.add_step({
-                        'type': 'move_left',
-                        'new_left': left,
-                        'new_right': right
-                    })
+                    record((_STEP_MOVE_LEFT, comparisons, left, right))
             
-            if result is not None:
-                self.logger.info(f"找到目标元素 {target} 最后一次出现在位置 {result}")
-            else:
-                self.logger.info(f"未找到目标元素 {target}")
+            self.operation_count = self.comparison_count = comparisons
+            if self.logger.isEnabledFor(logging.INFO):
+                if result is not None:
+                    self.logger.info(f"找到目标元素 {target} 最后一次出现在位置 {result}")
+                else:
+                    self.logger.info(f"未找到目标元素 {target}")
             
             return result
             
@@ -225,6 +506,89 @@ class BinarySearch(AlgorithmBase):
             self.logger.error(f"二分搜索最后一次出现位置失败: {e}")
             return None
     
+    def search_many(self, data: Any, targets: Any) -> np.ndarray:
+        """批量二分搜索
+        
+        数据只转换一次为 ndarray，所有目标由 np.searchsorted 在C中一次完成查找，
+        免去逐个目标调用 search 的解释器开销。目标会先排序再查找，结果按原顺序返回，
+        目标很多、数组很大时明显更快。
+        
+        Args:
+            data: 要搜索的有序数据（列表或一维 ndarray）
+            targets: 要搜索的目标元素序列
+            
+        Returns:
+            与 targets 等长的下标数组，每项为目标第一次出现的位置，未找到为 -1
+        """
+        arr = np.asarray(data)
+        targets = np.asarray(targets)
+        self.operation_count = targets.size
+        # 每个目标的比较次数不超过 ⌊log2 n⌋ + 1
+        self.comparison_count = targets.size * arr.size.bit_length()
+        
+        if arr.size == 0:
+            return np.full(targets.shape, -1, dtype=np.intp)
+        
+        # 先把目标排序再查找：相邻目标落在相近位置，searchsorted 会以上一个结果
+        # 收窄下一次的搜索范围，访问的数组区域也连续，分支预测和缓存命中率都更高；
+        # 查完再按原顺序放回
+        flat = targets.ravel()
+        order = np.argsort(flat, kind='stable')
+        sorted_targets = flat[order]
+        idx = np.searchsorted(arr, sorted_targets)
+        found = (idx < arr.size) & (arr[np.minimum(idx, arr.size - 1)] == sorted_targets)
+        
+        positions = np.empty_like(idx)
+        positions[order] = np.where(found, idx, -1)
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"批量二分搜索 {targets.size} 个目标，找到 {int(found.sum())} 个")
+        return positions.reshape(targets.shape)
+    
+    def build_eytzinger(self, data: Any) -> np.ndarray:
+        """把有序数据重排为 Eytzinger（BFS 层序）布局，供 search_eytzinger 使用
+        
+        下标 k 的左右子节点位于 2k、2k+1，数组的中序遍历即原有序序列。
+        标准布局上二分搜索每轮跳到相距很远的位置，大数组上几乎每轮都缓存未命中；
+        Eytzinger 布局把树的前几层放在数组开头，访问模式也便于硬件预取。
+        重排只需做一次，适合同一份数据被大量查询的场景。
+        
+        Args:
+            data: 要搜索的有序数据（列表或一维 ndarray）
+            
+        Returns:
+            长度为 n + 1 的数组，下标 0 为占位，元素位于 1..n
+        """
+        arr = np.asarray(data)
+        n = arr.size
+        eyt = np.empty(n + 1, dtype=arr.dtype)
+        if n:
+            eyt[_eytzinger_order(n)] = arr
+            eyt[0] = arr[0]
+        return eyt
+    
+    def search_eytzinger(self, eyt: np.ndarray, target: Any) -> Optional[int]:
+        """在 build_eytzinger 生成的布局上搜索
+        
+        不写日志、不记录步骤；数值数组在安装了 numba 时由编译内核完成。
+        
+        Args:
+            eyt: build_eytzinger 的返回值
+            target: 要搜索的目标元素
+            
+        Returns:
+            目标元素（有重复值时为第一次出现的那个）在 eyt 中的下标，如果未找到返回None
+        """
+        n = eyt.shape[0] - 1
+        # 每层比较一次，最后再做一次相等比较
+        self.operation_count = self.comparison_count = n.bit_length() + 1 if n else 0
+        
+        if eyt.dtype.kind in _NUMERIC_KINDS and isinstance(target, Number):
+            k = _eytzinger_kernel(eyt, target)
+        else:
+            k = _eytzinger_lower_bound(eyt, target)
+        return k if k and eyt[k] == target else None
+    
     def get_complexity(self) -> dict:
         """获取算法复杂度信息
         
@@ -248,7 +612,8 @@ class BinarySearch(AlgorithmBase):
             'complexity': 'O(log n)',
             'description': '高效的有序数组搜索算法',
             'best_for': '有序数组、大数据集',
-            'methods': ['search', 'search_first_occurrence', 'search_last_occurrence']
+            'methods': ['search', 'search_fast', 'search_cached', 'search_first_occurrence', 'search_last_occurrence', 'search_many',
+                        'search_eytzinger']
         }
     
     def execute(self, data: Any, **kwargs) -> Any:
@@ -257,11 +622,12 @@ class BinarySearch(AlgorithmBase):
         Args:
             data: 要搜索的有序数据列表
             **kwargs: 额外参数，包括：
-                - target: 要搜索的目标元素
-                - search_type: 搜索类型（'basic', 'first', 'last'）
+                - target: 要搜索的目标元素；为列表或 ndarray 时按批量搜索处理
+                - search_type: 搜索类型（'basic', 'first', 'last'），
+                  'basic' 使用不记录步骤的 search_fast
                 
         Returns:
-            搜索结果（位置或None）
+            搜索结果（位置或None；批量搜索时为下标数组，未找到为 -1）
         """
         if not isinstance(data, list):
             raise ValueError("输入数据必须是列表类型")
@@ -269,7 +635,11 @@ class BinarySearch(AlgorithmBase):
         target = kwargs.get('target')
         search_type = kwargs.get('search_type', 'basic')
         
-        if not target:
+        if isinstance(target, (list, np.ndarray)):
+            return self.search_many(data, target)
+        
+        # 0、False、空字符串都是合法的目标，只拒绝未提供的情况
+        if target is None:
             raise ValueError("必须提供target参数")
         
         if search_type == 'first':
@@ -277,4 +647,4 @@ class BinarySearch(AlgorithmBase):
         elif search_type == 'last':
             return self.search_last_occurrence(data, target)
         else:
-            return self.search(data, target) 
\ No newline at end of file
+            return self.search_fast(data, target) 
\ No newline at end of file
@@ -6,6 +6,8 @@
 时间复杂度：O(log n)，空间复杂度：O(1)
 """
 
+import functools
+import logging
 from typing import Any, List, Optional
 from core.algorithm_base import AlgorithmBase, AlgorithmType
 
@@ -20,9 +22,15 @@ class ExponentialSearch(AlgorithmBase):
     - 结合了线性搜索和二分搜索
     """
     
-    def __init__(self):
-        """初始化指数搜索算法"""
+    def __init__(self, record_steps: bool = True):
+        """初始化指数搜索算法
+        
+        Args:
+            record_steps: 是否逐步记录搜索过程（供可视化、演示使用）；
+                大量重复调用而不读取步骤时设为 False，不再为每一步创建记录
+        """
         super().__init__("ExponentialSearch", AlgorithmType.SEARCHING)
+        self.record_steps = record_steps
     
     def search(self, data: List[Any], target: Any) -> Optional[int]:
         """执行指数搜索
@@ -35,7 +43,8 @@ class ExponentialSearch(AlgorithmBase):
             目标元素的位置，如果未找到返回None
         """
         try:
-            self.logger.info(f"开始指数搜索，目标元素: {target}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"开始指数搜索，目标元素: {target}")
             self.operation_count = 0
             self.comparison_count = 0
             
@@ -46,31 +55,38 @@ class ExponentialSearch(AlgorithmBase):
             
             # 如果目标元素是第一个元素
             if data[0] == target:
-                self.logger.info(f"找到目标元素 {target} 在位置 0")
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(f"找到目标元素 {target} 在位置 0")
                 return 0
             
-            # 找到目标元素可能存在的范围
-            i = 1
-            while i < n and data[i] <= target:
+            # 找到目标元素可能存在的范围：倍增时同时维护下界 lo（data[lo] < target，
+            # lo 为 0 时 data[0] 已确认不等于 target）和下一个探测位置 hi
+            lo, hi = 0, 1
+            while hi < n:
+                value = data[hi]
                 self.comparison_count += 1
                 self.operation_count += 1
+                if not value < target:
+                    break
                 
                 # 记录指数增长步骤
-                self.add_step({
-                    'type': 'exponential_growth',
-                    'index': i,
-                    'current_element': data[i],
-                    'target': target,
-                    'range_size': i
-                })
+                if self.record_steps:
+                    self.add_step({
+                        'type': 'exponential_growth',
+                        'index': hi,
+                        'current_element': value,
+                        'target': target,
+                        'range_size': hi
+                    })
                 
-                i = i * 2
+                lo, hi = hi, hi << 1
             
-            # 在找到的范围内进行二分搜索
-            left = i // 2
-            right = min(i, n - 1)
+            # 在找到的范围内进行二分搜索；lo 处已确认不是目标，从它的下一个位置开始
+            left = lo + 1
+            right = min(hi, n - 1)
             
-            self.logger.info(f"在范围 [{left}, {right}] 内进行二分搜索")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"在范围 [{left}, {right}] 内进行二分搜索")
             
             return self._binary_search_range(data, target, left, right)
             
@@ -92,48 +108,56 @@ class ExponentialSearch(AlgorithmBase):
         """
         try:
             while left <= right:
-                mid = (left + right) // 2
+                mid = (left + right) >> 1
+                value = data[mid]
                 self.comparison_count += 1
                 self.operation_count += 1
                 
                 # 记录二分搜索步骤
-                self.add_step({
-                    'type': 'binary_search',
-                    'left': left,
-                    'right': right,
-                    'mid': mid,
-                    'current_element': data[mid],
-                    'target': target
-                })
-                
-                if data[mid] == target:
-                    self.logger.info(f"找到目标元素 {target} 在位置 {mid}")
+                if self.record_steps:
                     self.add_step({
-                        'type': 'found',
-                        'position': mid,
-                        'element': target
+                        'type': 'binary_search',
+                        'left': left,
+                        'right': right,
+                        'mid': mid,
+                        'current_element': value,
+                        'target': target
                     })
+                
+                if value == target:
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info(f"找到目标元素 {target} 在位置 {mid}")
+                    if self.record_steps:
+                        self.add_step({
+                            'type': 'found',
+                            'position': mid,
+                            'element': target
+                        })
                     return mid
-                elif data[mid] < target:
+                elif value < target:
                     left = mid + 1
-                    self.add_step({
-                        'type': 'move_right',
-                        'new_left': left,
-                        'new_right': right
-                    })
+                    if self.record_steps:
+                        self.add_step({
+                            'type': 'move_right',
+                            'new_left': left,
+                            'new_right': right
+                        })
                 else:
                     right = mid - 1
-                    self.add_step({
-                        'type': 'move_left',
-                        'new_left': left,
-                        'new_right': right
-                    })
+                    if self.record_steps:
+                        self.add_step({
+                            'type': 'move_left',
+                            'new_left': left,
+                            'new_right': right
+                        })
             
-            self.logger.info(f"未找到目标元素 {target}")
-            self.add_step({
-                'type': 'not_found',
-                'target': target
-            })
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"未找到目标元素 {target}")
+            if self.record_steps:
+                self.add_step({
+                    'type': 'not_found',
+                    'target': target
+                })
             return None
             
         except Exception as e:
@@ -152,15 +176,21 @@ class ExponentialSearch(AlgorithmBase):
             目标元素的位置，如果未找到返回None
         """
         try:
-            self.logger.info(f"开始无界指数搜索，目标元素: {target}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"开始无界指数搜索，目标元素: {target}")
             self.operation_count = 0
             self.comparison_count = 0
             
+            # 指数增长和二分搜索两个阶段会访问相同的下标（如增长阶段停下的位置），
+            # 数据生成器可能很昂贵（如读取文件或网络），同一下标只调用一次
+            data_generator = functools.lru_cache(maxsize=None)(data_generator)
+            
             # 检查第一个元素
             try:
                 first_element = data_generator(0)
                 if first_element == target:
-                    self.logger.info(f"找到目标元素 {target} 在位置 0")
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info(f"找到目标元素 {target} 在位置 0")
                     return 0
             except (IndexError, StopIteration):
                 self.logger.info("数据生成器为空")
@@ -169,6 +199,7 @@ class ExponentialSearch(AlgorithmBase):
             # 指数增长阶段
             i = 1
             iteration_count = 0
+            out_of_range = False
             
             while iteration_count < max_iterations:
                 try:
@@ -177,13 +208,14 @@ class ExponentialSearch(AlgorithmBase):
                     self.operation_count += 1
                     
                     # 记录指数增长步骤
-                    self.add_step({
-                        'type': 'unbounded_growth',
-                        'index': i,
-                        'current_element': current_element,
-                        'target': target,
-                        'range_size': i
-                    })
+                    if self.record_steps:
+                        self.add_step({
+                            'type': 'unbounded_growth',
+                            'index': i,
+                            'current_element': current_element,
+                            'target': target,
+                            'range_size': i
+                        })
                     
                     if current_element >= target:
                         break
@@ -193,13 +225,15 @@ class ExponentialSearch(AlgorithmBase):
                     
                 except (IndexError, StopIteration):
                     # 到达数据末尾
+                    out_of_range = True
                     break
             
-            # 在找到的范围内进行二分搜索
-            left = i // 2
-            right = i
+            # 在找到的范围内进行二分搜索；i 已确认越界时不必再访问它
+            left = i >> 1
+            right = i - 1 if out_of_range else i
             
-            self.logger.info(f"在范围 [{left}, {right}] 内进行二分搜索")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"在范围 [{left}, {right}] 内进行二分搜索")
             
             return self._binary_search_unbounded(data_generator, target, left, right)
             
@@ -221,7 +255,7 @@ class ExponentialSearch(AlgorithmBase):
         """
         try:
             while left <= right:
-                mid = (left + right) // 2
+                mid = (left + right) >> 1
                 
                 try:
                     current_element = data_generator(mid)
@@ -229,52 +263,60 @@ class ExponentialSearch(AlgorithmBase):
                     self.operation_count += 1
                     
                     # 记录二分搜索步骤
-                    self.add_step({
-                        'type': 'unbounded_binary_search',
-                        'left': left,
-                        'right': right,
-                        'mid': mid,
-                        'current_element': current_element,
-                        'target': target
-                    })
-                    
-                    if current_element == target:
-                        self.logger.info(f"找到目标元素 {target} 在位置 {mid}")
+                    if self.record_steps:
                         self.add_step({
-                            'type': 'found',
-                            'position': mid,
-                            'element': target
+                            'type': 'unbounded_binary_search',
+                            'left': left,
+                            'right': right,
+                            'mid': mid,
+                            'current_element': current_element,
+                            'target': target
                         })
+                    
+                    if current_element == target:
+                        if self.logger.isEnabledFor(logging.INFO):
+                            self.logger.info(f"找到目标元素 {target} 在位置 {mid}")
+                        if self.record_steps:
+                            self.add_step({
+                                'type': 'found',
+                                'position': mid,
+                                'element': target
+                            })
                         return mid
                     elif current_element < target:
                         left = mid + 1
-                        self.add_step({
-                            'type': 'move_right',
-                            'new_left': left,
-                            'new_right': right
-                        })
+                        if self.record_steps:
+                            self.add_step({
+                                'type': 'move_right',
+                                'new_left': left,
+                                'new_right': right
+                            })
                     else:
                         right = mid - 1
-                        self.add_step({
-                            'type': 'move_left',
-                            'new_left': left,
-                            'new_right': right
-                        })
+                        if self.record_steps:
+                            self.add_step({
+                                'type': 'move_left',
+                                'new_left': left,
+                                'new_right': right
+                            })
                         
                 except (IndexError, StopIteration):
                     # 超出数据范围，向左搜索
                     right = mid - 1
-                    self.add_step({
-                        'type': 'out_of_bounds',
-                        'new_left': left,
-                        'new_right': right
-                    })
+                    if self.record_steps:
+                        self.add_step({
+                            'type': 'out_of_bounds',
+                            'new_left': left,
+                            'new_right': right
+                        })
             
-            self.logger.info(f"未找到目标元素 {target}")
-            self.add_step({
-                'type': 'not_found',
-                'target': target
-            })
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"未找到目标元素 {target}")
+            if self.record_steps:
+                self.add_step({
+                    'type': 'not_found',
+                    'target': target
+                })
             return None
             
         except Exception as e:
@@ -5,6 +5,7 @@
 这些算法用于遍历图结构，寻找路径或连通分量。
 """
 
+from collections import deque
 from typing import Any, List, Optional, Set, Dict, Tuple
 from core.algorithm_base import AlgorithmBase, AlgorithmType
 from data_structures.graph import Graph
@@ -243,11 +244,11 @@ class BreadthFirstSearch(AlgorithmBase):
             
             visited = set()
             result = []
-            queue = [start_vertex]
+            queue = deque([start_vertex])
             visited.add(start_vertex)
             
             while queue:
-                vertex = queue.pop(0)
+                vertex = queue.popleft()
                 result.append(vertex)
                 self.operation_count += 1
                 
@@ -309,11 +310,11 @@ class BreadthFirstSearch(AlgorithmBase):
             
             visited = set()
             parent = {}
-            queue = [(start_vertex, 0)]  # (vertex, distance)
+            queue = deque([(start_vertex, 0)])  # (vertex, distance)
             visited.add(start_vertex)
             
             while queue:
-                vertex, distance = queue.pop(0)
+                vertex, distance = queue.popleft()
                 self.operation_count += 1
                 
                 # 记录搜索步骤
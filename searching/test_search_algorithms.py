@@ -9,6 +9,8 @@ import random
 import time
 from typing import List, Any
 
+import numpy as np
+
 from linear_search import LinearSearch
 from binary_search import BinarySearch
 from jump_search import JumpSearch
@@ -98,6 +100,134 @@ class TestSearchAlgorithms(unittest.TestCase):
         
         # 验证第一次位置 <= 最后一次位置
         self.assertLessEqual(first_pos, last_pos)
+        
+        # 测试快速路径与 execute
+        self.assertEqual(binary_search.search_fast(self.sorted_data, self.target), first_pos)
+        self.assertIsNone(binary_search.search_fast(self.sorted_data, 999))
+        self.assertEqual(binary_search.execute(self.sorted_data, target=self.target), first_pos)
+        self.assertEqual(binary_search.execute([0, 1, 2], target=0), 0)
+        
+        # execute 不使用缓存：原地修改列表后结果随之变化
+        data = list(range(0, 100, 2))
+        self.assertEqual(binary_search.execute(data, target=40), 20)
+        data[20] = 41
+        self.assertIsNone(binary_search.execute(data, target=40))
+        self.assertGreater(binary_search.comparison_count, 0)
+        
+        # search_cached：重复查询结果一致，列表长度变化或清空缓存后重新计算
+        data = [1, 3, 5]
+        self.assertEqual(binary_search.search_cached(data, 5), 2)
+        self.assertEqual(binary_search.search_cached(data, 5), 2)
+        self.assertGreater(binary_search.comparison_count, 0)
+        data.insert(0, 0)
+        self.assertEqual(binary_search.search_cached(data, 5), 3)
+        data[3] = 6
+        binary_search.clear_cache()
+        self.assertIsNone(binary_search.search_cached(data, 5))
+        
+        # 升序查询同一列表时从上一次找到的位置之后开始，目标变小时从头搜索
+        data = list(range(0, 200, 2))
+        for target in (10, 40, 41, 120, 198, 4):
+            expected = data.index(target) if target in data else None
+            self.assertEqual(binary_search.search(data, target, monotonic_hint=True), expected)
+        
+        # 测试有序数值 ndarray
+        sorted_array = np.array(self.sorted_data)
+        result = binary_search.search(sorted_array, self.target)
+        self.assertIsNotNone(result)
+        self.assertEqual(sorted_array[result], self.target)
+        self.assertIsNone(binary_search.search(sorted_array, 999))
+        
+        # 有重复元素时结果与容器类型无关，都是第一次出现的位置
+        runs = [0] + [5] * 1000 + [9]
+        self.assertEqual(binary_search.search(runs, 5), 1)
+        self.assertEqual(binary_search.search(np.array(runs), 5), 1)
+        self.assertEqual(binary_search.search(np.array(runs, dtype=np.float64), 9), 1001)
+        
+        # 不记录步骤时由 bisect 完成；有重复元素时两条路径都返回第一次出现的位置
+        quiet_search = BinarySearch(record_steps=False)
+        duplicated = [1, 2, 2, 2, 3]
+        self.assertEqual(quiet_search.search(duplicated, 2), 1)
+        self.assertEqual(binary_search.search(duplicated, 2), 1)
+        for runs in ([2] * 9, [1] + [2] * 20 + [3], [0, 0, 1, 1, 1, 1, 1, 1, 2]):
+            for target in set(runs):
+                first = runs.index(target)
+                self.assertEqual(quiet_search.search(runs, target), first)
+                self.assertEqual(binary_search.search(runs, target), first)
+        self.assertEqual(quiet_search.search_first_occurrence(duplicated, 2), 1)
+        self.assertEqual(quiet_search.search_last_occurrence(duplicated, 2), 3)
+        self.assertIsNone(quiet_search.search(duplicated, 0))
+        self.assertIsNone(quiet_search.search_last_occurrence(duplicated, 0))
+        self.assertIsNone(quiet_search.search_first_occurrence(duplicated, 4))
+        self.assertEqual(len(quiet_search.get_execution_steps()), 0)
+        
+        # 步骤先以紧凑记录保存，读取时展开为字典
+        binary_search.reset_stats()
+        binary_search.search([1, 3, 5], 5)
+        self.assertEqual(binary_search.step_count(), 4)
+        steps = binary_search.get_execution_steps()
+        self.assertEqual([step['description']['type'] for step in steps],
+                         ['compare', 'move_right', 'compare', 'found'])
+        self.assertEqual(steps[0]['description']['current_element'], 3)
+    
+    def test_binary_search_many(self):
+        """测试批量二分搜索"""
+        binary_search = BinarySearch()
+        targets = [self.target, 999, self.sorted_data[0], 0, self.sorted_data[-1]]
+        
+        result = binary_search.search_many(self.sorted_data, targets)
+        self.assertEqual(len(result), len(targets))
+        for target, position in zip(targets, result):
+            if target in self.sorted_data:
+                self.assertEqual(position, self.sorted_data.index(target))
+            else:
+                self.assertEqual(position, -1)
+        
+        # 重复查询同一列表时结果一致
+        again = binary_search.search_many(self.sorted_data, targets)
+        self.assertEqual(list(again), list(result))
+        
+        # execute 传入列表目标时走批量搜索
+        result = binary_search.execute(self.sorted_data, target=targets)
+        self.assertEqual(list(result), list(again))
+        
+        # 原地修改列表后再次查询，结果反映修改后的内容
+        data = [1, 3, 5, 7]
+        self.assertEqual(list(binary_search.execute(data, target=[3, 5])), [1, 2])
+        data[1] = 4
+        self.assertEqual(list(binary_search.execute(data, target=[3, 4])), [-1, 1])
+        data.append(9)
+        self.assertEqual(list(binary_search.search_many(data, [9, 1])), [4, 0])
+        
+        # 多维目标保持原形状
+        grid = binary_search.search_many([1, 2, 3], [[3, 5], [1, 2]])
+        self.assertEqual(grid.tolist(), [[2, -1], [0, 1]])
+        
+        # 空数据
+        self.assertEqual(list(binary_search.search_many([], [1, 2])), [-1, -1])
+    
+    def test_binary_search_eytzinger(self):
+        """测试 Eytzinger 布局上的二分搜索"""
+        binary_search = BinarySearch()
+        data = [1, 2, 2, 4, 7, 7, 7, 9, 12, 15]
+        eyt = binary_search.build_eytzinger(data)
+        self.assertEqual(len(eyt), len(data) + 1)
+        
+        for target in range(0, 17):
+            position = binary_search.search_eytzinger(eyt, target)
+            if target in data:
+                self.assertIsNotNone(position)
+                self.assertEqual(eyt[position], target)
+            else:
+                self.assertIsNone(position)
+        
+        # 非数值数据走 Python 实现
+        words = binary_search.build_eytzinger(['apple', 'banana', 'cherry'])
+        self.assertEqual(words[binary_search.search_eytzinger(words, 'banana')], 'banana')
+        self.assertIsNone(binary_search.search_eytzinger(words, 'durian'))
+        
+        # 空数据
+        self.assertIsNone(binary_search.search_eytzinger(binary_search.build_eytzinger([]), 1))
     
     def test_jump_search(self):
         """测试跳跃搜索"""
@@ -176,6 +306,26 @@ class TestSearchAlgorithms(unittest.TestCase):
         unbounded_result = exponential_search.search_unbounded(data_generator, self.target)
         self.assertIsNotNone(unbounded_result)
         self.assertEqual(self.sorted_data[unbounded_result], self.target)
+        
+        # 同一下标只调用一次数据生成器
+        requested = []
+        
+        def counting_generator(index):
+            requested.append(index)
+            return data_generator(index)
+        
+        for target in (self.target, self.sorted_data[-1], 999):
+            requested.clear()
+            exponential_search.search_unbounded(counting_generator, target)
+            self.assertEqual(len(requested), len(set(requested)))
+        
+        # 不记录步骤时结果不变，也不保留任何步骤
+        quiet_search = ExponentialSearch(record_steps=False)
+        result = quiet_search.search(self.sorted_data, self.target)
+        self.assertEqual(self.sorted_data[result], self.target)
+        result = quiet_search.search_unbounded(data_generator, self.target)
+        self.assertEqual(self.sorted_data[result], self.target)
+        self.assertEqual(quiet_search.step_count(), 0)
     
     def test_depth_first_search(self):
         """测试深度优先搜索"""
@@ -21,6 +21,9 @@ class BubbleSort(AlgorithmBase):
     空间复杂度：O(1)
     """
     
+    # 只使用基类声明的属性，不再需要 __dict__
+    __slots__ = ()
+    
     def __init__(self):
         """初始化冒泡排序算法"""
         super().__init__("冒泡排序", AlgorithmType.SORTING)
@@ -49,7 +52,7 @@ class BubbleSort(AlgorithmBase):
         arr = copy.deepcopy(data)
         n = len(arr)
         
-        self.add_step("开始冒泡排序", arr.copy())
+        self.add_step("开始冒泡排序", arr, snapshot=True)
         
         # 外层循环控制排序轮数
         for i in range(n):
@@ -65,16 +68,17 @@ class BubbleSort(AlgorithmBase):
                     self.swap_count += 1
                     swapped = True
                     
-                    self.add_step(f"交换元素 arr[{j}]={arr[j+1]} 和 arr[{j+1}]={arr[j]}", arr.copy())
+                    self.add_step(f"交换元素 arr[{j}]={arr[j+1]} 和 arr[{j+1}]={arr[j]}",
+                                  indices_changed=(j, j + 1), new_values=(arr[j], arr[j + 1]))
             
             # 如果没有发生交换，说明已经排序完成
             if not swapped:
-                self.add_step("数组已排序完成，提前结束", arr.copy())
+                self.add_step("数组已排序完成，提前结束", indices_changed=())
                 break
             
-            self.add_step(f"第 {i+1} 轮排序完成", arr.copy())
+            self.add_step(f"第 {i+1} 轮排序完成", indices_changed=())
         
-        self.add_step("冒泡排序完成", arr.copy())
+        self.add_step("冒泡排序完成", indices_changed=())
         return arr
 
 class SelectionSort(AlgorithmBase):
@@ -93,6 +97,9 @@ class SelectionSort(AlgorithmBase):
     空间复杂度：O(1)
     """
     
+    # 只使用基类声明的属性，不再需要 __dict__
+    __slots__ = ()
+    
     def __init__(self):
         """初始化选择排序算法"""
         super().__init__("选择排序", AlgorithmType.SORTING)
@@ -121,7 +128,7 @@ class SelectionSort(AlgorithmBase):
         arr = copy.deepcopy(data)
         n = len(arr)
         
-        self.add_step("开始选择排序", arr.copy())
+        self.add_step("开始选择排序", arr, snapshot=True)
         
         # 外层循环，每次选择最小的元素放到前面
         for i in range(n):
@@ -139,11 +146,12 @@ class SelectionSort(AlgorithmBase):
                 arr[i], arr[min_idx] = arr[min_idx], arr[i]
                 self.swap_count += 1
                 
-                self.add_step(f"将最小元素 arr[{min_idx}]={arr[i]} 放到位置 {i}", arr.copy())
+                self.add_step(f"将最小元素 arr[{min_idx}]={arr[i]} 放到位置 {i}",
+                              indices_changed=(i, min_idx), new_values=(arr[i], arr[min_idx]))
             else:
-                self.add_step(f"位置 {i} 的元素已经是未排序部分的最小值", arr.copy())
+                self.add_step(f"位置 {i} 的元素已经是未排序部分的最小值", indices_changed=())
         
-        self.add_step("选择排序完成", arr.copy())
+        self.add_step("选择排序完成", indices_changed=())
         return arr
 
 class InsertionSort(AlgorithmBase):
@@ -160,6 +168,9 @@ class InsertionSort(AlgorithmBase):
     空间复杂度：O(1)
     """
     
+    # 只使用基类声明的属性，不再需要 __dict__
+    __slots__ = ()
+    
     def __init__(self):
         """初始化插入排序算法"""
         super().__init__("插入排序", AlgorithmType.SORTING)
@@ -188,14 +199,14 @@ class InsertionSort(AlgorithmBase):
         arr = copy.deepcopy(data)
         n = len(arr)
         
-        self.add_step("开始插入排序", arr.copy())
+        self.add_step("开始插入排序", arr, snapshot=True)
         
         # 从第二个元素开始，逐个插入到已排序序列中
         for i in range(1, n):
             key = arr[i]
             j = i - 1
             
-            self.add_step(f"准备插入元素 arr[{i}]={key}", arr.copy())
+            self.add_step(f"准备插入元素 arr[{i}]={key}", indices_changed=())
             
             # 将比key大的元素都向后移动一位
             while j >= 0:
@@ -206,13 +217,14 @@ class InsertionSort(AlgorithmBase):
                     self.swap_count += 1
                     j -= 1
                     
-                    self.add_step(f"将 arr[{j+1}] 向后移动", arr.copy())
+                    self.add_step(f"将 arr[{j+1}] 向后移动",
+                                  indices_changed=(j + 2,), new_values=(arr[j + 2],))
                 else:
                     break
             
             # 将key插入到正确位置
             arr[j + 1] = key
-            self.add_step(f"将 {key} 插入到位置 {j+1}", arr.copy())
+            self.add_step(f"将 {key} 插入到位置 {j+1}", indices_changed=(j + 1,), new_values=(key,))
         
-        self.add_step("插入排序完成", arr.copy())
+        self.add_step("插入排序完成", indices_changed=())
         return arr 
\ No newline at end of file
@@ -77,6 +77,13 @@ class Logger:
         if not self._handlers_initialized:
             self._setup_file_handler()
     
+    def isEnabledFor(self, level: int) -> bool:
+        """检查指定级别的日志是否会被处理
+        
+        热点路径可以先调用此方法，避免在日志被丢弃时仍然构造消息字符串。
+        """
+        return self.logger.isEnabledFor(level)
+    
     def debug(self, message: str):
         """记录调试信息"""
         self.logger.debug(message)